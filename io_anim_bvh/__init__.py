@@ -281,6 +281,18 @@ class ExportBVH(bpy.types.Operator, ExportHelper):
         description="Only write out translation channels for the root bone",
         default=False,
     )
+    batch_mode: EnumProperty(
+        name="Batch Mode",
+        description="Write several BVH files at once, named after the file name and each armature or action",
+        items=(
+            ('OFF', "Off", "Active armature to file"),
+            ('OBJECT', "Armatures",
+             "Each selected armature as a file, all evaluated in a single pass over the frames"),
+            ('ACTION', "Actions",
+             "Each action animating bones as a file, played by the active armature over the action's frame range"),
+        ),
+        default='OFF',
+    )
 
     @classmethod
     def poll(cls, context):
@@ -362,9 +374,12 @@ class BVH_PT_export_animation(bpy.types.Panel):
         operator = sfile.active_operator
 
         col = layout.column(align=True)
+        col.enabled = operator.batch_mode != 'ACTION'
         col.prop(operator, "frame_start", text="Frame Start")
         col.prop(operator, "frame_end", text="End")
 
+        layout.prop(operator, "batch_mode")
+
 
 def menu_func_import(self, context):
     self.layout.operator(ImportBVH.bl_idname, text="Motion Capture (.bvh)")
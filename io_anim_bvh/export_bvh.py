@@ -22,29 +22,31 @@
 # fixes from Andrea Rugliancich
 
 import bpy
+import numpy as np
 
+from .import_bvh import matrices_to_compatible_eulers
 
-def write_armature(
-        context,
-        filepath,
-        frame_start,
-        frame_end,
+# Number of frames which pose matrices are evaluated before being converted and written at once.
+MOTION_CHUNK_FRAMES = 1 << 10
+
+
+def write_hierarchy(
+        file,
+        obj,
         global_scale=1.0,
         rotate_mode='NATIVE',
         root_transform_only=False,
 ):
+    """
+    Write the HIERARCHY block of given armature object,
+    return the decorated bones in the order their channels are written in motion lines.
+    """
 
     def ensure_rot_order(rot_order_str):
         if set(rot_order_str) != {'X', 'Y', 'Z'}:
             rot_order_str = "XYZ"
         return rot_order_str
 
-    from mathutils import Matrix, Euler
-    from math import degrees
-
-    file = open(filepath, "w", encoding="utf8", newline="\n")
-
-    obj = context.object
     arm = obj.data
 
     # Build a dictionary of children.
@@ -148,6 +150,9 @@ def write_armature(
     # redefine bones as sorted by serialized_names
     # so we can write motion
 
+    # Index of pose bones in pose matrices arrays (foreach_get order).
+    pose_bone_indices = {pose_bone.name: i for i, pose_bone in enumerate(obj.pose.bones)}
+
     class DecoratedBone:
         __slots__ = (
             # Bone name, used as key in many places.
@@ -157,19 +162,16 @@ def write_armature(
             "rest_bone",
             # Blender pose bone.
             "pose_bone",
-            # Blender pose matrix.
-            "pose_mat",
-            # Blender rest matrix (armature space).
+            # Index of the pose bone in pose matrices arrays.
+            "pose_index",
+            # Blender rest matrix (armature space), a 4x4 array.
             "rest_arm_mat",
-            # Blender rest matrix (local space).
-            "rest_local_mat",
-            # Pose_mat inverted.
-            "pose_imat",
             # Rest_arm_mat inverted.
             "rest_arm_imat",
-            # Rest_local_mat inverted.
-            "rest_local_imat",
-            # Last used euler to preserve euler compatibility in between keyframes.
+            # Blender rest head location (armature space, and local space for root bones), arrays.
+            "rest_head_arm",
+            "rest_head_local",
+            # Last used euler to preserve euler compatibility in between keyframes (chunks of frames).
             "prev_euler",
             # Is the bone disconnected to the parent bone?
             "skip_position",
@@ -192,6 +194,7 @@ def write_armature(
             self.name = bone_name
             self.rest_bone = arm.bones[bone_name]
             self.pose_bone = obj.pose.bones[bone_name]
+            self.pose_index = pose_bone_indices[bone_name]
 
             if rotate_mode == "NATIVE":
                 self.rot_order_str = ensure_rot_order(self.pose_bone.rotation_mode)
@@ -201,25 +204,15 @@ def write_armature(
 
             self.rot_order = DecoratedBone._eul_order_lookup[self.rot_order_str]
 
-            self.pose_mat = self.pose_bone.matrix
-
-            # mat = self.rest_bone.matrix  # UNUSED
-            self.rest_arm_mat = self.rest_bone.matrix_local
-            self.rest_local_mat = self.rest_bone.matrix
-
-            # inverted mats
-            self.pose_imat = self.pose_mat.inverted()
-            self.rest_arm_imat = self.rest_arm_mat.inverted()
-            self.rest_local_imat = self.rest_local_mat.inverted()
+            self.rest_arm_mat = np.array(self.rest_bone.matrix_local)
+            self.rest_arm_imat = np.linalg.inv(self.rest_arm_mat)
+            self.rest_head_arm = np.array(self.rest_bone.head_local)
+            self.rest_head_local = np.array(self.rest_bone.head)
 
             self.parent = None
-            self.prev_euler = Euler((0.0, 0.0, 0.0), self.rot_order_str_reverse)
+            self.prev_euler = np.zeros(3)
             self.skip_position = ((self.rest_bone.use_connect or root_transform_only) and self.rest_bone.parent)
 
-        def update_posedata(self):
-            self.pose_mat = self.pose_bone.matrix
-            self.pose_imat = self.pose_mat.inverted()
-
         def __repr__(self):
             if self.parent:
                 return "[\"%s\" child on \"%s\"]\n" % (self.name, self.parent.name)
@@ -237,49 +230,122 @@ def write_armature(
     del bones_decorated_dict
     # finish assigning parents
 
-    scene = context.scene
-    frame_current = scene.frame_current
+    return bones_decorated
+
 
-    file.write("MOTION\n")
-    file.write("Frames: %d\n" % (frame_end - frame_start + 1))
-    file.write("Frame Time: %.6f\n" % (1.0 / (scene.render.fps / scene.render.fps_base)))
+def write_motion(file, bones_decorated, pose_mats, global_scale=1.0):
+    """
+    Write motion lines of given (frames, pose bones, 4, 4) pose matrices array.
+    """
+    channels = []
+    for dbone in bones_decorated:
+        pose_mat = pose_mats[:, dbone.pose_index]
+        head = dbone.rest_head_arm
+
+        if dbone.parent:
+            parent_pose_imat = np.linalg.inv(pose_mats[:, dbone.parent.pose_index])
+            mat_final = dbone.parent.rest_arm_mat @ parent_pose_imat @ pose_mat @ dbone.rest_arm_imat
+            loc_offset = head - dbone.parent.rest_head_arm
+        else:
+            mat_final = pose_mat @ dbone.rest_arm_imat
+            loc_offset = dbone.rest_head_local
 
-    for frame in range(frame_start, frame_end + 1):
-        scene.frame_set(frame)
+        # Same as (itrans @ mat_final @ trans).to_translation(), with trans the translation to head.
+        rot_mat = mat_final[:, :3, :3]
+        loc = rot_mat @ head + mat_final[:, :3, 3] - head + loc_offset
 
-        for dbone in bones_decorated:
-            dbone.update_posedata()
+        # keep eulers compatible, no jumping on interpolation.
+        rot_mat = rot_mat / np.linalg.norm(rot_mat, axis=1)[:, None, :]
+        rot = matrices_to_compatible_eulers(rot_mat, dbone.rot_order_str_reverse, dbone.prev_euler)
+        dbone.prev_euler = rot[-1]
 
-        for dbone in bones_decorated:
-            trans = Matrix.Translation(dbone.rest_bone.head_local)
-            itrans = Matrix.Translation(-dbone.rest_bone.head_local)
+        if not dbone.skip_position:
+            channels.append(loc * global_scale)
 
-            if dbone.parent:
-                mat_final = dbone.parent.rest_arm_mat @ dbone.parent.pose_imat @ dbone.pose_mat @ dbone.rest_arm_imat
-                mat_final = itrans @ mat_final @ trans
-                loc = mat_final.to_translation() + (dbone.rest_bone.head_local - dbone.parent.rest_bone.head_local)
-            else:
-                mat_final = dbone.pose_mat @ dbone.rest_arm_imat
-                mat_final = itrans @ mat_final @ trans
-                loc = mat_final.to_translation() + dbone.rest_bone.head
+        channels.append(np.degrees(rot[:, dbone.rot_order]))
+
+    fmt = "%.6f " * sum(channel.shape[1] for channel in channels) + "\n"
+    if channels:
+        motion = np.hstack(channels).tolist()
+    else:
+        motion = [()] * len(pose_mats)
+    file.write("".join([fmt % tuple(values) for values in motion]))
 
-            # keep eulers compatible, no jumping on interpolation.
-            rot = mat_final.to_euler(dbone.rot_order_str_reverse, dbone.prev_euler)
 
-            if not dbone.skip_position:
-                file.write("%.6f %.6f %.6f " % (loc * global_scale)[:])
+def write_armatures(
+        context,
+        exports,
+        frame_start,
+        frame_end,
+        global_scale=1.0,
+        rotate_mode='NATIVE',
+        root_transform_only=False,
+):
+    """
+    Write a BVH file for each (armature object, filepath) of exports,
+    evaluating the scene once per frame for all of them.
+    """
+    files = []
+    for obj, filepath in exports:
+        file = open(filepath, "w", encoding="utf8", newline="\n")
+        bones_decorated = write_hierarchy(
+            file, obj,
+            global_scale=global_scale,
+            rotate_mode=rotate_mode,
+            root_transform_only=root_transform_only,
+        )
+        files.append((file, obj.pose.bones, bones_decorated))
 
-            file.write("%.6f %.6f %.6f " % (degrees(rot[dbone.rot_order[0]]), degrees(rot[dbone.rot_order[1]]), degrees(rot[dbone.rot_order[2]])))
+    scene = context.scene
+    frame_current = scene.frame_current
 
-            dbone.prev_euler = rot
+    for file, _pose_bones, _bones_decorated in files:
+        file.write("MOTION\n")
+        file.write("Frames: %d\n" % (frame_end - frame_start + 1))
+        file.write("Frame Time: %.6f\n" % (1.0 / (scene.render.fps / scene.render.fps_base)))
 
-        file.write("\n")
+    for chunk_start in range(frame_start, frame_end + 1, MOTION_CHUNK_FRAMES):
+        frames = range(chunk_start, min(chunk_start + MOTION_CHUNK_FRAMES, frame_end + 1))
 
-    file.close()
+        # Pose matrices of all bones for each frame, as stored by Blender (column-major).
+        pose_mats = [np.empty((len(frames), len(pose_bones) * 16), dtype=np.float32)
+                     for _file, pose_bones, _bones_decorated in files]
+        for frame_i, frame in enumerate(frames):
+            scene.frame_set(frame)
+
+            for (_file, pose_bones, _bones_decorated), mats in zip(files, pose_mats):
+                pose_bones.foreach_get("matrix", mats[frame_i])
+
+        for (file, pose_bones, bones_decorated), mats in zip(files, pose_mats):
+            mats = mats.astype(np.float64).reshape(len(frames), len(pose_bones), 4, 4).transpose(0, 1, 3, 2)
+            write_motion(file, bones_decorated, mats, global_scale)
+
+    for file, _pose_bones, _bones_decorated in files:
+        file.close()
 
     scene.frame_set(frame_current)
 
-    print("BVH Exported: %s frames:%d\n" % (filepath, frame_end - frame_start + 1))
+    for _obj, filepath in exports:
+        print("BVH Exported: %s frames:%d\n" % (filepath, frame_end - frame_start + 1))
+
+
+def write_armature(
+        context,
+        filepath,
+        frame_start,
+        frame_end,
+        global_scale=1.0,
+        rotate_mode='NATIVE',
+        root_transform_only=False,
+):
+    write_armatures(
+        context, ((context.object, filepath),),
+        frame_start=frame_start,
+        frame_end=frame_end,
+        global_scale=global_scale,
+        rotate_mode=rotate_mode,
+        root_transform_only=root_transform_only,
+    )
 
 
 def save(
@@ -289,14 +355,70 @@ def save(
         global_scale=1.0,
         rotate_mode="NATIVE",
         root_transform_only=False,
+        batch_mode='OFF',
 ):
-    write_armature(
-        context, filepath,
-        frame_start=frame_start,
-        frame_end=frame_end,
+    kwargs = dict(
         global_scale=global_scale,
         rotate_mode=rotate_mode,
         root_transform_only=root_transform_only,
     )
 
+    if batch_mode == 'OFF':
+        write_armature(
+            context, filepath,
+            frame_start=frame_start,
+            frame_end=frame_end,
+            **kwargs,
+        )
+
+        return {'FINISHED'}
+
+    import os
+
+    # Batch files are named after each armature or action, prefixed with the given file name.
+    dirpath, prefix = os.path.split(filepath)
+    prefix = os.path.splitext(prefix)[0]
+
+    def batch_filepath(name):
+        name = "_".join((prefix, bpy.path.clean_name(name))) if prefix else bpy.path.clean_name(name)
+        return os.path.join(dirpath, name + ".bvh")
+
+    if batch_mode == 'OBJECT':
+        # All selected armatures at once, evaluating each frame a single time.
+        objects = [obj for obj in context.selected_objects if obj.type == 'ARMATURE']
+        if not objects:
+            objects = [context.object]
+        write_armatures(
+            context, [(obj, batch_filepath(obj.name)) for obj in objects],
+            frame_start=frame_start,
+            frame_end=frame_end,
+            **kwargs,
+        )
+
+    elif batch_mode == 'ACTION':
+        # Each action animating bones, assigned in turn to the active armature, over its own frame range.
+        obj = context.object
+        animation_data = obj.animation_data
+        if animation_data is None:
+            animation_data = obj.animation_data_create()
+        action_orig = animation_data.action
+
+        for action in bpy.data.actions:
+            if action.id_root != 'OBJECT':
+                continue
+            if not any(fcurve.data_path.startswith("pose.bones[") for fcurve in action.fcurves):
+                continue
+
+            animation_data.action = action
+            action_frame_start, action_frame_end = (int(round(frame)) for frame in action.frame_range)
+            write_armatures(
+                context, ((obj, batch_filepath(action.name)),),
+                frame_start=action_frame_start,
+                frame_end=action_frame_end,
+                **kwargs,
+            )
+
+        animation_data.action = action_orig
+        context.scene.frame_set(context.scene.frame_current)
+
     return {'FINISHED'}
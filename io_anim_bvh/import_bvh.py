@@ -20,10 +20,11 @@
 
 # Script copyright (C) Campbell Barton
 
-from math import radians, ceil
+from math import ceil
 
 import bpy
-from mathutils import Vector, Euler, Matrix
+import numpy as np
+from mathutils import Vector
 
 
 class BVH_Node:
@@ -51,7 +52,7 @@ class BVH_Node:
         'rot_order',
         # Same as above but a string 'XYZ' format..
         'rot_order_str',
-        # A list one tuple's one for each frame: (locx, locy, locz, rotx, roty, rotz),
+        # An array with a row for each frame: (locx, locy, locz, rotx, roty, rotz),
         # euler rotation ALWAYS stored xyz order, even when native used.
         'anim_data',
         # Convenience function, bool, same as: (channels[0] != -1 or channels[1] != -1 or channels[2] != -1).
@@ -92,9 +93,9 @@ class BVH_Node:
 
         self.children = []
 
-        # List of 6 length tuples: (lx, ly, lz, rx, ry, rz)
+        # Array of 6 length rows: (lx, ly, lz, rx, ry, rz)
         # even if the channels aren't used they will just be zero.
-        self.anim_data = [(0, 0, 0, 0, 0, 0)]
+        self.anim_data = np.zeros((1, 6))
 
     def __repr__(self):
         return (
@@ -112,6 +113,31 @@ def sorted_nodes(bvh_nodes):
     return bvh_nodes_list
 
 
+def read_bvh_motion(motion_lines, channels_count):
+    """
+    Return the motion data lines as a single (frames, channels) array.
+    """
+    import warnings
+
+    motion_lines = [line for line in motion_lines if line.strip()]
+    frames_count = len(motion_lines)
+    if not channels_count:
+        return np.zeros((frames_count, 0))
+
+    # Fast path, all values parsed at once (numpy stops with a warning on invalid data).
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        try:
+            motion = np.fromstring(" ".join(motion_lines), sep=" ")
+        except (ValueError, DeprecationWarning):
+            motion = None
+    if motion is not None and len(motion) == frames_count * channels_count:
+        return motion.reshape(frames_count, channels_count)
+
+    # Slow path, lines with extra values (ignored) or invalid ones (raising ValueError).
+    return np.array([line.split()[:channels_count] for line in motion_lines], dtype=np.float64)
+
+
 def read_bvh(context, file_path, rotate_mode='XYZ', global_scale=1.0):
     # File loading stuff
     # Open the file for importing
@@ -123,8 +149,25 @@ def read_bvh(context, file_path, rotate_mode='XYZ', global_scale=1.0):
     if len(file_lines) == 1:
         file_lines = file_lines[0].split('\r')
 
-    # Split by whitespace.
-    file_lines = [ll for ll in [l.split() for l in file_lines] if ll]
+    # Split by whitespace, up to the MOTION header (and its frames count & time lines),
+    # motion data lines are parsed at once afterwards.
+    motion_lines = []
+    header_lines = []
+    motion_header = -1
+    for lineIdx, line in enumerate(file_lines):
+        words = line.split()
+        if not words:
+            continue
+        header_lines.append(words)
+        if motion_header != -1:
+            motion_header += 1
+        elif len(words) == 1 and words[0].lower() == 'motion':
+            motion_header = 0
+        if motion_header == 2:
+            motion_lines = file_lines[lineIdx + 1:]
+            break
+    file_lines = header_lines
+    del header_lines
 
     # Create hierarchy as empties
     if file_lines[0][0].lower() == 'hierarchy':
@@ -274,31 +317,21 @@ def read_bvh(context, file_path, rotate_mode='XYZ', global_scale=1.0):
     # second life expects it, which isn't to spec.
     bvh_nodes_list = sorted_nodes(bvh_nodes)
 
-    while lineIdx < len(file_lines):
-        line = file_lines[lineIdx]
-        for bvh_node in bvh_nodes_list:
-            # for bvh_node in bvh_nodes_serial:
-            lx = ly = lz = rx = ry = rz = 0.0
-            channels = bvh_node.channels
-            anim_data = bvh_node.anim_data
-            if channels[0] != -1:
-                lx = global_scale * float(line[channels[0]])
-
-            if channels[1] != -1:
-                ly = global_scale * float(line[channels[1]])
-
-            if channels[2] != -1:
-                lz = global_scale * float(line[channels[2]])
+    motion = read_bvh_motion(motion_lines, channelIndex + 1)
+    del motion_lines
 
-            if channels[3] != -1 or channels[4] != -1 or channels[5] != -1:
+    for bvh_node in bvh_nodes_list:
+        channels = bvh_node.channels
+        # First frame is the rest pose (zeros).
+        anim_data = bvh_node.anim_data = np.zeros((len(motion) + 1, 6))
+        for axis_i in range(3):
+            if channels[axis_i] != -1:
+                anim_data[1:, axis_i] = global_scale * motion[:, channels[axis_i]]
 
-                rx = radians(float(line[channels[3]]))
-                ry = radians(float(line[channels[4]]))
-                rz = radians(float(line[channels[5]]))
+        if bvh_node.has_rot:
+            anim_data[1:, 3:] = np.radians(motion[:, channels[3:]])
 
-            # Done importing motion data #
-            anim_data.append((lx, ly, lz, rx, ry, rz))
-        lineIdx += 1
+    del motion
 
     # Assign children
     for bvh_node in bvh_nodes_list:
@@ -404,6 +437,131 @@ def bvh_node_dict2objects(context, bvh_name, bvh_nodes, rotate_mode='NATIVE', fr
     return objects
 
 
+# Value of the 'LINEAR' keyframe interpolation, as used by foreach_set.
+KEYFRAME_INTERPOLATION_LINEAR = 1
+
+
+def euler_to_matrices(eulers, order):
+    """
+    Return the (frames, 3, 3) rotation matrices of (frames, 3) euler angles, in given rotation order.
+    """
+    rot_mats = None
+    for axis in order:
+        i = 'XYZ'.index(axis)
+        j, k = (i + 1) % 3, (i + 2) % 3
+        cos = np.cos(eulers[:, i])
+        sin = np.sin(eulers[:, i])
+        axis_mats = np.zeros((len(eulers), 3, 3))
+        axis_mats[:, i, i] = 1.0
+        axis_mats[:, j, j] = cos
+        axis_mats[:, j, k] = -sin
+        axis_mats[:, k, j] = sin
+        axis_mats[:, k, k] = cos
+        rot_mats = axis_mats if rot_mats is None else axis_mats @ rot_mats
+    return rot_mats
+
+
+def matrices_to_quaternions(rot_mats):
+    """
+    Return the (frames, 4) quaternions (w, x, y, z) of (frames, 3, 3) rotation matrices.
+    """
+    quats = np.empty((len(rot_mats), 4))
+    diag = np.diagonal(rot_mats, axis1=1, axis2=2)
+
+    # Same branches as mathutils, from the largest (numerically stable) component.
+    use_w = (0.25 * (1.0 + diag.sum(axis=1))) > 1e-4
+    diag_max = np.argmax(diag, axis=1)
+
+    m = rot_mats[use_w]
+    s = 2.0 * np.sqrt(1.0 + diag[use_w].sum(axis=1))
+    quats[use_w] = np.column_stack((
+        0.25 * s,
+        (m[:, 2, 1] - m[:, 1, 2]) / s,
+        (m[:, 0, 2] - m[:, 2, 0]) / s,
+        (m[:, 1, 0] - m[:, 0, 1]) / s,
+    ))
+    for i in range(3):
+        j, k = (i + 1) % 3, (i + 2) % 3
+        mask = ~use_w & (diag_max == i)
+        m = rot_mats[mask]
+        s = 2.0 * np.sqrt(np.maximum(1.0 + m[:, i, i] - m[:, j, j] - m[:, k, k], 0.0))
+        quats[mask, 0] = (m[:, k, j] - m[:, j, k]) / s
+        quats[mask, 1 + i] = 0.25 * s
+        quats[mask, 1 + j] = (m[:, i, j] + m[:, j, i]) / s
+        quats[mask, 1 + k] = (m[:, i, k] + m[:, k, i]) / s
+
+    quats /= np.linalg.norm(quats, axis=1)[:, None]
+    quats[quats[:, 0] < 0.0] *= -1.0
+    return quats
+
+
+def matrices_to_compatible_eulers(rot_mats, order, eul_prev=None):
+    """
+    Return the (frames, 3) euler angles of (frames, 3, 3) rotation matrices, in given rotation order,
+    each frame compatible with the previous one (starting from eul_prev, or a zero rotation),
+    to avoid flipping curves.
+    """
+    if eul_prev is None:
+        eul_prev = np.zeros(3)
+    eul_prev = np.asarray(eul_prev, dtype=np.float64).reshape(1, 3)
+    i, j, k = ('XYZ'.index(axis) for axis in order)
+    m = rot_mats
+
+    # The two euler solutions of each matrix.
+    cy = np.hypot(m[:, i, i], m[:, j, i])
+    eul1 = np.empty((len(m), 3))
+    eul1[:, i] = np.arctan2(m[:, k, j], m[:, k, k])
+    eul1[:, j] = np.arctan2(-m[:, k, i], cy)
+    eul1[:, k] = np.arctan2(m[:, j, i], m[:, i, i])
+    eul2 = np.empty((len(m), 3))
+    eul2[:, i] = np.arctan2(-m[:, k, j], -m[:, k, k])
+    eul2[:, j] = np.arctan2(-m[:, k, i], -cy)
+    eul2[:, k] = np.arctan2(-m[:, j, i], -m[:, i, i])
+
+    # Gimbal lock, single solution.
+    gimbal = cy <= 16.0 * np.finfo(np.float32).eps
+    eul1[gimbal, i] = np.arctan2(-m[gimbal, j, k], m[gimbal, j, j])
+    eul1[gimbal, k] = 0.0
+    eul2[gimbal] = eul1[gimbal]
+
+    if order not in {'XYZ', 'YZX', 'ZXY'}:
+        eul1 = -eul1
+        eul2 = -eul2
+
+    def distance(eul_a, eul_b):
+        # Sum of the axes differences, modulo full turns.
+        diff = np.remainder(eul_a - eul_b + np.pi, 2.0 * np.pi) - np.pi
+        return np.abs(diff).sum(axis=1)
+
+    # Both solutions being symmetric, switching to the other solution is closer to the previous frame
+    # when the second solution of a frame is closer to the first solution of the previous frame.
+    eul_prevs = np.vstack((eul_prev, eul1[:-1]))
+    use_eul2 = np.cumsum(distance(eul2, eul_prevs) < distance(eul1, eul_prevs)) % 2 == 1
+    eulers = np.where(use_eul2[:, None], eul2, eul1)
+
+    # Remove full turns between frames.
+    return np.unwrap(np.vstack((eul_prev, eulers)), axis=0)[1:]
+
+
+def fcurves_add(action, data_path, time, values):
+    """
+    Add linear F-Curves keyed at given time, one for each column of the (frames, N) values array.
+    """
+    co = np.empty((len(time), 2), dtype=np.float32)
+    co[:, 0] = time
+    interpolation = np.full(len(time), KEYFRAME_INTERPOLATION_LINEAR, dtype=np.int32)
+
+    for axis_i in range(values.shape[1]):
+        curve = action.fcurves.new(data_path=data_path, index=axis_i)
+        keyframe_points = curve.keyframe_points
+        keyframe_points.add(len(time))
+
+        co[:, 1] = values[:, axis_i]
+        keyframe_points.foreach_set("co", co.ravel())
+        keyframe_points.foreach_set("interpolation", interpolation)
+        curve.update()
+
+
 def bvh_node_dict2armature(
         context,
         bvh_name,
@@ -528,19 +686,16 @@ def bvh_node_dict2armature(
     arm_ob.animation_data.action = action
 
     # Replace the bvh_node.temp (currently an editbone)
-    # With a tuple  (pose_bone, armature_bone, bone_rest_matrix, bone_rest_matrix_inv)
+    # With a tuple  (pose_bone, armature_bone, bone_rest_matrix, bone_rest_matrix_inv),
+    # the rest matrices being 3x3 arrays.
     num_frame = 0
     for bvh_node in bvh_nodes_list:
         bone_name = bvh_node.temp  # may not be the same name as the bvh_node, could have been shortened.
         pose_bone = pose_bones[bone_name]
         rest_bone = arm_data.bones[bone_name]
-        bone_rest_matrix = rest_bone.matrix_local.to_3x3()
+        bone_rest_matrix = np.array(rest_bone.matrix_local.to_3x3())
+        bone_rest_matrix_inv = np.linalg.inv(bone_rest_matrix)
 
-        bone_rest_matrix_inv = Matrix(bone_rest_matrix)
-        bone_rest_matrix_inv.invert()
-
-        bone_rest_matrix_inv.resize_4x4()
-        bone_rest_matrix.resize_4x4()
         bvh_node.temp = (pose_bone, bone, bone_rest_matrix, bone_rest_matrix_inv)
 
         if 0 == num_frame:
@@ -554,99 +709,54 @@ def bvh_node_dict2armature(
         num_frame = num_frame - skip_frame
 
     # Create a shared time axis for all animation curves.
-    time = [float(frame_start)] * num_frame
+    time = np.arange(num_frame, dtype=np.float64)
     if use_fps_scale:
         dt = scene.render.fps * bvh_frame_time
-        for frame_i in range(1, num_frame):
-            time[frame_i] += float(frame_i) * dt
-    else:
-        for frame_i in range(1, num_frame):
-            time[frame_i] += float(frame_i)
+        time *= dt
+    time += float(frame_start)
 
     # print("bvh_frame_time = %f, dt = %f, num_frame = %d"
     #      % (bvh_frame_time, dt, num_frame]))
 
     for i, bvh_node in enumerate(bvh_nodes_list):
         pose_bone, bone, bone_rest_matrix, bone_rest_matrix_inv = bvh_node.temp
+        anim_data = bvh_node.anim_data[skip_frame:skip_frame + num_frame]
 
         if bvh_node.has_loc:
             # Not sure if there is a way to query this or access it in the
             # PoseBone structure.
             data_path = 'pose.bones["%s"].location' % pose_bone.name
 
-            location = [(0.0, 0.0, 0.0)] * num_frame
-            for frame_i in range(num_frame):
-                bvh_loc = bvh_node.anim_data[frame_i + skip_frame][:3]
-
-                bone_translate_matrix = Matrix.Translation(
-                    Vector(bvh_loc) - bvh_node.rest_head_local)
-                location[frame_i] = (bone_rest_matrix_inv @
-                                     bone_translate_matrix).to_translation()
+            bvh_loc = anim_data[:, :3] - np.array(bvh_node.rest_head_local)
+            location = bvh_loc @ bone_rest_matrix_inv.T
 
             # For each location x, y, z.
-            for axis_i in range(3):
-                curve = action.fcurves.new(data_path=data_path, index=axis_i)
-                keyframe_points = curve.keyframe_points
-                keyframe_points.add(num_frame)
-
-                for frame_i in range(num_frame):
-                    keyframe_points[frame_i].co = (
-                        time[frame_i],
-                        location[frame_i][axis_i],
-                    )
+            fcurves_add(action, data_path, time, location)
 
         if bvh_node.has_rot:
-            data_path = None
-            rotate = None
+            # apply rotation order and convert to XYZ
+            # note that the rot_order_str is reversed.
+            bone_rotation_matrix = euler_to_matrices(anim_data[:, 3:], bvh_node.rot_order_str[::-1])
+            bone_rotation_matrix = (
+                bone_rest_matrix_inv @
+                bone_rotation_matrix @
+                bone_rest_matrix
+            )
 
             if 'QUATERNION' == rotate_mode:
-                rotate = [(1.0, 0.0, 0.0, 0.0)] * num_frame
+                rotate = matrices_to_quaternions(bone_rotation_matrix)
                 data_path = ('pose.bones["%s"].rotation_quaternion'
                              % pose_bone.name)
             else:
-                rotate = [(0.0, 0.0, 0.0)] * num_frame
+                rotate = matrices_to_compatible_eulers(bone_rotation_matrix, pose_bone.rotation_mode)
                 data_path = ('pose.bones["%s"].rotation_euler' %
                              pose_bone.name)
 
-            prev_euler = Euler((0.0, 0.0, 0.0))
-            for frame_i in range(num_frame):
-                bvh_rot = bvh_node.anim_data[frame_i + skip_frame][3:]
-
-                # apply rotation order and convert to XYZ
-                # note that the rot_order_str is reversed.
-                euler = Euler(bvh_rot, bvh_node.rot_order_str[::-1])
-                bone_rotation_matrix = euler.to_matrix().to_4x4()
-                bone_rotation_matrix = (
-                    bone_rest_matrix_inv @
-                    bone_rotation_matrix @
-                    bone_rest_matrix
-                )
-
-                if len(rotate[frame_i]) == 4:
-                    rotate[frame_i] = bone_rotation_matrix.to_quaternion()
-                else:
-                    rotate[frame_i] = bone_rotation_matrix.to_euler(
-                        pose_bone.rotation_mode, prev_euler)
-                    prev_euler = rotate[frame_i]
-
             # For each euler angle x, y, z (or quaternion w, x, y, z).
-            for axis_i in range(len(rotate[0])):
-                curve = action.fcurves.new(data_path=data_path, index=axis_i)
-                keyframe_points = curve.keyframe_points
-                keyframe_points.add(num_frame)
-
-                for frame_i in range(num_frame):
-                    keyframe_points[frame_i].co = (
-                        time[frame_i],
-                        rotate[frame_i][axis_i],
-                    )
-
-    for cu in action.fcurves:
-        if IMPORT_LOOP:
-            pass  # 2.5 doenst have cyclic now?
-
-        for bez in cu.keyframe_points:
-            bez.interpolation = 'LINEAR'
+            fcurves_add(action, data_path, time, rotate)
+
+    if IMPORT_LOOP:
+        pass  # 2.5 doenst have cyclic now?
 
     # finally apply matrix
     arm_ob.matrix_world = global_matrix
@@ -50,11 +50,21 @@ import time
 import math
 import struct
 
+import numpy as np
+
 
 def get_sampled_frames(start, end, sampling):
     return [math.modf(start + x * sampling) for x in range(int((end - start) / sampling) + 1)]
 
 
+def transform_coords(coords, matrix):
+    """
+    Apply given 4x4 matrix to given (N, 3) array of coordinates, in place.
+    """
+    matrix = np.array(matrix, dtype=np.float64)
+    coords[:] = coords @ matrix[:3, :3].T + matrix[:3, 3]
+
+
 def do_export(context, props, filepath):
     mat_x90 = mathutils.Matrix.Rotation(-math.pi/2, 4, 'X')
     ob = context.active_object
@@ -78,10 +88,22 @@ def do_export(context, props, filepath):
     headerStr = struct.pack(headerFormat, b'POINTCACHE2\0',
                             1, vertCount, start, sampling, sampleCount)
 
-    file = open(filepath, "wb")
+    # Read access is needed to map the file.
+    file = open(filepath, "w+b" if props.use_mmap else "wb")
     file.write(headerStr)
 
-    for frame in sampletimes:
+    # Coordinates of all vertices of a frame, fetched and written at once.
+    if props.use_mmap:
+        # Frames are directly fetched into the (pre-sized) mapped file.
+        file.truncate(len(headerStr) + sampleCount * vertCount * 3 * 4)
+        file.flush()
+        frames = np.memmap(file, dtype='<f4', mode='r+', offset=len(headerStr),
+                           shape=(sampleCount, vertCount, 3))
+    else:
+        frames = None
+        coords = np.empty((vertCount, 3), dtype=np.float32)
+
+    for frame_index, frame in enumerate(sampletimes):
         # stupid modf() gives decimal part first!
         sc.frame_set(int(frame[1]), subframe=frame[0])
         if apply_modifiers:
@@ -91,6 +113,7 @@ def do_export(context, props, filepath):
 
         if len(me.vertices) != vertCount:
             bpy.data.meshes.remove(me, do_unlink=True)
+            frames = coords = None  # Release the file mapping, if any.
             file.close()
             try:
                 remove(filepath)
@@ -101,22 +124,29 @@ def do_export(context, props, filepath):
             print('Export failed. Vertexcount of Object is not constant')
             return False
 
-        if props.world_space:
-            me.transform(ob.matrix_world)
-        if props.rot_x90:
-            me.transform(mat_x90)
+        if frames is not None:
+            coords = frames[frame_index]
+        me.vertices.foreach_get("co", coords.reshape(-1))
+
+        if props.world_space or props.rot_x90:
+            matrix = mathutils.Matrix()
+            if props.world_space:
+                matrix = ob.matrix_world @ matrix
+            if props.rot_x90:
+                matrix = mat_x90 @ matrix
+            transform_coords(coords, matrix)
 
-        for v in me.vertices:
-            thisVertex = struct.pack('<fff', float(v.co[0]),
-                                     float(v.co[1]),
-                                     float(v.co[2]))
-            file.write(thisVertex)
+        if frames is None:
+            coords.tofile(file)
 
     if apply_modifiers:
         ob.evaluated_get(depsgraph).to_mesh_clear()
     else:
         me = ob.to_mesh_clear()
 
+    if frames is not None:
+        frames.flush()
+        frames = coords = None
     file.flush()
     file.close()
     return True
@@ -142,6 +172,11 @@ class Export_pc2(bpy.types.Operator, ExportHelper):
         name="Apply Modifiers",
         description="Applies the Modifiers",
         default=True,)
+    use_mmap: BoolProperty(
+        name="Memory-Mapped Output",
+        description="Write frames directly into the memory-mapped output file "
+                    "(avoids a copy of each frame, the whole file being allocated upfront)",
+        default=False,)
     range_start: IntProperty(
         name='Start Frame',
         description='First frame to use for Export',
@@ -110,11 +110,11 @@ def is_ref_scene(scene):
 
 def read(report, filename, obj_merge=BY_LAYER, import_text=True, import_light=True, export_acis=True, merge_lines=True,
          do_bbox=True, block_rep=LINKED_OBJECTS, new_scene=None, recenter=False, projDXF=None, projSCN=None,
-         thicknessWidth=True, but_group_by_att=True, dxf_unit_scale=1.0):
+         thicknessWidth=True, but_group_by_att=True, dxf_unit_scale=1.0, layers=None):
     # import dxf and export nurbs types to sat/sab files
     # because that's how autocad stores nurbs types in a dxf...
     do = Do(filename, obj_merge, import_text, import_light, export_acis, merge_lines, do_bbox, block_rep, recenter,
-            projDXF, projSCN, thicknessWidth, but_group_by_att, dxf_unit_scale)
+            projDXF, projSCN, thicknessWidth, but_group_by_att, dxf_unit_scale, layers)
 
     errors = do.entities(os.path.basename(filename).replace(".dxf", ""), new_scene)
 
@@ -260,6 +260,13 @@ class IMPORT_OT_dxf(bpy.types.Operator):
             default=T_ExportAcis
             )
 
+    layers: StringProperty(
+            name="Layers",
+            description="Comma separated names of the DXF layers to import, all layers if empty "
+                        "(other layers are skipped without being read completely)",
+            default=""
+            )
+
     outliner_groups: BoolProperty(
             name="Display Groups in Outliner(s)",
             description="Make all outliners in current screen layout show groups",
@@ -412,6 +419,7 @@ class IMPORT_OT_dxf(bpy.types.Operator):
         box.prop(self, "import_text")
         box.prop(self, "import_light")
         box.prop(self, "export_acis")
+        box.prop(self, "layers")
 
         # view options
         layout.label(text="View Options:")
@@ -509,6 +517,8 @@ class IMPORT_OT_dxf(bpy.types.Operator):
         if self.create_new_scene:
             scene = bpy.data.scenes.new(os.path.basename(self.filepath).replace(".dxf", ""))
 
+        layers = set(name.strip() for name in self.layers.split(",") if name.strip()) or None
+
         proj_dxf = None
         proj_scn = None
         dxf_unit_scale = 1.0
@@ -538,7 +548,7 @@ class IMPORT_OT_dxf(bpy.types.Operator):
         else:
             read(self.report, self.filepath, merge_options, self.import_text, self.import_light, self.export_acis,
                  self.merge_lines, self.do_bbox, block_map[self.block_options], scene, self.recenter,
-                 proj_dxf, proj_scn, self.represent_thickness_and_width, self.import_atts, dxf_unit_scale)
+                 proj_dxf, proj_scn, self.represent_thickness_and_width, self.import_atts, dxf_unit_scale, layers)
 
         if self.outliner_groups:
             display_groups_in_outliner()
@@ -7,15 +7,20 @@ __author__ = "mozman <mozman@gmx.at>"
 
 from itertools import islice
 
-from .tags import TagGroups
-from .entitysection import build_entities
+from .tags import TagGroups, text_tags, gc_paused
+from .entitysection import build_entities, iter_groups, group_start_re
+
+BLOCK_START_RE = group_start_re(2)  # with the block name
 
 
 class BlocksSection(object):
     name = 'blocks'
 
     def __init__(self):
-        self._blocks = dict()
+        self._blocks = dict()  # None for a block not yet materialised
+        self._texts = dict()  # DXF text of the blocks not yet materialised
+        self._assure_3d_coords = False
+        self._build_hooks = list()
 
     @staticmethod
     def from_tags(tags, drawing):
@@ -24,6 +29,17 @@ class BlocksSection(object):
             blocks_section._build(tags)
         return blocks_section
 
+    @staticmethod
+    def from_text(text, drawing):
+        """ Indexes the block definitions of `text` (DXF text of the section), each block is materialised at first
+        access.
+        """
+        blocks_section = BlocksSection()
+        if drawing.grab_blocks:
+            blocks_section._assure_3d_coords = drawing.assure_3d_coords
+            blocks_section._index(text)
+        return blocks_section
+
     def _build(self, tags):
         if len(tags) == 3:  # empty block section
             return
@@ -31,27 +47,71 @@ class BlocksSection(object):
         for group in TagGroups(islice(tags, 2, len(tags)-1)):
             groups.append(group)
             if group[0].value == 'ENDBLK':
-                entities = build_entities(groups)
-                block = entities[0]
-                block.set_entities(entities[1:-1])
-                self._add(block)
+                self._add(build_block(groups))
                 groups = list()
 
+    def _index(self, text):
+        block_start = None
+        block_name = None
+        for dxftype, name, start, end in iter_groups(text, BLOCK_START_RE):
+            if dxftype == 'BLOCK':
+                block_start = start
+                block_name = name
+            elif dxftype == 'ENDBLK' and block_start is not None:
+                block_text = text[block_start:end]
+                if block_name is None:  # let the BLOCK entity find its name
+                    self._add(self._build_text(block_text))
+                else:
+                    self._blocks[block_name] = None
+                    self._texts[block_name] = block_text
+                block_start = None
+
+    def _build_text(self, text):
+        with gc_paused():
+            return build_block(TagGroups(text_tags(text, self._assure_3d_coords)))
+
+    def _materialise(self, name):
+        block = self._build_text(self._texts.pop(name))
+        self._blocks[name] = block
+        for hook in self._build_hooks:
+            hook(block)
+        return block
+
     def _add(self, block):
         self._blocks[block.name] = block
+        self._texts.pop(block.name, None)
+
+    def add_build_hook(self, hook):
+        """ Calls hook(block) for each block once it is materialised. """
+        for block in self._blocks.values():
+            if block is not None:
+                hook(block)
+        self._build_hooks.append(hook)
 
     # start of public interface
     def __len__(self):
         return len(self._blocks)
 
     def __iter__(self):
-        return iter(self._blocks.values())
+        for name, block in list(self._blocks.items()):
+            yield self._materialise(name) if block is None else block
 
     def __contains__(self, name):
         return name in self._blocks
 
     def __getitem__(self, name):
-        return self._blocks[name]
+        block = self._blocks[name]
+        return self._materialise(name) if block is None else block
 
     def get(self, name, default=None):
-        return self._blocks.get(name, default)
+        if name in self._blocks:
+            return self[name]
+        return default
+
+
+def build_block(groups):
+    """ Returns the Block() of the tag `groups` from (0, BLOCK) to (0, ENDBLK). """
+    entities = build_entities(groups)
+    block = entities[0]
+    block.set_entities(entities[1:-1])
+    return block
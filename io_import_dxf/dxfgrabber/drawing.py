@@ -5,13 +5,19 @@
 
 __author__ = "mozman <mozman@gmx.at>"
 
-from .tags import stream_tagger
+from .tags import block_tagger, gc_paused
 from .sections import Sections
 
 DEFAULT_OPTIONS = {
     "grab_blocks": True,  # import block definitions True=yes, False=No
     "assure_3d_coords": False,  # guarantees (x, y, z) tuples for ALL coordinates
     "resolve_text_styles": True,  # Text, Attrib, Attdef and MText attributes will be set by the associated text style if necessary
+    # import only these sections, e.g. {'tables', 'entities'}, None=all; the header is always imported
+    "grab_sections": None,
+    # import only entities on these layers, e.g. {'ROADS'}, None=all; block definitions are not filtered
+    "grab_layers": None,
+    # import only entities of these types, e.g. {'LWPOLYLINE'}, None=all; block definitions are not filtered
+    "grab_entity_types": None,
 }
 
 
@@ -22,12 +28,18 @@ class Drawing(object):
         self.grab_blocks = options.get('grab_blocks', True)
         self.assure_3d_coords = options.get('assure_3d_coords', False)
         self.resolve_text_styles = options.get('resolve_text_styles', True)
+        self.grab_sections = _name_set(options.get('grab_sections'), 'lower')
+        self.grab_layers = _name_set(options.get('grab_layers'))
+        self.grab_entity_types = _name_set(options.get('grab_entity_types'), 'upper')
 
-        tagreader = stream_tagger(stream, self.assure_3d_coords)
         self.dxfversion = 'AC1009'
         self.encoding = 'cp1252'
         self.filename = None
-        sections = Sections(tagreader, self)
+        with gc_paused():
+            if self.grab_sections is None and self.grab_layers is None and self.grab_entity_types is None:
+                sections = Sections(block_tagger(stream, self.assure_3d_coords), self)
+            else:  # index the sections and entities, materialise the requested ones at first access
+                sections = Sections.from_text(stream.read(), self)
         self.header = sections.header
         self.layers = sections.tables.layers
         self.styles = sections.tables.styles
@@ -38,13 +50,12 @@ class Drawing(object):
         if 'acdsdata' in sections:
             self.acdsdata = sections.acdsdata
             # sab data introduced with DXF version AC1027 (R2013)
-            if self.dxfversion >= 'AC1027':
-                self.collect_sab_data()
+            if self.dxfversion >= 'AC1027' and (self.grab_sections is None or 'acdsdata' in self.grab_sections):
+                self.entities.add_build_hook(self.collect_sab_data)
 
         if self.resolve_text_styles:
-            resolve_text_styles(self.entities, self.styles)
-            for block in self.blocks:
-                resolve_text_styles(block, self.styles)
+            self.entities.add_build_hook(self._resolve_text_styles)
+            self.blocks.add_build_hook(self._resolve_text_styles)
 
     def modelspace(self):
         return (entity for entity in self.entities if not entity.paperspace)
@@ -52,14 +63,30 @@ class Drawing(object):
     def paperspace(self):
         return (entity for entity in self.entities if entity.paperspace)
 
-    def collect_sab_data(self):
-        for entity in self.entities:
+    def collect_sab_data(self, entities=None):
+        if entities is None:
+            entities = self.entities
+        for entity in entities:
             if hasattr(entity, 'set_sab_data'):
                 sab_data = self.acdsdata.sab_data[entity.handle]
                 entity.set_sab_data(sab_data)
 
+    def _resolve_text_styles(self, entities):
+        resolve_text_styles(entities, self.styles)
+
 
 def resolve_text_styles(entities, text_styles):
     for entity in entities:
         if hasattr(entity, 'resolve_text_style'):
             entity.resolve_text_style(text_styles)
+
+
+def _name_set(names, case=None):
+    """ Returns a frozenset of `names` (a name or an iterable of names) converted by the string method `case`
+    ('lower', 'upper', None to keep them), or None if `names` is None.
+    """
+    if names is None:
+        return None
+    if hasattr(names, 'lower'):  # a single name
+        names = [names]
+    return frozenset(names if case is None else (getattr(name, case)() for name in names))
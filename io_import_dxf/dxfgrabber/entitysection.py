@@ -5,18 +5,24 @@
 from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
+import re
 from itertools import islice
 
 from .tags import TagGroups, DXFStructureError
-from .tags import Tags
+from .tags import Tags, text_tags, gc_paused
 from .dxfentities import entity_factory
 
 
 class EntitySection(object):
     name = 'entities'
+    filterable = True  # entities can be selected by layer and type, see filter_entities()
 
     def __init__(self):
         self._entities = list()
+        self._text = None  # DXF text of the not yet materialised entities
+        self._dxftypes = None
+        self._assure_3d_coords = False
+        self._build_hooks = list()
 
     @classmethod
     def from_tags(cls, tags, drawing):
@@ -24,22 +30,59 @@ class EntitySection(object):
         entity_section._build(tags)
         return entity_section
 
+    @classmethod
+    def from_text(cls, text, drawing):
+        """ Entities are materialised from `text` (DXF text of the section) at first access, only the entities on
+        drawing.grab_layers of the types drawing.grab_entity_types (None for all) are kept.
+        """
+        entity_section = cls()
+        if cls.filterable and (drawing.grab_layers is not None or drawing.grab_entity_types is not None):
+            text = filter_entities(text, drawing.grab_layers, drawing.grab_entity_types)
+            entity_section._dxftypes = drawing.grab_entity_types
+        entity_section._text = text
+        entity_section._assure_3d_coords = drawing.assure_3d_coords
+        return entity_section
+
+    def add_build_hook(self, hook):
+        """ Calls hook(entities) once the entities are materialised. """
+        if self._text is None:
+            hook(self._entities)
+        else:
+            self._build_hooks.append(hook)
+
     def get_entities(self):
-        return self._entities
+        return self._get_entities()
 
     # start of public interface
 
     def __len__(self):
-        return len(self._entities)
+        return len(self._get_entities())
 
     def __iter__(self):
-        return iter(self._entities)
+        return iter(self._get_entities())
 
     def __getitem__(self, index):
-        return self._entities[index]
+        return self._get_entities()[index]
 
     # end of public interface
 
+    def _get_entities(self):
+        if self._text is not None:
+            self._materialise()
+        return self._entities
+
+    def _materialise(self):
+        text = self._text
+        self._text = None
+        with gc_paused():
+            self._build(text_tags(text, self._assure_3d_coords))
+        if self._dxftypes is not None:  # POLYLINE entities are casted to POLYFACE or POLYMESH entities
+            self._entities = [entity for entity in self._entities if entity.dxftype in self._dxftypes]
+        hooks = self._build_hooks
+        self._build_hooks = list()
+        for hook in hooks:
+            hook(self._entities)
+
     def _build(self, tags):
         if len(tags) == 3:  # empty entities section
             return
@@ -49,6 +92,68 @@ class EntitySection(object):
 
 class ObjectsSection(EntitySection):
     name = 'objects'
+    filterable = False
+
+
+def group_start_re(code):
+    """ Returns a regex matching a (0, NAME) tag at the start of a line, with its preceding line ending, followed by
+    the tags of the group up to the first tag `code`, if there is one. Group 1 is NAME, group 2 the value of the tag
+    `code` or None. NAME contains letters, which a group code line can not, so the '0' line is a group code line and
+    not a value. The tags are matched pairwise, a value can not be taken for a group code.
+    """
+    return re.compile(
+        r'\n[ \t]*0[ \t]*\r?\n([^\r\n]*?[A-Za-z][^\r\n]*)'  # (0, NAME)
+        r'(?:\r?\n[ \t]*(?!(?:0|{code})[ \t]*\r?\n)-?\d+[ \t]*\r?\n[^\r\n]*)*'  # other tags
+        r'(?:\r?\n[ \t]*{code}[ \t]*\r?\n([^\r\n]*))?'.format(code=code)  # (code, value)
+    )
+
+
+ENTITY_START_RE = group_start_re(8)  # with the layer name
+SEQUENCE_ENTITIES = frozenset(('VERTEX', 'ATTRIB', 'SEQEND'))  # belong to the previous POLYLINE or INSERT
+
+
+def iter_groups(text, start_re=ENTITY_START_RE):
+    """ Yields (name, value, start, end) of each (0, NAME) tag group of `text` (DXF text), with the value of the tag
+    matched by `start_re`, see group_start_re(). text[start:end] is the DXF text of the group. Text in front of the
+    first group is skipped.
+    """
+    # With a leading line ending the first line is matched too, and match.start() is the start of the line in text.
+    starts = [(match.start(), match.group(1), match.group(2)) for match in start_re.finditer('\n' + text)]
+    starts.append((len(text), None, None))
+    for (start, name, value), (end, _, _) in zip(starts, islice(starts, 1, None)):
+        yield name, value, start, end
+
+
+def filter_entities(text, layers=None, dxftypes=None):
+    """ Returns the DXF text of the entities in `text` on `layers` of types `dxftypes` (None for all), without
+    materialising any entity. VERTEX, ATTRIB and SEQEND entities are kept with their POLYLINE or INSERT entity.
+    Other tag groups, like (0, SECTION) and (0, ENDSEC), are always kept.
+    """
+    if dxftypes is not None and ('POLYFACE' in dxftypes or 'POLYMESH' in dxftypes):
+        dxftypes = set(dxftypes) | set(['POLYLINE'])
+
+    chunks = list()
+    keep_sequence = True
+    kept_start = None  # start of the current run of kept entities
+    for name, layer, start, end in iter_groups(text):
+        if name in SEQUENCE_ENTITIES:
+            keep = keep_sequence
+        elif name in ('SECTION', 'ENDSEC'):
+            keep = True
+        else:
+            if layer is None:  # default layer
+                layer = '0'
+            keep = (dxftypes is None or name in dxftypes) and (layers is None or layer in layers)
+            keep_sequence = keep
+        if keep:
+            if kept_start is None:
+                kept_start = start
+        elif kept_start is not None:
+            chunks.append(text[kept_start:start])
+            kept_start = None
+    if kept_start is not None:
+        chunks.append(text[kept_start:])
+    return ''.join(chunks)
 
 
 def build_entities(tag_groups):
@@ -5,6 +5,8 @@
 from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
+import re
+
 from .codepage import toencoding
 from .defaultchunk import DefaultChunk, iterchunks
 from .headersection import HeaderSection
@@ -12,13 +14,59 @@ from .tablessection import TablesSection
 from .entitysection import EntitySection, ObjectsSection
 from .blockssection import BlocksSection
 from .acdsdata import AcDsDataSection
+from .tags import text_tags, DXFStructureError
+
+# Values of the (0, SECTION) (2, NAME) and (0, ENDSEC) tags with their preceding line ending, searched as literals.
+# 'SECTION' and 'ENDSEC' can not be group code lines, so the preceding line is a group code line, see section_index().
+SECTION_RE = re.compile(r'\nSECTION\r?\n[ \t]*2[ \t]*\r?\n([^\r\n]*)')
+ENDSEC_RE = re.compile(r'\nENDSEC\r?(?:\n|$)')
+CODE_0_RE = re.compile(r'[ \t]*0[ \t]*\r?\n\Z')
+
+
+def section_index(text):
+    """ Returns a list of (name, start, end) of the sections in `text` (DXF text), text[start:end] is the DXF text of
+    the section from (0, SECTION) to (0, ENDSEC). Just searches the text, no tags are created.
+    """
+    def search(value_re, pos):  # next value_re match preceded by a group code 0 line
+        match = value_re.search(text, pos)
+        while match is not None:
+            if CODE_0_RE.match(text, line_start(match), match.start() + 1):
+                return match
+            match = value_re.search(text, match.start() + 1)
+        return None
+
+    def line_start(match):  # of the group code line
+        return text.rfind('\n', 0, match.start()) + 1
+
+    index = []
+    pos = 0
+    while True:
+        match = search(SECTION_RE, pos)
+        if match is None:
+            return index
+        end = search(ENDSEC_RE, match.end())
+        if end is None:
+            raise DXFStructureError("Missing ENDSEC of section {}.".format(match.group(1)))
+        index.append((match.group(1), line_start(match), end.end()))
+        pos = end.end()
 
 
 class Sections(object):
     def __init__(self, tagreader, drawing):
         self._sections = {}
         self._create_default_sections()
-        self._setup_sections(tagreader, drawing)
+        if tagreader is not None:
+            self._setup_sections(tagreader, drawing)
+
+    @staticmethod
+    def from_text(text, drawing):
+        """ Sets up only the sections in drawing.grab_sections (lower case section names, None for all sections) of
+        `text` (DXF text) by the section_index(). The HEADER section is always set up. Entities and blocks are
+        materialised at first access.
+        """
+        sections = Sections(None, drawing)
+        sections._setup_indexed_sections(text, drawing)
+        return sections
 
     def __contains__(self, name):
         return name in self._sections
@@ -49,6 +97,26 @@ class Sections(object):
             if new_section is not None:
                 self._sections[new_section.name] = new_section
 
+    def _setup_indexed_sections(self, text, drawing):
+        grab_sections = drawing.grab_sections
+        for section_name, start, end in section_index(text):
+            if section_name == 'HEADER':
+                new_section = HeaderSection.from_tags(text_tags(text[start:end], drawing.assure_3d_coords))
+                drawing.dxfversion = new_section.get('$ACADVER', 'AC1009')
+                codepage = new_section.get('$DWGCODEPAGE', 'ANSI_1252')
+                drawing.encoding = toencoding(codepage)
+            elif section_name in SECTIONMAP and (grab_sections is None or section_name.lower() in grab_sections):
+                section_class = get_section_class(section_name)
+                if hasattr(section_class, 'from_text'):  # lazy section
+                    new_section = section_class.from_text(text[start:end], drawing)
+                else:
+                    new_section = section_class.from_tags(text_tags(text[start:end], drawing.assure_3d_coords),
+                                                          drawing)
+            else:
+                new_section = None
+            if new_section is not None:
+                self._sections[new_section.name] = new_section
+
     def __getattr__(self, key):
         try:
             return self._sections[key]
@@ -5,6 +5,7 @@
 from __future__ import unicode_literals
 __author__ = "mozman <mozman@gmx.at>"
 
+import gc
 import sys
 from .codepage import toencoding
 from .const import acadrelease
@@ -12,6 +13,7 @@ from array import array
 
 from io import StringIO
 from collections import namedtuple
+from contextlib import contextmanager
 from itertools import chain, islice
 from . import tostr
 
@@ -182,6 +184,131 @@ def stream_tagger(stream, assure_3d_coords=False):
             return
 
 
+TAGGER_BLOCK_SIZE = 1 << 20  # characters read at once by block_tagger()
+
+
+def block_tagger(stream, assure_3d_coords=False, block_size=TAGGER_BLOCK_SIZE):
+    """ Generates the same DXFTag() as stream_tagger(), but reads the stream by large blocks and splits them in
+    code/value lines at once. Does not skip comment tags 999.
+    """
+    # Casters of single tags, None for strings (kept as they are).
+    casters = dict((code, None if caster is tostr else caster) for code, caster in _TagCaster._cast.items())
+    point_codes = POINT_CODES
+    new_tag = tuple.__new__  # new_tag(DXFTag, (code, value)) is DXFTag(code, value), without a Python level call
+    lines = []  # lines not processed yet, the first one is always a group code
+    tail = ''  # incomplete last line of the block
+    line_offset = 0  # line number of lines[0], for error messages
+    strip_cr = False
+    eof = False
+    while not eof:
+        data = stream.read(block_size)
+        if data:
+            strip_cr = strip_cr or '\r' in data
+            data = (tail + data).split('\n')
+            tail = data.pop()
+            lines.extend(data)
+        else:
+            eof = True
+            if tail:  # last line without line ending
+                lines.append(tail)
+
+        count = len(lines) // 2  # count of complete code/value pairs
+        invalid_code = False
+        try:
+            codes = list(map(int, lines[0:count * 2:2]))
+        except ValueError:  # stop before the invalid group code, e.g. garbage after the EOF tag
+            codes = []
+            for code in lines[0:count * 2:2]:
+                try:
+                    codes.append(int(code))
+                except ValueError:
+                    break
+            count = len(codes)
+            invalid_code = True
+        values = lines[1:count * 2:2]
+        if strip_cr:  # without line ending
+            values = [value.rstrip('\r') for value in values]
+
+        # Keep 2 pairs for the point look-ahead, except at end of file.
+        end = count if (eof or invalid_code) else count - 2
+        index = 0
+        while index < end:
+            code = codes[index]
+            if code == 999:  # skip comments
+                index += 1
+            elif code in point_codes:
+                if index + 1 >= count:  # y tag missing at end of file
+                    break
+                if codes[index + 1] != code + 10:  # y coordinate is mandatory
+                    raise DXFStructureError("Missing required y coordinate near line: {}.".format(
+                        line_offset + index * 2 + 4))
+                if index + 2 >= count:  # z tag (or next tag) missing at end of file
+                    break
+                try:
+                    if codes[index + 2] == code + 20:  # z coordinate just for 3d points
+                        point = (float(values[index]), float(values[index + 1]), float(values[index + 2]))
+                        index += 3
+                    else:
+                        if assure_3d_coords:
+                            point = (float(values[index]), float(values[index + 1]), 0.)
+                        else:
+                            point = (float(values[index]), float(values[index + 1]))
+                        index += 2
+                except ValueError:
+                    raise DXFStructureError('Invalid floating point values near line: {}.'.format(
+                        line_offset + index * 2 + 6))
+                yield new_tag(DXFTag, (code, point))
+            else:  # just a single tag
+                value = values[index]
+                typecaster = casters.get(code)
+                if typecaster is None:
+                    index += 1
+                    yield new_tag(DXFTag, (code, value))
+                    continue
+                try:
+                    try:
+                        value = typecaster(value)
+                    except ValueError:
+                        if typecaster is int:  # convert float to int
+                            value = int(float(value))
+                        else:
+                            raise
+                except ValueError:
+                    raise DXFStructureError('Invalid tag (code={code}, value="{value}") near line: {line}.'.format(
+                        line=line_offset + index * 2 + 2,
+                        code=code,
+                        value=value,
+                    ))
+                index += 1
+                yield new_tag(DXFTag, (code, value))
+
+        if invalid_code:
+            int(lines[count * 2].rstrip('\r'))  # raises the ValueError of stream_tagger()
+        if eof:
+            return
+        del lines[:index * 2]
+        line_offset += index * 2
+
+
+def text_tags(text, assure_3d_coords=False):
+    """ Returns the Tags() of the DXF `text`. """
+    return Tags(block_tagger(StringIO(text), assure_3d_coords))
+
+
+@contextmanager
+def gc_paused():
+    """ Pauses the cyclic garbage collector while building tags and entities: millions of them are created, none
+    being garbage, and the collector would otherwise repeatedly traverse all of them.
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
 def string_tagger(s):
     return stream_tagger(StringIO(s))
 
@@ -448,7 +575,7 @@ class DXFInfo(object):
 def dxfinfo(stream):
     info = DXFInfo()
     tag = DXFTag(999999, '')
-    tagreader = stream_tagger(stream)
+    tagreader = block_tagger(stream)
     while tag != DXFTag(0, 'ENDSEC'):
         tag = next(tagreader)
         if tag.code != 9:
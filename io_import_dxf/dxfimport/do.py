@@ -92,18 +92,26 @@ class Indicator:
 
 class Do:
     __slots__ = (
-        "dwg", "combination", "known_blocks", "import_text", "import_light", "export_acis", "merge_lines",
-        "do_bounding_boxes", "acis_files", "errors", "block_representation", "recenter", "did_group_instance",
-        "objects_before", "pDXF", "pScene", "thickness_and_width", "but_group_by_att", "current_scene",
-        "dxf_unit_scale"
+        "dwg", "combination", "known_blocks", "block_contents", "import_text", "import_light", "export_acis",
+        "merge_lines", "do_bounding_boxes", "acis_files", "errors", "block_representation", "recenter",
+        "did_group_instance", "objects_before", "pDXF", "pScene", "thickness_and_width", "but_group_by_att",
+        "current_scene", "dxf_unit_scale"
     )
 
     def __init__(self, dxf_filename, c=BY_LAYER, import_text=True, import_light=True, export_acis=True,
                  merge_lines=True, do_bbox=True, block_rep=LINKED_OBJECTS, recenter=False, pDXF=None, pScene=None,
-                 thicknessWidth=True, but_group_by_att=True, dxf_unit_scale=1.0):
-        self.dwg = dxfgrabber.readfile(dxf_filename, {"assure_3d_coords": True})
+                 thicknessWidth=True, but_group_by_att=True, dxf_unit_scale=1.0, layers=None):
+        options = {"assure_3d_coords": True}
+        if layers is not None:
+            # Only the entities on these layers get materialised, the others are skipped by the section index of
+            # dxfgrabber. The OBJECTS section is not used.
+            options.update(grab_sections=("tables", "blocks", "entities", "acdsdata"), grab_layers=layers)
+        self.dwg = dxfgrabber.readfile(dxf_filename, options)
         self.combination = c
+        # Converted blocks, by (block name, block representation): all other import settings are the same for all
+        # blocks of a file.
         self.known_blocks = {}
+        self.block_contents = {}
         self.import_text = import_text
         self.import_light = import_light
         self.export_acis = export_acis
@@ -822,20 +830,9 @@ class Do:
         sub-objects is being created. `INSERT`s inside a block are being added to the same list. If the list has more
         than one element they are being parented to a newly created Blender-Empty which is return instead of the
         single object in the sub-objects-list that is being returned only if it is the only object in the list.
+        The block is converted once, the objects of all further INSERTs of it are copies of an object tree (see
+        _copy_object_tree()) stored in known_blocks.
         """
-        def _recursive_copy_inserts(parent, known_inserts, inserts, group, invisible):
-            for ki in known_inserts:
-                new_insert = ki.copy()
-                _recursive_copy_inserts(new_insert, ki.children, None, group, invisible)
-                if new_insert.name not in group.objects:
-                    group.objects.link(new_insert)
-                if invisible is not None:
-                    new_insert.hide_viewport = bool(invisible)
-                if inserts is not None:
-                    inserts.append(new_insert)
-                new_insert.parent = parent
-                scene.collection.objects.link(new_insert)
-
         if name is None:
             name = entity.name
         # get group
@@ -847,7 +844,10 @@ class Do:
         # get object(s)
         objects = []
         inserts = []
-        if name not in self.known_blocks.keys():
+        key = (name, LINKED_OBJECTS)
+        if key in self.known_blocks:
+            o = self._copy_object_tree(self.known_blocks[key], None, scene, group, invisible)
+        else:
             block_inserts = [en for en in entity if is_.insert(en.dxftype)]
             bc = (en for en in entity if is_.combined_entity(en))
             bs = (en for en in entity if is_.separated_entity(en) and not is_.insert(en.dxftype))
@@ -907,40 +907,21 @@ class Do:
 
             # put a copy of the retrieved objects into the known_blocks dict, so that the attributes being added to
             # the object from this point onwards (from INSERT attributes) are not being copied to new/other INSERTs
-            self.known_blocks[name] = [[o.copy() for o in objects], inserts]
+            self.known_blocks[key] = (self._template(o), [(self._template(obj), [], True) for obj in objects] +
+                                      [self._object_tree(obj) for obj in inserts], True)
 
             # so that it gets assigned to the group and inherits visibility too
             objects.append(o)
 
-            self.known_blocks[name].append(o.copy())
-        else:
-            known_objects, known_inserts, known_o = self.known_blocks[name]
-
-            for known_object in known_objects:
-                oc = known_object.copy()
-                scene.collection.objects.link(oc)
-                objects.append(oc)
-
-            o = known_o.copy()
-            scene.collection.objects.link(o)
-
-            _recursive_copy_inserts(o, known_inserts, inserts, group, invisible)
-
-            # parent objects to o
+            # link group
             for obj in objects:
-                obj.parent = o
+                if obj.name not in group.objects:
+                    group.objects.link(obj)
 
-            objects.append(o)
-
-        # link group
-        for obj in objects:
-            if obj.name not in group.objects:
-                group.objects.link(obj)
-
-        # visibility
-        if invisible is not None:
-            for obj in objects:
-                obj.hide_viewport = bool(invisible)
+            # visibility
+            if invisible is not None:
+                for obj in objects:
+                    obj.hide_viewport = bool(invisible)
 
         # block transformations
         o.location = self.proj(entity.basepoint)
@@ -958,15 +939,16 @@ class Do:
         else:
             group = self._get_group(entity.layer)
 
-        block_group = self._get_group(entity.name+"_BLOCK")
+        # create the block, once
+        key = (name, GROUP_INSTANCES)
+        if key not in self.known_blocks:
+            block_group = self._get_group(entity.name+"_BLOCK")
 
-        if "Blocks" not in bpy.data.scenes:
-            block_scene = bpy.data.scenes.new("Blocks")
-        else:
-            block_scene = bpy.data.scenes["Blocks"]
+            if "Blocks" not in bpy.data.scenes:
+                block_scene = bpy.data.scenes.new("Blocks")
+            else:
+                block_scene = bpy.data.scenes["Blocks"]
 
-        # create the block
-        if len(block_group.objects) == 0 or name not in self.known_blocks.keys():
             bpy.context.screen.scene = block_scene
             block_inserts = [en for en in entity if is_.insert(en.dxftype)]
             bc = (en for en in entity if is_.combined_entity(en))
@@ -999,11 +981,11 @@ class Do:
                 block_group.objects.link(i_empty)
                 block_scene.collection.objects.link(i_empty)
 
-            self.known_blocks[name] = [objects, inserts, bbox]
+            self.known_blocks[key] = (block_group, bbox)
+            bpy.context.screen.scene = scene
         else:
-            bbox = self.known_blocks[name][2]
+            block_group, bbox = self.known_blocks[key]
 
-        bpy.context.screen.scene = scene
         o = bbox.copy()
         # o.empty_display_size = 0.3
         o.instance_type = "COLLECTION"
@@ -1027,11 +1009,7 @@ class Do:
         aunits = self.dwg.header.get('$AUNITS', 0)
 
         # check if group instances are needed
-        kids = sum(1 for i in self.dwg.blocks[entity.name] if i.dxftype == "INSERT")
-        sep = sum(1 for sep in self.dwg.blocks[entity.name] if is_.separated_entity(sep))
-        objtypes = sum(1 for ot, ens in groupsort.by_blender_type(en for en in self.dwg.blocks[entity.name]
-                                                                  if is_.combined_entity(en))
-                       if ot in {"object_mesh", "object_curve"})
+        kids, sep, objtypes = self._block_contents(entity.name)
         if need_group_inst is None:
             need_group_inst = (entity.row_count or entity.col_count) > 1 and \
                               (kids > 0 or objtypes > 1 or sep > 1 or (objtypes > 0 and sep > 0))
@@ -1094,6 +1072,60 @@ class Do:
 
         return o
 
+    def _block_contents(self, name):
+        """
+        name: name of a DXF block
+        Returns the number of INSERTs, of separated entities and of mesh and curve object types in the block, counted
+        once per block.
+        """
+        contents = self.block_contents.get(name)
+        if contents is None:
+            block = self.dwg.blocks[name]
+            kids = sum(1 for i in block if i.dxftype == "INSERT")
+            sep = sum(1 for sep in block if is_.separated_entity(sep))
+            objtypes = sum(1 for ot, ens in groupsort.by_blender_type(en for en in block if is_.combined_entity(en))
+                           if ot in {"object_mesh", "object_curve"})
+            contents = self.block_contents[name] = (kids, sep, objtypes)
+        return contents
+
+    def _object_tree(self, obj):
+        """
+        Returns the object tree (see _copy_object_tree()) of template copies of obj and its children, to be linked to
+        the group.
+        """
+        return self._template(obj), [self._object_tree(child) for child in obj.children], True
+
+    def _template(self, obj):
+        """
+        Returns an unlinked copy of obj (sharing its data) to be stored in an object tree, so that later changes to
+        obj do not affect further copies. It has no parent, otherwise it would be one of the children of obj.parent.
+        """
+        template = obj.copy()
+        template.parent = None
+        return template
+
+    def _copy_object_tree(self, tree, parent, scene, group, invisible=None):
+        """
+        tree: (object, list of object trees of its children, boolean to link it to the group)
+        parent: parent of the copy or None
+        group: Blender group of type (bpy_types.Collection)
+        invisible: boolean to control the visibility of the copies
+        Links copies of all objects of the tree to the scene (and group), sharing the data of the objects (Linked
+        Blender Objects), and returns the copy of the root object. Only the transformation of the returned object
+        has to be set for a new INSERT.
+        """
+        obj, children, grouped = tree
+        copy = obj.copy()
+        copy.parent = parent
+        scene.collection.objects.link(copy)
+        if grouped:  # a new copy is in no group yet
+            group.objects.link(copy)
+        if invisible is not None:
+            copy.hide_viewport = bool(invisible)
+        for child in children:
+            self._copy_object_tree(child, copy, scene, group, invisible)
+        return copy
+
     """ COMBINED BLENDER OBJECT FROM GEOMETRY DXF TYPES """
     # type(self, dxf entities, object name string)
     #     returns blender object
@@ -1342,10 +1374,8 @@ class Do:
         name: name of group (String)
         Finds group by name or creates it if it does not exist.
         """
-        groups = bpy.data.collections
-        if name in groups.keys():
-            group = groups[name]
-        else:
+        group = bpy.data.collections.get(name)
+        if group is None:
             group = bpy.data.collections.new(name)
         return group
 
@@ -1471,19 +1501,32 @@ class Do:
         o.instance_faces_scale = f
 
     def _nest_block(self, parent, name, blgroup, scene):
+        """
+        Parents an empty with the objects of the block `name` and of its nested blocks to parent. The block is
+        converted once, further calls link copies of its object tree (see _copy_object_tree()).
+        """
+        key = (name, BY_BLOCK)
+        if key in self.known_blocks:
+            self._copy_object_tree(self.known_blocks[key], parent, scene, blgroup)
+            return
+
         b = self.dwg.blocks[name]
         e = bpy.data.objects.new(name, None)
         scene.collection.objects.link(e)
         #e.location = parent.location
         e.parent = parent
+        children = []
         for TYPE, grouped in groupsort.by_dxftype(b):
             if TYPE == "INSERT":
                 for en in grouped:
                     self._nest_block(e, en.name, blgroup, scene)
+                    children.append(self.known_blocks[(en.name, BY_BLOCK)])
             else:
                 o = self._call_object_types(TYPE, grouped, blgroup, name+"_"+TYPE, scene)
                 #o.location = e.location
                 o.parent = e
+                children.append((self._template(o), [], True))
+        self.known_blocks[key] = (self._template(e), children, False)
 
     def combined_objects(self, entities, scene, override_name=None, override_group=None):
         """
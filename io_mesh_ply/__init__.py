@@ -46,7 +46,9 @@ from bpy.props import (
     CollectionProperty,
     StringProperty,
     BoolProperty,
+    EnumProperty,
     FloatProperty,
+    IntProperty,
 )
 from bpy_extras.io_utils import (
     ImportHelper,
@@ -75,6 +77,35 @@ class ImportPLY(bpy.types.Operator, ImportHelper):
     filename_ext = ".ply"
     filter_glob: StringProperty(default="*.ply", options={'HIDDEN'})
 
+    use_point_cloud: BoolProperty(
+        name="Point Cloud",
+        description=(
+            "Only import vertices (streamed from the file), "
+            "with their properties as point attributes"
+        ),
+        default=False,
+    )
+    point_decimate: EnumProperty(
+        name="Decimate",
+        description="Reduce the number of imported points",
+        items=(
+            ('NONE', "None", "Import all points"),
+            ('STEP', "Every Nth", "Import one point out of Step ones"),
+            ('VOXEL', "Voxel Grid", "Import one point per cell of a grid of Voxel Size"),
+        ),
+        default='NONE',
+    )
+    point_step: IntProperty(
+        name="Step",
+        min=1, max=1000000,
+        default=10,
+    )
+    point_voxel_size: FloatProperty(
+        name="Voxel Size",
+        min=0.0001, max=1000.0,
+        default=0.1,
+    )
+
     def execute(self, context):
         import os
 
@@ -85,8 +116,11 @@ class ImportPLY(bpy.types.Operator, ImportHelper):
 
         from . import import_ply
 
+        point_step = self.point_step if self.point_decimate == 'STEP' else 1
+        point_voxel_size = self.point_voxel_size if self.point_decimate == 'VOXEL' else 0.0
+
         for path in paths:
-            import_ply.load(self, context, path)
+            import_ply.load(self, context, path, self.use_point_cloud, point_step, point_voxel_size)
 
         return {'FINISHED'}
 
@@ -100,6 +134,14 @@ class ExportPLY(bpy.types.Operator, ExportHelper):
     filename_ext = ".ply"
     filter_glob: StringProperty(default="*.ply", options={'HIDDEN'})
 
+    use_ascii: BoolProperty(
+        name="ASCII",
+        description=(
+            "Export using ASCII file format, "
+            "otherwise use (much faster) binary"
+        ),
+        default=True,
+    )
     use_selection: BoolProperty(
         name="Selection Only",
         description="Export selected objects only",
@@ -237,6 +279,7 @@ class PLY_PT_export_geometry(bpy.types.Panel):
         sfile = context.space_data
         operator = sfile.active_operator
 
+        layout.prop(operator, "use_ascii")
         layout.prop(operator, "use_mesh_modifiers")
         layout.prop(operator, "use_normals")
         layout.prop(operator, "use_uv_coords")
@@ -24,15 +24,10 @@ colors, and texture coordinates per face or per vertex.
 """
 
 
-def save_mesh(filepath, mesh, use_normals=True, use_uv_coords=True, use_colors=True):
+def save_mesh(filepath, mesh, use_ascii=True, use_normals=True, use_uv_coords=True, use_colors=True):
     import os
     import bpy
-
-    def rvec3d(v):
-        return round(v[0], 6), round(v[1], 6), round(v[2], 6)
-
-    def rvec2d(v):
-        return round(v[0], 6), round(v[1], 6)
+    import numpy as np
 
     if use_uv_coords and mesh.uv_layers:
         active_uv_layer = mesh.uv_layers.active.data
@@ -44,140 +39,227 @@ def save_mesh(filepath, mesh, use_normals=True, use_uv_coords=True, use_colors=T
     else:
         use_colors = False
 
-    # in case
-    color = uvcoord = uvcoord_key = normal = normal_key = None
-
     mesh_verts = mesh.vertices
-    # vdict = {} # (index, normal, uv) -> new index
-    vdict = [{} for i in range(len(mesh_verts))]
-    ply_verts = []
-    ply_faces = [[] for f in range(len(mesh.polygons))]
-    vert_count = 0
-
-    for i, f in enumerate(mesh.polygons):
-
-        smooth = not use_normals or f.use_smooth
-        if not smooth:
-            normal = f.normal[:]
-            normal_key = rvec3d(normal)
+    mesh_polys = mesh.polygons
+    num_verts = len(mesh_verts)
+    num_polys = len(mesh_polys)
+    num_loops = len(mesh.loops)
+
+    vert_co = np.empty(num_verts * 3, dtype=np.float32)
+    mesh_verts.foreach_get("co", vert_co)
+    vert_co.shape = (num_verts, 3)
+
+    poly_loop_start = np.empty(num_polys, dtype=np.int32)
+    poly_loop_total = np.empty(num_polys, dtype=np.int32)
+    mesh_polys.foreach_get("loop_start", poly_loop_start)
+    mesh_polys.foreach_get("loop_total", poly_loop_total)
+
+    # Loop indices in polygons order.
+    poly_loop_offset = np.cumsum(poly_loop_total) - poly_loop_total
+    loop_poly = np.repeat(np.arange(num_polys), poly_loop_total)
+    loops = poly_loop_start[loop_poly] + (np.arange(len(loop_poly)) - poly_loop_offset[loop_poly])
+
+    loop_vert = np.empty(num_loops, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_vert)
+    loop_vert = loop_vert[loops]
+
+    # Split vertices: a new PLY vertex for each different (vertex, normal, uv, color) key,
+    # numbered in order of first use, with (rounded) float keys stored as float64 columns.
+    ply_verts = {}
+    keys = [loop_vert[:, None].astype(np.float64)]
 
-        if use_uv_coords:
-            uv = [
-                active_uv_layer[l].uv[:]
-                for l in range(f.loop_start, f.loop_start + f.loop_total)
-            ]
-        if use_colors:
-            col = [
-                active_col_layer[l].color[:]
-                for l in range(f.loop_start, f.loop_start + f.loop_total)
-            ]
-
-        pf = ply_faces[i]
-        for j, vidx in enumerate(f.vertices):
-            v = mesh_verts[vidx]
-
-            if smooth:
-                normal = v.normal[:]
-                normal_key = rvec3d(normal)
-
-            if use_uv_coords:
-                uvcoord = uv[j][0], uv[j][1]
-                uvcoord_key = rvec2d(uvcoord)
-
-            if use_colors:
-                color = col[j]
-                color = (
-                    int(color[0] * 255.0),
-                    int(color[1] * 255.0),
-                    int(color[2] * 255.0),
-                    int(color[3] * 255.0),
-                )
-            key = normal_key, uvcoord_key, color
-
-            vdict_local = vdict[vidx]
-            pf_vidx = vdict_local.get(key)  # Will be None initially
-
-            if pf_vidx is None:  # Same as vdict_local.has_key(key)
-                pf_vidx = vdict_local[key] = vert_count
-                ply_verts.append((vidx, normal, uvcoord, color))
-                vert_count += 1
-
-            pf.append(pf_vidx)
-
-    with open(filepath, "w", encoding="utf-8", newline="\n") as file:
+    if use_normals:
+        vert_normal = np.empty(num_verts * 3, dtype=np.float32)
+        mesh_verts.foreach_get("normal", vert_normal)
+        poly_normal = np.empty(num_polys * 3, dtype=np.float32)
+        mesh_polys.foreach_get("normal", poly_normal)
+        poly_smooth = np.empty(num_polys, dtype=bool)
+        mesh_polys.foreach_get("use_smooth", poly_smooth)
+
+        normal = vert_normal.reshape(-1, 3)[loop_vert]
+        flat = ~poly_smooth[loop_poly]
+        normal[flat] = poly_normal.reshape(-1, 3)[loop_poly[flat]]
+        ply_verts["normal"] = normal
+        keys.append(np.round(normal.astype(np.float64), 6))
+
+    if use_uv_coords:
+        uv = np.empty(num_loops * 2, dtype=np.float32)
+        active_uv_layer.foreach_get("uv", uv)
+        uv = uv.reshape(-1, 2)[loops]
+        ply_verts["uv"] = uv
+        keys.append(np.round(uv.astype(np.float64), 6))
+
+    if use_colors:
+        color = np.empty(num_loops * 4, dtype=np.float32)
+        active_col_layer.foreach_get("color", color)
+        color = (color.reshape(-1, 4)[loops].astype(np.float64) * 255.0).astype(np.int64)
+        ply_verts["color"] = color
+        keys.append(color.astype(np.float64))
+
+    # + 0.0 so that -0.0 and 0.0 are the same key.
+    keys = np.ascontiguousarray(np.hstack(keys) + 0.0)
+    keys = keys.view(np.dtype((np.void, keys.dtype.itemsize * keys.shape[1]))).ravel()
+    keys, first_loop, loop_ply_vert = np.unique(keys, return_index=True, return_inverse=True)
+    order = np.argsort(first_loop)
+    first_loop = first_loop[order]
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    loop_ply_vert = rank[loop_ply_vert.reshape(-1)]
+    del keys, order, rank
+
+    ply_co = vert_co[loop_vert[first_loop]]
+    ply_verts = {name: values[first_loop] for name, values in ply_verts.items()}
+
+    with open(filepath, "wb") as file:
         fw = file.write
 
         # Header
         # ---------------------------
 
-        fw("ply\n")
-        fw("format ascii 1.0\n")
+        fw(b"ply\n")
+        if use_ascii:
+            fw(b"format ascii 1.0\n")
+        else:
+            fw(b"format binary_little_endian 1.0\n")
         fw(
             f"comment Created by Blender {bpy.app.version_string} - "
             f"www.blender.org, source file: {os.path.basename(bpy.data.filepath)!r}\n"
+            .encode("utf-8")
         )
 
-        fw(f"element vertex {len(ply_verts)}\n")
+        fw(b"element vertex %d\n" % len(ply_co))
         fw(
-            "property float x\n"
-            "property float y\n"
-            "property float z\n"
+            b"property float x\n"
+            b"property float y\n"
+            b"property float z\n"
         )
         if use_normals:
             fw(
-                "property float nx\n"
-                "property float ny\n"
-                "property float nz\n"
+                b"property float nx\n"
+                b"property float ny\n"
+                b"property float nz\n"
             )
         if use_uv_coords:
             fw(
-                "property float s\n"
-                "property float t\n"
+                b"property float s\n"
+                b"property float t\n"
             )
         if use_colors:
             fw(
-                "property uchar red\n"
-                "property uchar green\n"
-                "property uchar blue\n"
-                "property uchar alpha\n"
+                b"property uchar red\n"
+                b"property uchar green\n"
+                b"property uchar blue\n"
+                b"property uchar alpha\n"
             )
 
-        fw(f"element face {len(mesh.polygons)}\n")
-        fw("property list uchar uint vertex_indices\n")
+        fw(b"element face %d\n" % num_polys)
+        fw(b"property list uchar uint vertex_indices\n")
 
-        fw("end_header\n")
+        fw(b"end_header\n")
 
-        # Vertex data
-        # ---------------------------
-
-        for i, v in enumerate(ply_verts):
-            fw("%.6f %.6f %.6f" % mesh_verts[v[0]].co[:])
-            if use_normals:
-                fw(" %.6f %.6f %.6f" % v[1])
-            if use_uv_coords:
-                fw(" %.6f %.6f" % v[2])
-            if use_colors:
-                fw(" %u %u %u %u" % v[3])
-            fw("\n")
-
-        # Face data
-        # ---------------------------
-
-        for pf in ply_faces:
-            fw(f"{len(pf)}")
-            for v in pf:
-                fw(f" {v}")
-            fw("\n")
+        if use_ascii:
+            _write_ascii(fw, ply_co, ply_verts, poly_loop_total, loop_ply_vert)
+        else:
+            _write_binary(file, ply_co, ply_verts, poly_loop_total, loop_ply_vert)
 
         print(f"Writing {filepath!r} done")
 
     return {'FINISHED'}
 
 
+# Number of vertices or faces formatted at once in ASCII files.
+ASCII_CHUNK_SIZE = 1 << 16
+
+
+def _write_ascii(fw, ply_co, ply_verts, poly_loop_total, loop_ply_vert):
+    import numpy as np
+
+    # Vertex data
+    # ---------------------------
+
+    fmt = "%.6f %.6f %.6f"
+    columns = [ply_co]
+    if "normal" in ply_verts:
+        fmt += " %.6f %.6f %.6f"
+        columns.append(ply_verts["normal"])
+    if "uv" in ply_verts:
+        fmt += " %.6f %.6f"
+        columns.append(ply_verts["uv"])
+    if "color" in ply_verts:
+        fmt += " %u %u %u %u"
+        columns.append(ply_verts["color"])
+    fmt += "\n"
+
+    for start in range(0, len(ply_co), ASCII_CHUNK_SIZE):
+        end = start + ASCII_CHUNK_SIZE
+        rows = np.hstack([col[start:end].astype(np.float64) for col in columns]).tolist()
+        fw("".join([fmt % tuple(row) for row in rows]).encode("ascii"))
+
+    # Face data
+    # ---------------------------
+
+    poly_loop_end = np.cumsum(poly_loop_total)
+    for start in range(0, len(poly_loop_end), ASCII_CHUNK_SIZE):
+        loop_end = poly_loop_end[start:start + ASCII_CHUNK_SIZE].tolist()
+        loop_offset = loop_start = loop_end[0] - int(poly_loop_total[start])
+        poly_ply_verts = loop_ply_vert[loop_offset:loop_end[-1]].tolist()
+        lines = []
+        for end in loop_end:
+            pf = poly_ply_verts[loop_start - loop_offset:end - loop_offset]
+            lines.append(" ".join(map(str, [len(pf)] + pf)))
+            loop_start = end
+        lines.append("")
+        fw("\n".join(lines).encode("ascii"))
+
+
+def _write_binary(file, ply_co, ply_verts, poly_loop_total, loop_ply_vert):
+    import numpy as np
+
+    # Vertex data
+    # ---------------------------
+
+    fields = [("co", "<f4", (3,))]
+    if "normal" in ply_verts:
+        fields.append(("normal", "<f4", (3,)))
+    if "uv" in ply_verts:
+        fields.append(("uv", "<f4", (2,)))
+    if "color" in ply_verts:
+        fields.append(("color", "u1", (4,)))
+
+    data = np.empty(len(ply_co), dtype=np.dtype(fields))
+    data["co"] = ply_co
+    for name, values in ply_verts.items():
+        data[name] = np.clip(values, 0, 255) if name == "color" else values
+    data.tofile(file)
+    del data
+
+    # Face data
+    # ---------------------------
+
+    # Each face is an uchar vertex count followed by uint indices (unaligned, so built as bytes).
+    poly_loop_total = poly_loop_total.astype(np.int64)
+    if len(poly_loop_total) and np.all(poly_loop_total == poly_loop_total[0]):
+        # Fast path for meshes with a single kind of polygons (e.g. all triangles).
+        num_indices = poly_loop_total[0]
+        data = np.empty(len(poly_loop_total), dtype=np.dtype([("count", "u1"), ("indices", "<u4", (num_indices,))]))
+        data["count"] = num_indices
+        data["indices"] = loop_ply_vert.reshape(-1, num_indices)
+    else:
+        # Byte offsets: each face and each index come after all previous counts (1 byte) and indices (4 bytes).
+        poly_index = np.arange(len(poly_loop_total))
+        poly_offset = poly_index + 4 * (np.cumsum(poly_loop_total) - poly_loop_total)
+        loop_offset = 4 * np.arange(len(loop_ply_vert)) + np.repeat(poly_index, poly_loop_total) + 1
+        data = np.empty(len(poly_loop_total) + 4 * len(loop_ply_vert), dtype=np.uint8)
+        data[poly_offset] = poly_loop_total
+        data[loop_offset[:, None] + np.arange(4)] = loop_ply_vert.astype("<u4").view(np.uint8).reshape(-1, 4)
+    data.tofile(file)
+
+
 def save(
     operator,
     context,
     filepath="",
+    use_ascii=True,
     use_selection=False,
     use_mesh_modifiers=True,
     use_normals=True,
@@ -227,6 +309,7 @@ def save(
     ret = save_mesh(
         filepath,
         mesh,
+        use_ascii=use_ascii,
         use_normals=use_normals,
         use_uv_coords=use_uv_coords,
         use_colors=use_colors,
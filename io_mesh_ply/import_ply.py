@@ -42,6 +42,155 @@ class ElementSpec:
                 return i
         return -1
 
+    def list_property_name(self, name):
+        """
+        Return given list property name if present, else b'vertex_index' (commonly used instead of b'vertex_indices'),
+        else the name of the last list property (None if there is none).
+        """
+        names = [p.name for p in self.properties if p.list_type is not None]
+        for n in (name, b'vertex_index'):
+            if n in names:
+                return n
+        return names[-1] if names else None
+
+    def load_np(self, format, stream, count=None):
+        """
+        Load *count* elements (all by default) at once, return a dict {property name: values}.
+
+        Values of scalar properties are numpy arrays, values of list properties are (lengths, values)
+        tuples of numpy arrays (values being all lists concatenated).
+
+        Whole blocks of elements are read with a single numpy call when possible, i.e. when the element
+        has no string property and its lists all have the same length (e.g. only triangles).
+        Other elements are loaded one by one.
+        """
+        import numpy as np
+
+        if count is None:
+            count = self.count
+
+        if count and not any('s' in (p.list_type, p.numeric_type) for p in self.properties):
+            if format == b'ascii':
+                data = self._load_np_ascii(stream, count)
+            else:
+                data = self._load_np_binary(format, stream, count)
+            if data is not None:
+                return data
+
+        rows = [self.load(format, stream) for j in range(count)]
+        data = {}
+        for i, prop in enumerate(self.properties):
+            if prop.list_type is None:
+                data[prop.name] = np.array([row[i] for row in rows], dtype=_numpy_type(prop.numeric_type))
+            else:
+                lengths = np.array([len(row[i]) for row in rows], dtype=np.int64)
+                values = np.fromiter((v for row in rows for v in row[i]), dtype=_numpy_type(prop.numeric_type),
+                                     count=int(lengths.sum()))
+                data[prop.name] = (lengths, values)
+        return data
+
+    def _dtype(self, format, list_lengths):
+        """
+        Structured numpy type of one element, lists having given lengths.
+        """
+        import numpy as np
+
+        fields = []
+        for i, prop in enumerate(self.properties):
+            if prop.list_type is not None:
+                fields.append(('l%d' % i, format + prop.list_type))
+                fields.append(('p%d' % i, format + prop.numeric_type, (list_lengths[i],)))
+            else:
+                fields.append(('p%d' % i, format + prop.numeric_type))
+        return np.dtype(fields)
+
+    def _fixed_data(self, elems, list_lengths):
+        """
+        Return the data dict of a structured array of elements (all lists having given lengths),
+        or None if some lists do not have the expected length.
+        """
+        import numpy as np
+
+        data = {}
+        for i, prop in enumerate(self.properties):
+            values = elems['p%d' % i]
+            if prop.list_type is not None:
+                if not np.all(elems['l%d' % i] == list_lengths[i]):
+                    return None
+                lengths = np.full(len(elems), list_lengths[i], dtype=np.int64)
+                data[prop.name] = (lengths, values.reshape(-1))
+            else:
+                data[prop.name] = values
+        return data
+
+    def _load_np_binary(self, format, stream, count):
+        import struct
+        import numpy as np
+
+        start = stream.tell()
+
+        # Guess lists lengths from the first element.
+        list_lengths = {}
+        for i, prop in enumerate(self.properties):
+            if prop.list_type is not None:
+                list_lengths[i] = int(prop.read_format(format, 1, prop.list_type, stream)[0])
+                stream.seek(struct.calcsize(format + prop.numeric_type) * list_lengths[i], 1)
+            else:
+                stream.seek(struct.calcsize(format + prop.numeric_type), 1)
+        stream.seek(start)
+
+        dtype = self._dtype(format, list_lengths)
+        buf = stream.read(dtype.itemsize * count)
+        if len(buf) == dtype.itemsize * count:
+            data = self._fixed_data(np.frombuffer(buf, dtype=dtype), list_lengths)
+            if data is not None:
+                return data
+
+        # Lists of different lengths, load elements one by one.
+        stream.seek(start)
+        return None
+
+    def _load_np_ascii(self, stream, count):
+        import numpy as np
+
+        start = stream.tell()
+        lines = b''.join(stream.readline() for j in range(count))
+
+        # Guess lists lengths from the first element.
+        list_lengths = {}
+        first = lines[:lines.find(b'\n')].split()
+        idx = 0
+        for i, prop in enumerate(self.properties):
+            if prop.list_type is not None:
+                if idx >= len(first):
+                    break
+                list_lengths[i] = int(first[idx])
+                idx += 1 + list_lengths[i]
+            else:
+                idx += 1
+        else:
+            values = np.fromstring(lines, dtype=np.float64, sep=' ')
+            if len(first) == idx and len(values) == idx * count:
+                values = values.reshape(count, idx)
+                elems = np.empty(count, dtype=self._dtype('=', list_lengths))
+                col = 0
+                for i, prop in enumerate(self.properties):
+                    if prop.list_type is not None:
+                        elems['l%d' % i] = values[:, col]
+                        col += 1
+                        elems['p%d' % i] = values[:, col:col + list_lengths[i]]
+                        col += list_lengths[i]
+                    else:
+                        elems['p%d' % i] = values[:, col]
+                        col += 1
+                data = self._fixed_data(elems, list_lengths)
+                if data is not None:
+                    return data
+
+        # Lists of different lengths (or invalid data), load elements one by one.
+        stream.seek(start)
+        return None
+
 
 class PropertySpec:
     __slots__ = (
@@ -102,6 +251,42 @@ class PropertySpec:
             return self.read_format(format, 1, self.numeric_type, stream)[0]
 
 
+POINTS_CHUNK_SIZE = 1 << 20
+# Bits per axis of voxel-grid cell indices packed into a single int64.
+VOXEL_PACK_BITS = 21
+
+
+def _voxel_keys_pack(keys):
+    """
+    Pack (N, 3) int64 cell indices into N int64 (much faster to sort than void keys),
+    indices must be within the VOXEL_PACK_BITS signed range.
+    """
+    offset = 1 << (VOXEL_PACK_BITS - 1)
+    keys = keys + offset
+    return (keys[:, 0] << (2 * VOXEL_PACK_BITS)) | (keys[:, 1] << VOXEL_PACK_BITS) | keys[:, 2]
+
+
+def _voxel_keys_unpack(keys):
+    import numpy as np
+    offset = 1 << (VOXEL_PACK_BITS - 1)
+    mask = (1 << VOXEL_PACK_BITS) - 1
+    return np.column_stack((keys >> (2 * VOXEL_PACK_BITS), (keys >> VOXEL_PACK_BITS) & mask, keys & mask)) - offset
+
+
+def _voxel_keys_void(keys):
+    """
+    (N, 3) int64 cell indices as N (sortable) void scalars.
+    """
+    import numpy as np
+    keys = np.ascontiguousarray(keys)
+    return keys.view(np.dtype((np.void, keys.dtype.itemsize * 3))).ravel()
+
+
+def _numpy_type(num_type):
+    import numpy as np
+    return np.dtype('=' + num_type)
+
+
 class ObjectSpec:
     __slots__ = ("specs",)
 
@@ -112,20 +297,18 @@ class ObjectSpec:
     def load(self, format, stream):
         return dict([(i.name, [i.load(format, stream) for j in range(i.count)]) for i in self.specs])
 
-        # Longhand for above LC
+    def load_np(self, format, stream):
         """
-        answer = {}
-        for i in self.specs:
-            answer[i.name] = []
-            for j in range(i.count):
-                if not j % 100 and meshtools.show_progress:
-                    Blender.Window.DrawProgressBar(float(j) / i.count, 'Loading ' + i.name)
-                answer[i.name].append(i.load(format, stream))
-        return answer
+        Load all elements, return a dict {element name: {property name: values}} (see ElementSpec.load_np).
         """
+        return dict([(i.name, i.load_np(format, stream)) for i in self.specs])
 
 
-def read(filepath):
+def read_header(plyf):
+    """
+    Parse the header of given (binary mode) PLY file, leaving it at the start of the body.
+    Return (obj_spec, format, texture), format being the struct byte order or b'ascii'.
+    """
     import re
 
     format = b''
@@ -158,75 +341,144 @@ def read(filepath):
     obj_spec = ObjectSpec()
     invalid_ply = (None, None, None)
 
-    with open(filepath, 'rb') as plyf:
-        signature = plyf.readline()
-
-        if not signature.startswith(b'ply'):
-            print("Signature line was invalid")
-            return invalid_ply
+    signature = plyf.readline()
 
-        valid_header = False
-        for line in plyf:
-            tokens = re.split(br'[ \r\n]+', line)
+    if not signature.startswith(b'ply'):
+        print("Signature line was invalid")
+        return invalid_ply
 
-            if len(tokens) == 0:
-                continue
-            if tokens[0] == b'end_header':
-                valid_header = True
-                break
-            elif tokens[0] == b'comment':
-                if len(tokens) < 2:
-                    continue
-                elif tokens[1] == b'TextureFile':
-                    if len(tokens) < 4:
-                        print("Invalid texture line")
-                    else:
-                        texture = tokens[2]
-                continue
+    valid_header = False
+    for line in plyf:
+        tokens = re.split(br'[ \r\n]+', line)
 
-            elif tokens[0] == b'obj_info':
+        if len(tokens) == 0:
+            continue
+        if tokens[0] == b'end_header':
+            valid_header = True
+            break
+        elif tokens[0] == b'comment':
+            if len(tokens) < 2:
                 continue
-            elif tokens[0] == b'format':
-                if len(tokens) < 3:
-                    print("Invalid format line")
-                    return invalid_ply
-                if tokens[1] not in format_specs:
-                    print("Unknown format", tokens[1])
-                    return invalid_ply
-                try:
-                    version_test = float(tokens[2])
-                except Exception as ex:
-                    print("Unknown version", ex)
-                    version_test = None
-                if version_test != float(version):
-                    print("Unknown version", tokens[2])
-                    return invalid_ply
-                del version_test
-                format = tokens[1]
-            elif tokens[0] == b'element':
-                if len(tokens) < 3:
-                    print("Invalid element line")
-                    return invalid_ply
-                obj_spec.specs.append(ElementSpec(tokens[1], int(tokens[2])))
-            elif tokens[0] == b'property':
-                if not len(obj_spec.specs):
-                    print("Property without element")
-                    return invalid_ply
-                if tokens[1] == b'list':
-                    obj_spec.specs[-1].properties.append(PropertySpec(tokens[4], type_specs[tokens[2]], type_specs[tokens[3]]))
+            elif tokens[1] == b'TextureFile':
+                if len(tokens) < 4:
+                    print("Invalid texture line")
                 else:
-                    obj_spec.specs[-1].properties.append(PropertySpec(tokens[2], None, type_specs[tokens[1]]))
-        if not valid_header:
-            print("Invalid header ('end_header' line not found!)")
-            return invalid_ply
+                    texture = tokens[2]
+            continue
+
+        elif tokens[0] == b'obj_info':
+            continue
+        elif tokens[0] == b'format':
+            if len(tokens) < 3:
+                print("Invalid format line")
+                return invalid_ply
+            if tokens[1] not in format_specs:
+                print("Unknown format", tokens[1])
+                return invalid_ply
+            try:
+                version_test = float(tokens[2])
+            except Exception as ex:
+                print("Unknown version", ex)
+                version_test = None
+            if version_test != float(version):
+                print("Unknown version", tokens[2])
+                return invalid_ply
+            del version_test
+            format = tokens[1]
+        elif tokens[0] == b'element':
+            if len(tokens) < 3:
+                print("Invalid element line")
+                return invalid_ply
+            obj_spec.specs.append(ElementSpec(tokens[1], int(tokens[2])))
+        elif tokens[0] == b'property':
+            if not len(obj_spec.specs):
+                print("Property without element")
+                return invalid_ply
+            if tokens[1] == b'list':
+                obj_spec.specs[-1].properties.append(PropertySpec(tokens[4], type_specs[tokens[2]], type_specs[tokens[3]]))
+            else:
+                obj_spec.specs[-1].properties.append(PropertySpec(tokens[2], None, type_specs[tokens[1]]))
+    if not valid_header:
+        print("Invalid header ('end_header' line not found!)")
+        return invalid_ply
 
-        obj = obj_spec.load(format_specs[format], plyf)
+    return obj_spec, format_specs[format], texture
+
+
+def read(filepath):
+    with open(filepath, 'rb') as plyf:
+        obj_spec, format, texture = read_header(plyf)
+        if obj_spec is None:
+            return None, None, None
+
+        # Each block of elements is read from the file at once, numpy arrays being views on it when possible
+        # (so that the body is only held once in memory).
+        obj = obj_spec.load_np(format, plyf)
 
     return obj_spec, obj, texture
 
 
+def read_points(filepath, step=1, voxel_size=0.0, chunk_size=POINTS_CHUNK_SIZE):
+    """
+    Yield the vertices of given PLY file by chunks of (at most) *chunk_size* elements,
+    as dicts {property name: values} (list properties are skipped).
+    Other elements (e.g. faces) are not loaded, unless they come before the vertices in the file.
+
+    Points may be decimated while streaming, keeping only one out of *step* vertices,
+    and/or only the first vertex of each cell of a grid of *voxel_size* size.
+    """
+    import numpy as np
+
+    with open(filepath, 'rb') as plyf:
+        obj_spec, format, texture = read_header(plyf)
+        if obj_spec is None:
+            return
+
+        for el in obj_spec.specs:
+            if el.name == b'vertex':
+                break
+            el.load_np(format, plyf)
+        else:
+            print("No vertex element")
+            return
+
+        # Sorted keys of all cells already having a point, in voxel-grid mode.
+        voxels = None
+        use_packed_voxels = True
+
+        for start in range(0, el.count, chunk_size):
+            data = el.load_np(format, plyf, min(chunk_size, el.count - start))
+            data = {name: values for name, values in data.items() if not isinstance(values, tuple)}
+            if step > 1:
+                # Copy, so that the whole chunk is not kept alive by these views.
+                data = {name: values[(-start) % step::step].copy() for name, values in data.items()}
+            if voxel_size > 0.0 and data and len(data[b'x']):
+                co = np.column_stack((data[b'x'], data[b'y'], data[b'z'])).astype(np.float64)
+                keys = np.floor(co / voxel_size).astype(np.int64)
+                if use_packed_voxels and np.abs(keys).max() < (1 << (VOXEL_PACK_BITS - 1)):
+                    keys = _voxel_keys_pack(keys)
+                else:
+                    if use_packed_voxels and voxels is not None:
+                        voxels = np.sort(_voxel_keys_void(_voxel_keys_unpack(voxels)))
+                    use_packed_voxels = False
+                    keys = _voxel_keys_void(keys)
+                keys, keep = np.unique(keys, return_index=True)
+                if voxels is None:
+                    voxels = keys
+                else:
+                    pos = np.searchsorted(voxels, keys)
+                    new = voxels[np.minimum(pos, len(voxels) - 1)] != keys
+                    new |= pos == len(voxels)
+                    keys, keep = keys[new], keep[new]
+                    voxels = np.sort(np.concatenate((voxels, keys)))
+                keep.sort()
+                data = {name: values[keep] for name, values in data.items()}
+            yield data
+
+
 def load_ply_mesh(filepath, ply_name):
     import bpy
+    import numpy as np
 
     obj_spec, obj, texture = read(filepath)
     # XXX28: use texture
@@ -236,17 +488,18 @@ def load_ply_mesh(filepath, ply_name):
 
     uvindices = colindices = None
     colmultiply = None
+    findex = trindex = None
 
     # TODO import normals
     # noindices = None
 
     for el in obj_spec.specs:
         if el.name == b'vertex':
-            vindices_x, vindices_y, vindices_z = el.index(b'x'), el.index(b'y'), el.index(b'z')
+            vindices_x, vindices_y, vindices_z = b'x', b'y', b'z'
             # noindices = (el.index('nx'), el.index('ny'), el.index('nz'))
             # if -1 in noindices: noindices = None
-            uvindices = (el.index(b's'), el.index(b't'))
-            if -1 in uvindices:
+            uvindices = (b's', b't')
+            if -1 in map(el.index, uvindices):
                 uvindices = None
             # ignore alpha if not present
             if el.index(b'alpha') == -1:
@@ -259,115 +512,86 @@ def load_ply_mesh(filepath, ply_name):
                 colindices = None
             else:  # if not a float assume uchar
                 colmultiply = [1.0 if el.properties[i].numeric_type in {'f', 'd'} else (1.0 / 255.0) for i in colindices]
+                colindices = [el.properties[i].name for i in colindices]
 
         elif el.name == b'face':
-            findex = el.index(b'vertex_indices')
+            findex = el.list_property_name(b'vertex_indices')
         elif el.name == b'tristrips':
-            trindex = el.index(b'vertex_indices')
+            trindex = el.list_property_name(b'vertex_indices')
         elif el.name == b'edge':
-            eindex1, eindex2 = el.index(b'vertex1'), el.index(b'vertex2')
+            eindex1, eindex2 = b'vertex1', b'vertex2'
 
-    mesh_faces = []
-    mesh_uvs = []
-    mesh_colors = []
-
-    def add_face(vertices, indices, uvindices, colindices):
-        mesh_faces.append(indices)
-        if uvindices:
-            mesh_uvs.extend([(vertices[index][uvindices[0]], vertices[index][uvindices[1]]) for index in indices])
-        if colindices:
-            if len(colindices) == 3:
-                mesh_colors.extend([
-                    (
-                       vertices[index][colindices[0]] * colmultiply[0],
-                       vertices[index][colindices[1]] * colmultiply[1],
-                       vertices[index][colindices[2]] * colmultiply[2],
-                       1.0
-                    )
-                    for index in indices
-                ])
-            elif len(colindices) == 4:
-                mesh_colors.extend([
-                    (
-                       vertices[index][colindices[0]] * colmultiply[0],
-                       vertices[index][colindices[1]] * colmultiply[1],
-                       vertices[index][colindices[2]] * colmultiply[2],
-                       vertices[index][colindices[3]] * colmultiply[3],
-                    )
-                    for index in indices
-                ])
+    verts = obj[b'vertex']
+    faces_lengths = []
+    faces_indices = []
+
+    if findex is not None:
+        lengths, indices = obj[b'face'][findex]
+        faces_lengths.append(lengths)
+        faces_indices.append(indices)
+
+    if trindex is not None:
+        lengths, indices = obj[b'tristrips'][trindex]
+        strip_end = np.cumsum(lengths)
+        for start, end in zip((strip_end - lengths).tolist(), strip_end.tolist()):
+            if end - start < 3:
+                continue
+            strip = np.arange(start, end - 2)
+            faces_indices.append(indices[np.stack((strip, strip + 1, strip + 2), axis=1)].reshape(-1))
+            faces_lengths.append(np.full(len(strip), 3, dtype=np.int64))
+
+    if faces_lengths:
+        faces_lengths = np.concatenate(faces_lengths)
+        loops_vert_idx = np.concatenate(faces_indices).astype(np.int64)
+    else:
+        faces_lengths = np.zeros(0, dtype=np.int64)
+        loops_vert_idx = np.zeros(0, dtype=np.int64)
+    faces_loop_start = np.cumsum(faces_lengths) - faces_lengths
 
     if uvindices or colindices:
         # If we have Cols or UVs then we need to check the face order.
-        add_face_simple = add_face
-
         # EVIL EEKADOODLE - face order annoyance.
-        def add_face(vertices, indices, uvindices, colindices):
-            if len(indices) == 4:
-                if indices[2] == 0 or indices[3] == 0:
-                    indices = indices[2], indices[3], indices[0], indices[1]
-            elif len(indices) == 3:
-                if indices[2] == 0:
-                    indices = indices[1], indices[2], indices[0]
-
-            add_face_simple(vertices, indices, uvindices, colindices)
-
-    verts = obj[b'vertex']
-
-    if b'face' in obj:
-        for f in obj[b'face']:
-            ind = f[findex]
-            add_face(verts, ind, uvindices, colindices)
-
-    if b'tristrips' in obj:
-        for t in obj[b'tristrips']:
-            ind = t[trindex]
-            len_ind = len(ind)
-            for j in range(len_ind - 2):
-                add_face(verts, (ind[j], ind[j + 1], ind[j + 2]), uvindices, colindices)
+        for nbr_vidx, order in ((4, (2, 3, 0, 1)), (3, (1, 2, 0))):
+            loop_start = faces_loop_start[faces_lengths == nbr_vidx]
+            face_loops = loop_start[:, None] + np.arange(nbr_vidx)
+            face_verts = loops_vert_idx[face_loops]
+            if nbr_vidx == 4:
+                swap = (face_verts[:, 2] == 0) | (face_verts[:, 3] == 0)
+            else:
+                swap = face_verts[:, 2] == 0
+            loops_vert_idx[face_loops[swap]] = face_verts[swap][:, order]
 
     mesh = bpy.data.meshes.new(name=ply_name)
 
-    mesh.vertices.add(len(obj[b'vertex']))
+    mesh.vertices.add(len(verts[vindices_x]))
 
-    mesh.vertices.foreach_set("co", [a for v in obj[b'vertex'] for a in (v[vindices_x], v[vindices_y], v[vindices_z])])
+    mesh.vertices.foreach_set("co", np.column_stack(
+        (verts[vindices_x], verts[vindices_y], verts[vindices_z])).astype(np.float32).ravel())
 
     if b'edge' in obj:
-        mesh.edges.add(len(obj[b'edge']))
-        mesh.edges.foreach_set("vertices", [a for e in obj[b'edge'] for a in (e[eindex1], e[eindex2])])
-
-    if mesh_faces:
-        loops_vert_idx = []
-        faces_loop_start = []
-        faces_loop_total = []
-        lidx = 0
-        for f in mesh_faces:
-            nbr_vidx = len(f)
-            loops_vert_idx.extend(f)
-            faces_loop_start.append(lidx)
-            faces_loop_total.append(nbr_vidx)
-            lidx += nbr_vidx
+        edges = obj[b'edge']
+        mesh.edges.add(len(edges[eindex1]))
+        mesh.edges.foreach_set("vertices", np.column_stack((edges[eindex1], edges[eindex2])).astype(np.int32).ravel())
 
+    if len(faces_lengths):
         mesh.loops.add(len(loops_vert_idx))
-        mesh.polygons.add(len(mesh_faces))
+        mesh.polygons.add(len(faces_lengths))
 
-        mesh.loops.foreach_set("vertex_index", loops_vert_idx)
-        mesh.polygons.foreach_set("loop_start", faces_loop_start)
-        mesh.polygons.foreach_set("loop_total", faces_loop_total)
+        mesh.loops.foreach_set("vertex_index", loops_vert_idx.astype(np.int32))
+        mesh.polygons.foreach_set("loop_start", faces_loop_start.astype(np.int32))
+        mesh.polygons.foreach_set("loop_total", faces_lengths.astype(np.int32))
 
         if uvindices:
             uv_layer = mesh.uv_layers.new()
-            for i, uv in enumerate(uv_layer.data):
-                uv.uv = mesh_uvs[i]
+            uvs = np.column_stack([verts[i] for i in uvindices]).astype(np.float32)
+            uv_layer.data.foreach_set("uv", uvs[loops_vert_idx].ravel())
 
         if colindices:
             vcol_lay = mesh.vertex_colors.new()
-
-            for i, col in enumerate(vcol_lay.data):
-                col.color[0] = mesh_colors[i][0]
-                col.color[1] = mesh_colors[i][1]
-                col.color[2] = mesh_colors[i][2]
-                col.color[3] = mesh_colors[i][3]
+            cols = np.ones((len(verts[vindices_x]), 4), dtype=np.float32)
+            for i, (colindex, mult) in enumerate(zip(colindices, colmultiply)):
+                cols[:, i] = verts[colindex] * mult
+            vcol_lay.data.foreach_set("color", cols[loops_vert_idx].ravel())
 
     mesh.update()
     mesh.validate()
@@ -404,14 +628,97 @@ def load_ply_mesh(filepath, ply_name):
     return mesh
 
 
-def load_ply(filepath):
+def read_points_count(filepath, step=1):
+    """
+    Return the number of vertices read_points() yields for given PLY file with given *step*
+    (an upper bound if also decimating by voxels), None if the file is not valid.
+    """
+    with open(filepath, 'rb') as plyf:
+        obj_spec, format, texture = read_header(plyf)
+    if obj_spec is None:
+        return None
+    for el in obj_spec.specs:
+        if el.name == b'vertex':
+            return (el.count + step - 1) // step
+    return None
+
+
+def load_ply_points(filepath, ply_name, step=1, voxel_size=0.0, report=None):
+    """
+    Create a mesh from the vertices of given PLY file only, other vertex properties being stored
+    as point attributes (colors as a 'Col' color one).
+    """
+    import bpy
+    import numpy as np
+
+    num_points = read_points_count(filepath, step)
+    if num_points is None:
+        print("Invalid file")
+        return
+
+    # Chunks are copied into arrays allocated once for all points (never touched beyond the last point
+    # when decimating by voxels), so that they do not have to be all kept until concatenated.
+    data = {}
+    num = 0
+    for chunk in read_points(filepath, step, voxel_size):
+        chunk_num = 0
+        for name, values in chunk.items():
+            values_all = data.get(name)
+            if values_all is None:
+                values_all = data[name] = np.empty(num_points, dtype=values.dtype)
+            values_all[num:num + len(values)] = values
+            chunk_num = len(values)
+        num += chunk_num
+    if not all(name in data for name in (b'x', b'y', b'z')):
+        print("Invalid file")
+        return
+
+    data = {name: values[:num] for name, values in data.items()}
+
+    mesh = bpy.data.meshes.new(name=ply_name)
+    mesh.vertices.add(num)
+    co = np.column_stack((data.pop(b'x'), data.pop(b'y'), data.pop(b'z'))).astype(np.float32)
+    mesh.vertices.foreach_set("co", co.ravel())
+    del co
+
+    if not hasattr(mesh, "attributes"):
+        # Generic attributes are not supported by this Blender version.
+        if data and report is not None:
+            names = ", ".join(name.decode('utf-8', 'replace') for name in data)
+            report({'WARNING'}, "Point attributes are not supported by this Blender version, "
+                                "vertex properties not imported: %s" % names)
+        mesh.update()
+        return mesh
+
+    colnames = (b'red', b'green', b'blue', b'alpha')
+    if all(name in data for name in colnames[:3]):
+        cols = np.ones((num, 4), dtype=np.float32)
+        for i, name in enumerate(colnames):
+            if name in data:
+                values = data.pop(name)
+                # if not a float assume uchar
+                cols[:, i] = values if values.dtype.kind == 'f' else values * (1.0 / 255.0)
+        mesh.attributes.new("Col", 'FLOAT_COLOR', 'POINT').data.foreach_set("color", cols.ravel())
+
+    for name, values in data.items():
+        attr = mesh.attributes.new(name.decode('utf-8', 'replace'), 'FLOAT', 'POINT')
+        attr.data.foreach_set("value", values.astype(np.float32))
+
+    mesh.update()
+    return mesh
+
+
+def load_ply(filepath, use_point_cloud=False, point_step=1, point_voxel_size=0.0, report=None):
     import time
     import bpy
 
     t = time.time()
     ply_name = bpy.path.display_name_from_filepath(filepath)
 
-    mesh = load_ply_mesh(filepath, ply_name)
+    if use_point_cloud:
+        mesh = load_ply_points(filepath, ply_name, point_step, point_voxel_size, report)
+    else:
+        mesh = load_ply_mesh(filepath, ply_name)
     if not mesh:
         return {'CANCELLED'}
 
@@ -424,5 +731,5 @@ def load_ply(filepath):
     return {'FINISHED'}
 
 
-def load(operator, context, filepath=""):
-    return load_ply(filepath)
+def load(operator, context, filepath="", use_point_cloud=False, point_step=1, point_voxel_size=0.0):
+    return load_ply(filepath, use_point_cloud, point_step, point_voxel_size, operator.report)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+"""
+Usage
+=====
+
+   import_ply_bench [--points N] [--ascii]
+
+This script writes a synthetic point-cloud PLY file (float x, y, z & intensity, uchar colors),
+and measures time and peak memory (RSS) of reading its points, fully (as done for meshes)
+and streamed (point-cloud mode) with various decimations.
+
+Each measurement runs in its own process, peak memory being a per-process value.
+It does not require Blender (Unix only, for peak RSS).
+"""
+
+import os
+import sys
+import time
+
+import import_ply
+
+
+def bench_write_file(fn, num_points, use_ascii):
+    import numpy as np
+    rand = np.random.RandomState(0)
+
+    dtype = np.dtype([('x', '<f4'), ('y', '<f4'), ('z', '<f4'), ('intensity', '<f4'),
+                      ('red', 'u1'), ('green', 'u1'), ('blue', 'u1')])
+    with open(fn, 'wb') as f:
+        f.write(b"ply\nformat %s 1.0\nelement vertex %d\n" %
+                (b'ascii' if use_ascii else b'binary_little_endian', num_points))
+        f.write(b"".join(b"property %s %s\n" % (b'uchar' if dtype[name].kind == 'u' else b'float', name.encode())
+                         for name in dtype.names))
+        f.write(b"end_header\n")
+        chunk_size = 1 << 20
+        for start in range(0, num_points, chunk_size):
+            points = np.empty(min(chunk_size, num_points - start), dtype=dtype)
+            for name in ('x', 'y', 'z', 'intensity'):
+                points[name] = rand.random_sample(len(points)) * 100.0
+            for name in ('red', 'green', 'blue'):
+                points[name] = rand.randint(0, 256, len(points))
+            if use_ascii:
+                np.savetxt(f, points, fmt="%.3f %.3f %.3f %.3f %d %d %d")
+            else:
+                points.tofile(f)
+
+
+def bench_run(fn, mode):
+    """
+    Read points of given file in given mode, return (number of points, time, peak RSS in MiB).
+    """
+    import resource
+
+    t = time.perf_counter()
+    if mode == "full":
+        obj_spec, obj, texture = import_ply.read(fn)
+        num_points = len(obj[b'vertex'][b'x'])
+    else:
+        step, voxel_size = {
+            "stream": (1, 0.0),
+            "step-10": (10, 0.0),
+            "step-100": (100, 0.0),
+            "voxel-1.0": (1, 1.0),
+            "voxel-5.0": (1, 5.0),
+        }[mode]
+        # Keep the points, as done when creating the mesh.
+        chunks = list(import_ply.read_points(fn, step, voxel_size))
+        num_points = sum(len(chunk[b'x']) for chunk in chunks)
+    t = time.perf_counter() - t
+
+    # Linux gives KiB, macOS bytes.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak /= (1024 * 1024) if sys.platform == "darwin" else 1024
+    return num_points, t, peak
+
+
+def main():
+    import argparse
+    import subprocess
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Benchmark PLY point-cloud reading.")
+    parser.add_argument("--points", type=int, default=10000000, help="Number of points in the synthetic file")
+    parser.add_argument("--ascii", action="store_true", help="Write an ASCII file instead of a binary one")
+    parser.add_argument("--run", nargs=2, metavar=("FILE", "MODE"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        print("%d %f %f" % bench_run(*args.run))
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fn = os.path.join(tmpdir, "bench.ply")
+        print("Writing %d points..." % args.points)
+        bench_write_file(fn, args.points, args.ascii)
+        print("File size: %.1f MiB" % (os.path.getsize(fn) / (1024 * 1024)))
+
+        for mode in ("full", "stream", "step-10", "step-100", "voxel-1.0", "voxel-5.0"):
+            out = subprocess.check_output((sys.executable, __file__, "--run", fn, mode), universal_newlines=True)
+            num_points, t, peak = out.split()
+            print("%-10s %10d points: %.3f sec, peak RSS %.1f MiB" % (mode, int(num_points), float(t), float(peak)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
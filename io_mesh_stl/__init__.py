@@ -140,7 +140,7 @@ class ImportSTL(Operator, ImportHelper):
 
         for path in paths:
             objName = bpy.path.display_name(os.path.basename(path))
-            tris, tri_nors, pts = stl_utils.read_stl(path)
+            tris, tri_nors, pts = stl_utils.read_stl_np(path)
             tri_nors = tri_nors if self.use_facet_normal else None
             blender_utils.create_and_link_mesh(objName, tris, tri_nors, pts, global_matrix)
 
@@ -250,7 +250,7 @@ class ExportSTL(Operator, ExportHelper):
 
     def execute(self, context):
         import os
-        import itertools
+        import numpy as np
         from mathutils import Matrix
         from . import stl_utils
         from . import blender_utils
@@ -286,16 +286,19 @@ class ExportSTL(Operator, ExportHelper):
         ).to_4x4() @ Matrix.Scale(global_scale, 4)
 
         if self.batch_mode == 'OFF':
-            faces = itertools.chain.from_iterable(
-                    blender_utils.faces_from_mesh(ob, global_matrix, self.use_mesh_modifiers)
-                    for ob in data_seq)
+            faces = [blender_utils.faces_from_mesh_np(ob, global_matrix, self.use_mesh_modifiers)
+                     for ob in data_seq]
+            faces = [f for f in faces if f is not None]
+            faces = np.concatenate(faces) if faces else np.empty((0, 3, 3), dtype=np.float32)
 
             stl_utils.write_stl(faces=faces, **keywords)
         elif self.batch_mode == 'OBJECT':
             prefix = os.path.splitext(self.filepath)[0]
             keywords_temp = keywords.copy()
             for ob in data_seq:
-                faces = blender_utils.faces_from_mesh(ob, global_matrix, self.use_mesh_modifiers)
+                faces = blender_utils.faces_from_mesh_np(ob, global_matrix, self.use_mesh_modifiers)
+                if faces is None:
+                    faces = np.empty((0, 3, 3), dtype=np.float32)
                 keywords_temp["filepath"] = prefix + bpy.path.clean_name(ob.name) + ".stl"
                 stl_utils.write_stl(faces=faces, **keywords_temp)
 
@@ -23,20 +23,38 @@ def create_and_link_mesh(name, faces, face_nors, points, global_matrix):
     """
     Create a blender mesh and object called name from a list of
     *points* and *faces* and link it in the current scene.
+
+    *points*, *faces* and *face_nors* may also be numpy arrays (see stl_utils.read_stl_np),
+    in which case the mesh is filled with bulk foreach_set() calls.
     """
 
     import array
     from itertools import chain
+    import numpy as np
     import bpy
 
     mesh = bpy.data.meshes.new(name)
-    mesh.from_pydata(points, [], faces)
+    if isinstance(faces, np.ndarray):
+        num_faces = len(faces)
+        mesh.vertices.add(len(points))
+        mesh.vertices.foreach_set("co", np.ascontiguousarray(points, dtype=np.float32).reshape(-1))
+        mesh.loops.add(num_faces * 3)
+        mesh.loops.foreach_set("vertex_index", np.ascontiguousarray(faces, dtype=np.int32).reshape(-1))
+        mesh.polygons.add(num_faces)
+        mesh.polygons.foreach_set("loop_start", np.arange(0, num_faces * 3, 3, dtype=np.int32))
+        mesh.polygons.foreach_set("loop_total", np.full(num_faces, 3, dtype=np.int32))
+        mesh.update(calc_edges=True)
+    else:
+        mesh.from_pydata(points, [], faces)
 
-    if face_nors:
+    if face_nors is not None and len(face_nors):
         # Note: we store 'temp' normals in loops, since validate() may alter final mesh,
         #       we can only set custom lnors *after* calling it.
         mesh.create_normals_split()
-        lnors = tuple(chain(*chain(*zip(face_nors, face_nors, face_nors))))
+        if isinstance(face_nors, np.ndarray):
+            lnors = np.repeat(np.asarray(face_nors, dtype=np.float32), 3, axis=0).reshape(-1)
+        else:
+            lnors = tuple(chain(*chain(*zip(face_nors, face_nors, face_nors))))
         mesh.loops.foreach_set("normal", lnors)
 
     mesh.transform(global_matrix)
@@ -44,7 +62,7 @@ def create_and_link_mesh(name, faces, face_nors, points, global_matrix):
     # update mesh to allow proper display
     mesh.validate(clean_customdata=False)  # *Very* important to not remove lnors here!
 
-    if face_nors:
+    if face_nors is not None and len(face_nors):
         clnors = array.array('f', [0.0] * (len(mesh.loops) * 3))
         mesh.loops.foreach_get("normal", clnors)
 
@@ -109,3 +127,50 @@ def faces_from_mesh(ob, global_matrix, use_mesh_modifiers=False):
         yield [vertices[index].co.copy() for index in tri.vertices]
 
     mesh_owner.to_mesh_clear()
+
+
+def faces_from_mesh_np(ob, global_matrix, use_mesh_modifiers=False):
+    """
+    From an object, return its triangles as a numpy array of shape (faces, 3, 3),
+    or None if it has no mesh data.
+
+    Same as faces_from_mesh(), but gathering all data with bulk foreach_get() calls.
+    """
+
+    import numpy as np
+    import bpy
+
+    # get the editmode data
+    ob.update_from_editmode()
+
+    # get the modifiers
+    if use_mesh_modifiers:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+        mesh_owner = ob.evaluated_get(depsgraph)
+    else:
+        mesh_owner = ob
+
+    # Object.to_mesh() is not guaranteed to return a mesh.
+    try:
+        mesh = mesh_owner.to_mesh()
+    except RuntimeError:
+        return None
+    if mesh is None:
+        return None
+
+    mat = global_matrix @ ob.matrix_world
+    mesh.transform(mat)
+    if mat.is_negative:
+        mesh.flip_normals()
+    mesh.calc_loop_triangles()
+
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    tri_verts = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", tri_verts)
+
+    faces = co.reshape(-1, 3)[tri_verts].reshape(-1, 3, 3)
+
+    mesh_owner.to_mesh_clear()
+
+    return faces
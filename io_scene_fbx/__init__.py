@@ -47,6 +47,7 @@ from bpy.props import (
         StringProperty,
         BoolProperty,
         FloatProperty,
+        IntProperty,
         EnumProperty,
         CollectionProperty,
         )
@@ -198,6 +199,21 @@ class ImportFBX(bpy.types.Operator, ImportHelper):
             description="Use pre/post rotation from FBX transform (you may have to disable that in some cases)",
             default=True,
             )
+    use_lazy_parsing: BoolProperty(
+            name="Lazy Parsing",
+            description="Only decode the parts of the file actually used, keeping memory usage low "
+                        "(otherwise the whole file is decoded at once)",
+            default=True,
+            options={'HIDDEN'},
+            )
+    decompression_threads: IntProperty(
+            name="Decompression Threads",
+            description="Number of threads used to decompress arrays "
+                        "(0 to use all CPU cores, 1 to disable threading and only decompress arrays when used)",
+            min=0, max=1024,
+            default=0,
+            options={'HIDDEN'},
+            )
 
     def draw(self, context):
         pass
@@ -606,6 +622,14 @@ class ExportFBX(bpy.types.Operator, ExportHelper):
             default=True,
             options={'HIDDEN'},
             )
+    compression_threads: IntProperty(
+            name="Compression Threads",
+            description="Number of threads used to compress geometry and animation arrays "
+                        "(0 to use all CPU cores, 1 to disable threading)",
+            min=0, max=1024,
+            default=0,
+            options={'HIDDEN'},
+            )
 
     def draw(self, context):
         pass
@@ -26,7 +26,9 @@ except:
     import data_types
 
 from struct import pack
+from concurrent.futures import Future
 import array
+import os
 import zlib
 
 _BLOCK_SENTINEL_LENGTH = 13
@@ -45,6 +47,44 @@ _FOOT_ID = b'\xfa\xbc\xab\x09\xd0\xc8\xd4\x66\xb1\x76\xfb\x83\x1c\xf7\x26\x7e'
 # Awful exceptions: those "classes" of elements seem to need block sentinel even when having no children and some props.
 _ELEMS_ID_ALWAYS_BLOCK_SENTINEL = {b"AnimationStack", b"AnimationLayer"}
 
+# Optional pool of threads compressing arrays in the background (zlib releases the GIL while working).
+_compression_pool = None
+
+
+def compression_pool_start(num_threads):
+    """
+    Compress arrays added to elements on num_threads worker threads (zero for all CPU cores, one disables threading).
+    Resulting data is strictly identical, compressed arrays are only waited for when their element gets written.
+    """
+    global _compression_pool
+    compression_pool_stop()
+    if num_threads == 0:
+        num_threads = os.cpu_count() or 1
+    if num_threads > 1:
+        from concurrent.futures import ThreadPoolExecutor
+        _compression_pool = ThreadPoolExecutor(max_workers=num_threads)
+
+
+def compression_pool_stop():
+    global _compression_pool
+    if _compression_pool is not None:
+        _compression_pool.shutdown()
+        _compression_pool = None
+
+
+def _pack_array_data(data, length):
+    # mimic behavior of fbxconverter (also common sense)
+    # we could make this configurable.
+    encoding = 0 if len(data) <= 128 else 1
+    if encoding == 0:
+        pass
+    elif encoding == 1:
+        data = zlib.compress(data, 1)
+
+    comp_len = len(data)
+
+    return pack('<3I', length, encoding, comp_len) + data
+
 
 class FBXElem:
     __slots__ = (
@@ -141,17 +181,11 @@ class FBXElem:
             data.byteswap()
         data = data.tobytes()
 
-        # mimic behavior of fbxconverter (also common sense)
-        # we could make this configurable.
-        encoding = 0 if len(data) <= 128 else 1
-        if encoding == 0:
-            pass
-        elif encoding == 1:
-            data = zlib.compress(data, 1)
-
-        comp_len = len(data)
-
-        data = pack('<3I', length, encoding, comp_len) + data
+        if _compression_pool is not None and len(data) > 128:
+            # Will be replaced by actual packed data in _resolve_props().
+            data = _compression_pool.submit(_pack_array_data, data, length)
+        else:
+            data = _pack_array_data(data, length)
 
         self.props_type.append(prop_type)
         self.props.append(data)
@@ -189,6 +223,24 @@ class FBXElem:
     # -------------------------
     # internal helper functions
 
+    def _resolve_props(self):
+        """
+        Wait for, and store, props being compressed in the background.
+        """
+        props = self.props
+        for i, data in enumerate(props):
+            if isinstance(data, Future):
+                props[i] = data.result()
+
+    def _is_ready(self):
+        """
+        Whether this element and all its children can be written without waiting for background compression.
+        """
+        for data in self.props:
+            if isinstance(data, Future) and not data.done():
+                return False
+        return all(elem._is_ready() for elem in self.elems)
+
     def _calc_offsets(self, offset, is_last):
         """
         Call before writing, calculates fixed offsets.
@@ -196,6 +248,8 @@ class FBXElem:
         assert(self._end_offset == -1)
         assert(self._props_length == -1)
 
+        self._resolve_props()
+
         offset += 12  # 3 uints
         offset += 1 + len(self.id)  # len + idname
 
@@ -285,6 +339,184 @@ def _write_timedate_hack(elem_root):
         print("Missing fields!")
 
 
+def _write_footer(write, tell, version):
+    write(_FOOT_ID)
+    write(b'\x00' * 4)
+
+    # padding for alignment (values between 1 & 16 observed)
+    # if already aligned to 16, add a full 16 bytes padding.
+    ofs = tell()
+    pad = ((ofs + 15) & ~15) - ofs
+    if pad == 0:
+        pad = 16
+
+    write(b'\0' * pad)
+
+    write(pack('<I', version))
+
+    # unknown magic (always the same)
+    write(b'\0' * 120)
+    write(b'\xf8\x5a\x8c\x6a\xde\xf5\xd9\x7e\xec\xe9\x0c\xe3\x75\x8f\x29\x0b')
+
+
+class FBXStreamWriter:
+    """
+    Write elements to file as soon as they are complete, instead of building the whole tree in memory first.
+
+    Elements are added to their parent as usual (starting from ``root``), then:
+
+    * flush(elem) writes (and releases) all children of elem, but the last one
+      (whether an element is the last of its scope affects its encoding, so it is kept until we know),
+      and the ones still waiting for their arrays to be compressed in the background (see compression_pool_start()).
+    * open_scope(elem) writes the header and properties of elem (the last child of the current scope),
+      its children then get written by further flush() calls.
+    * close_scope(elem) writes its remaining children, its end sentinel, and back-patches its end_offset.
+    * close() finishes the root scope, writes the file footer, and only then replaces the target file.
+
+    Data is written to a temporary file next to the target one, which is removed instead if the writer is used as
+    a context manager and an exception occurs.
+
+    Generated file is strictly identical to the one written by write() from the complete tree.
+    """
+    __slots__ = (
+        "root",
+        "max_pending",
+        "_file",
+        "_filepath",
+        "_filepath_tmp",
+        "_version",
+        "_scopes",
+        "_timedate_done",
+        )
+
+    def __init__(self, fn, version):
+        self.root = FBXElem(b"")  # Root element has no id, as it is not saved per se!
+        # Max number of children of a scope (e.g. meshes) that may wait for their background compression to be done,
+        # besides the last one, kept in memory meanwhile.
+        self.max_pending = 2
+        self._filepath = fn
+        self._filepath_tmp = "%s.%d.tmp" % (fn, os.getpid())
+        self._file = open(self._filepath_tmp, 'wb')
+        self._version = version
+        # Stack of opened scopes: [elem, offset of its end_offset value (None for root), has written children].
+        self._scopes = [[self.root, None, False]]
+        self._timedate_done = False
+
+        self._file.write(_HEAD_MAGIC)
+        self._file.write(pack('<I', version))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.discard()
+
+    def _write_children(self, scope, elems):
+        write = self._file.write
+        tell = self._file.tell
+        for elem, is_last in elems:
+            assert(elem.id != b'')
+            elem._calc_offsets(tell(), is_last)
+            elem._write(write, tell, is_last)
+            scope[2] = True
+
+    def flush(self, elem):
+        scope = self._scopes[-1]
+        assert(scope[0] is elem)
+        if elem is self.root and not self._timedate_done:
+            # hack since we don't decode time.
+            # ideally we would _not_ modify this data.
+            _write_timedate_hack(elem)
+            self._timedate_done = True
+
+        # Children still being compressed in the background are kept for a later flush,
+        # unless there are too many of them already pending (then we wait for them, in order).
+        num_pending = len(elem.elems) - 1
+        num_flush = 0
+        while num_flush < num_pending:
+            if (num_pending - num_flush) <= self.max_pending and not elem.elems[num_flush]._is_ready():
+                break
+            num_flush += 1
+        if num_flush:
+            self._write_children(scope, ((sub_elem, False) for sub_elem in elem.elems[:num_flush]))
+            del elem.elems[:num_flush]
+
+    def open_scope(self, elem):
+        parent = self._scopes[-1][0]
+        assert(parent.elems and parent.elems[-1] is elem)
+        self.flush(parent)
+        # All previous children (even those still pending) have to be written before the scope.
+        self._write_children(self._scopes[-1], ((sub_elem, False) for sub_elem in parent.elems[:-1]))
+        parent.elems.clear()
+        self._scopes[-1][2] = True
+
+        write = self._file.write
+        tell = self._file.tell
+
+        elem._resolve_props()
+        props_length = sum(1 + len(data) for data in elem.props)
+        end_offset_pos = tell()
+        write(pack('<3I', 0, len(elem.props), props_length))  # end_offset is back-patched in close_scope().
+        write(bytes((len(elem.id),)))
+        write(elem.id)
+        for i, data in enumerate(elem.props):
+            write(bytes((elem.props_type[i],)))
+            write(data)
+        # Properties are written, no need to keep them around.
+        elem.props.clear()
+        self._scopes.append([elem, end_offset_pos, False])
+
+    def close_scope(self, elem, is_last=False):
+        scope = self._scopes[-1]
+        assert(scope[0] is elem)
+        self.flush(elem)
+        if elem.elems:
+            elem_last = elem.elems[-1]
+            self._write_children(scope, ((sub_elem, sub_elem is elem_last) for sub_elem in elem.elems))
+            elem.elems.clear()
+
+        write = self._file.write
+        tell = self._file.tell
+        if scope[2]:
+            write(_BLOCK_SENTINEL_DATA)
+        elif elem.id in _ELEMS_ID_ALWAYS_BLOCK_SENTINEL or not elem.props_type:
+            # Note: props have already been cleared when opening the scope.
+            if not is_last:
+                write(_BLOCK_SENTINEL_DATA)
+
+        self._scopes.pop()
+        end_offset_pos = scope[1]
+        if end_offset_pos is not None:
+            end_offset = tell()
+            self._file.seek(end_offset_pos)
+            write(pack('<I', end_offset))
+            self._file.seek(end_offset)
+
+    def close(self):
+        try:
+            assert(len(self._scopes) == 1)
+            self.close_scope(self.root)
+            _write_footer(self._file.write, self._file.tell, self._version)
+            self._file.close()
+        except:
+            self.discard()
+            raise
+        os.replace(self._filepath_tmp, self._filepath)
+
+    def discard(self):
+        """
+        Close and remove the temporary file, leaving the target one untouched.
+        """
+        self._file.close()
+        try:
+            os.remove(self._filepath_tmp)
+        except OSError:
+            pass
+
+
 def write(fn, elem_root, version):
     assert(elem_root.id == b'')
 
@@ -302,20 +534,4 @@ def write(fn, elem_root, version):
         elem_root._calc_offsets_children(tell(), False)
         elem_root._write_children(write, tell, False)
 
-        write(_FOOT_ID)
-        write(b'\x00' * 4)
-
-        # padding for alignment (values between 1 & 16 observed)
-        # if already aligned to 16, add a full 16 bytes padding.
-        ofs = tell()
-        pad = ((ofs + 15) & ~15) - ofs
-        if pad == 0:
-            pad = 16
-
-        write(b'\0' * pad)
-
-        write(pack('<I', version))
-
-        # unknown magic (always the same)
-        write(b'\0' * 120)
-        write(b'\xf8\x5a\x8c\x6a\xde\xf5\xd9\x7e\xec\xe9\x0c\xe3\x75\x8f\x29\x0b')
+        _write_footer(write, tell, version)
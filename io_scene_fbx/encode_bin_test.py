@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+
+# XXX Not really nice, but that hack is needed to allow execution of that test
+#     from both automated CTest and by directly running the file manually...
+if __name__ == '__main__':
+    import encode_bin
+else:
+    from . import encode_bin
+from concurrent.futures import Future
+import array
+import os
+import random
+import tempfile
+import unittest
+
+FBX_VERSION = 7400
+
+
+class LateFuture(Future):
+    """
+    Compressed data that is only available once waited for, i.e. an array whose compression is never done in time.
+    """
+    def __init__(self, data, length):
+        super().__init__()
+        self._args = (data, length)
+
+    def result(self, timeout=None):
+        if not self.done():
+            self.set_result(encode_bin._pack_array_data(*self._args))
+        return super().result(timeout)
+
+
+def add_late_array(elem, values):
+    data = array.array('d', values)
+    elem.props_type.append(b'd'[0])
+    elem.props.append(LateFuture(data.tobytes(), len(data)))
+
+
+def build_tree(writer, root, spec, late=False):
+    """
+    Build the elements described by spec under root, streaming them with writer when it is not None.
+    spec: list of (id, values, children spec or None for a leaf element).
+    """
+    for i, (elem_id, values, children) in enumerate(spec):
+        elem = encode_bin.FBXElem(elem_id)
+        root.elems.append(elem)
+        if values is not None:
+            if late:
+                add_late_array(elem, values)
+            else:
+                elem.add_float64_array(values)
+        if children is not None:
+            if writer is not None:
+                writer.open_scope(elem)
+            build_tree(writer, elem, children, late)
+            if writer is not None:
+                writer.close_scope(elem, is_last=(i == len(spec) - 1))
+        elif writer is not None:
+            writer.flush(root)
+
+
+def add_header(root):
+    for elem_id, value in ((b'FileId', b'\0' * 16), (b'CreationTime', "")):
+        elem = encode_bin.FBXElem(elem_id)
+        if isinstance(value, bytes):
+            elem.add_bytes(value)
+        else:
+            elem.add_string_unicode(value)
+        root.elems.append(elem)
+
+
+def random_spec(rand, depth):
+    spec = []
+    for i in range(rand.randint(1, 5)):
+        values = None
+        if rand.random() < 0.5:
+            values = [rand.random() for _ in range(rand.choice((4, 100, 5000)))]
+        children = None
+        if depth and rand.random() < 0.5:
+            children = random_spec(rand, depth - 1)
+        elif rand.random() < 0.3:
+            children = []
+        spec.append((b'Elem%d' % i, values, children))
+    return spec
+
+
+class FBXStreamWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        encode_bin.compression_pool_stop()
+        self.tmpdir.cleanup()
+
+    def write_both(self, spec, late=False):
+        fn_mem = os.path.join(self.tmpdir.name, "mem.fbx")
+        root = encode_bin.FBXElem(b"")
+        add_header(root)
+        build_tree(None, root, spec, late)
+        encode_bin.write(fn_mem, root, FBX_VERSION)
+
+        fn_stream = os.path.join(self.tmpdir.name, "stream.fbx")
+        with encode_bin.FBXStreamWriter(fn_stream, FBX_VERSION) as writer:
+            add_header(writer.root)
+            build_tree(writer, writer.root, spec, late)
+
+        with open(fn_mem, 'rb') as f_mem, open(fn_stream, 'rb') as f_stream:
+            self.assertEqual(f_mem.read(), f_stream.read())
+
+    def test_nested_scopes(self):
+        spec = [
+            (b'Objects', None, [
+                (b'Geometry', None, [
+                    (b'Vertices', [1.0] * 100, None),
+                    (b'Normals', [0.5] * 100, None),
+                ]),
+                (b'Model', None, [(b'Properties70', None, [])]),
+                (b'Empty', None, []),
+            ]),
+            (b'Connections', None, []),
+        ]
+        self.write_both(spec)
+
+    def test_pending_children_at_close(self):
+        # The first child is still being compressed when its scope gets closed, so all children are written
+        # at once by close_scope(), only the last one of them without a block sentinel.
+        spec = [
+            (b'Objects', None, [
+                (b'Geometry', [1.0] * 100, None),
+                (b'AnimationStack', None, None),
+                (b'AnimationLayer', None, None),
+                (b'Empty', None, None),
+            ]),
+            (b'Connections', None, []),
+        ]
+        self.write_both(spec, late=True)
+
+    def test_error_keeps_target(self):
+        fn = os.path.join(self.tmpdir.name, "target.fbx")
+        with open(fn, 'wb') as f:
+            f.write(b"previous")
+        with self.assertRaises(ValueError):
+            with encode_bin.FBXStreamWriter(fn, FBX_VERSION) as writer:
+                add_header(writer.root)
+                build_tree(writer, writer.root, [(b'Objects', None, [(b'Model', [1.0] * 100, None)])])
+                raise ValueError
+        with open(fn, 'rb') as f:
+            self.assertEqual(f.read(), b"previous")
+        self.assertEqual(os.listdir(self.tmpdir.name), ["target.fbx"])
+
+    def test_random_threaded(self):
+        encode_bin.compression_pool_start(4)
+        rand = random.Random(0)
+        for _ in range(20):
+            self.write_both(random_spec(rand, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
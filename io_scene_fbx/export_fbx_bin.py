@@ -2863,28 +2863,40 @@ def fbx_definitions_elements(root, scene_data):
     fbx_templates_generate(definitions, scene_data.templates)
 
 
-def fbx_objects_elements(root, scene_data):
+def fbx_objects_elements(root, scene_data, writer=None):
     """
     Data (objects, geometry, material, textures, armatures, etc.).
+
+    When a stream writer is given, each generated element is written to file as soon as it is complete.
     """
     perfmon = PerfMon()
     perfmon.level_up()
     objects = elem_empty(root, b"Objects")
 
+    if writer is not None:
+        writer.open_scope(objects)
+        flush = writer.flush
+    else:
+        def flush(elem):
+            pass
+
     perfmon.step("FBX export fetch empties (%d)..." % len(scene_data.data_empties))
 
     for empty in scene_data.data_empties:
         fbx_data_empty_elements(objects, empty, scene_data)
+        flush(objects)
 
     perfmon.step("FBX export fetch lamps (%d)..." % len(scene_data.data_lights))
 
     for lamp in scene_data.data_lights:
         fbx_data_light_elements(objects, lamp, scene_data)
+        flush(objects)
 
     perfmon.step("FBX export fetch cameras (%d)..." % len(scene_data.data_cameras))
 
     for cam in scene_data.data_cameras:
         fbx_data_camera_elements(objects, cam, scene_data)
+        flush(objects)
 
     perfmon.step("FBX export fetch meshes (%d)..."
                  % len({me_key for me_key, _me, _free in scene_data.data_meshes.values()}))
@@ -2892,6 +2904,7 @@ def fbx_objects_elements(root, scene_data):
     done_meshes = set()
     for me_obj in scene_data.data_meshes:
         fbx_data_mesh_elements(objects, me_obj, scene_data, done_meshes)
+        flush(objects)
     del done_meshes
 
     perfmon.step("FBX export fetch objects (%d)..." % len(scene_data.objects))
@@ -2900,10 +2913,12 @@ def fbx_objects_elements(root, scene_data):
         if ob_obj.is_dupli:
             continue
         fbx_data_object_elements(objects, ob_obj, scene_data)
+        flush(objects)
         for dp_obj in ob_obj.dupli_list_gen(scene_data.depsgraph):
             if dp_obj not in scene_data.objects:
                 continue
             fbx_data_object_elements(objects, dp_obj, scene_data)
+            flush(objects)
 
     perfmon.step("FBX export fetch remaining...")
 
@@ -2911,35 +2926,51 @@ def fbx_objects_elements(root, scene_data):
         if not (ob_obj.is_object and ob_obj.type == 'ARMATURE'):
             continue
         fbx_data_armature_elements(objects, ob_obj, scene_data)
+        flush(objects)
 
     if scene_data.data_leaf_bones:
         fbx_data_leaf_bone_elements(objects, scene_data)
+        flush(objects)
 
     for ma in scene_data.data_materials:
         fbx_data_material_elements(objects, ma, scene_data)
+        flush(objects)
 
     for blender_tex_key in scene_data.data_textures:
         fbx_data_texture_file_elements(objects, blender_tex_key, scene_data)
+        flush(objects)
 
     for vid in scene_data.data_videos:
         fbx_data_video_elements(objects, vid, scene_data)
+        flush(objects)
 
     perfmon.step("FBX export fetch animations...")
     start_time = time.process_time()
 
     fbx_data_animation_elements(objects, scene_data)
 
+    if writer is not None:
+        writer.close_scope(objects)
+
     perfmon.level_down()
 
 
-def fbx_connections_elements(root, scene_data):
+def fbx_connections_elements(root, scene_data, writer=None):
     """
     Relations between Objects (which material uses which texture, and so on).
     """
     connections = elem_empty(root, b"Connections")
 
+    if writer is not None:
+        writer.open_scope(connections)
+
     for c in scene_data.connections:
         elem_connection(connections, *c)
+        if writer is not None:
+            writer.flush(connections)
+
+    if writer is not None:
+        writer.close_scope(connections)
 
 
 def fbx_takes_elements(root, scene_data):
@@ -2965,6 +2996,33 @@ def fbx_takes_elements(root, scene_data):
         take_ref_time.add_int64(end_ktime)
 
 
+def fbx_root_elements(root, scene_data, writer=None):
+    """
+    Generate the whole FBX tree under root, streaming it when a writer is given.
+    """
+    # Mostly FBXHeaderExtension and GlobalSettings.
+    fbx_header_elements(root, scene_data)
+
+    # Documents and References are pretty much void currently.
+    fbx_documents_elements(root, scene_data)
+    fbx_references_elements(root, scene_data)
+
+    # Templates definitions.
+    fbx_definitions_elements(root, scene_data)
+
+    # Actual data.
+    fbx_objects_elements(root, scene_data, writer)
+
+    # How data are inter-connected.
+    fbx_connections_elements(root, scene_data, writer)
+
+    # Animation.
+    fbx_takes_elements(root, scene_data)
+
+    # Cleanup!
+    fbx_scene_data_cleanup(scene_data)
+
+
 # ##### "Main" functions. #####
 
 # This func can be called with just the filepath
@@ -3000,6 +3058,8 @@ def save_single(operator, scene, depsgraph, filepath="",
                 use_custom_props=False,
                 bake_space_transform=False,
                 armature_nodetype='NULL',
+                use_stream_writing=True,
+                compression_threads=0,
                 **kwargs
                 ):
 
@@ -3078,32 +3138,22 @@ def save_single(operator, scene, depsgraph, filepath="",
     # Generate some data about exported scene...
     scene_data = fbx_data_from_scene(scene, depsgraph, settings)
 
-    root = elem_empty(None, b"")  # Root element has no id, as it is not saved per se!
-
-    # Mostly FBXHeaderExtension and GlobalSettings.
-    fbx_header_elements(root, scene_data)
-
-    # Documents and References are pretty much void currently.
-    fbx_documents_elements(root, scene_data)
-    fbx_references_elements(root, scene_data)
-
-    # Templates definitions.
-    fbx_definitions_elements(root, scene_data)
-
-    # Actual data.
-    fbx_objects_elements(root, scene_data)
-
-    # How data are inter-connected.
-    fbx_connections_elements(root, scene_data)
-
-    # Animation.
-    fbx_takes_elements(root, scene_data)
-
-    # Cleanup!
-    fbx_scene_data_cleanup(scene_data)
+    # Meshes arrays get compressed in the background while next ones are being generated.
+    encode_bin.compression_pool_start(compression_threads)
+    try:
+        if use_stream_writing:
+            # Elements are written to file as soon as they are complete, avoids keeping the whole tree in memory.
+            # Target file is only replaced once the export succeeded.
+            with encode_bin.FBXStreamWriter(filepath, FBX_VERSION) as writer:
+                fbx_root_elements(writer.root, scene_data, writer)
+        else:
+            root = elem_empty(None, b"")  # Root element has no id, as it is not saved per se!
+            fbx_root_elements(root, scene_data)
 
-    # And we are down, we can write the whole thing!
-    encode_bin.write(filepath, root, FBX_VERSION)
+            # And we are down, we can write the whole thing!
+            encode_bin.write(filepath, root, FBX_VERSION)
+    finally:
+        encode_bin.compression_pool_stop()
 
     # Clear cached ObjectWrappers!
     ObjectWrapper.cache_clear()
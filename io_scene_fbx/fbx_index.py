@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# Script copyright (C) 2019 Blender Foundation
+
+"""
+Usage
+=====
+
+   fbx_index index FILES...
+   fbx_index list FILE PATH_PATTERN
+   fbx_index geometries FILES...
+   fbx_index extract FILE UUID
+
+This script builds a structural index of binary FBX files, and answers queries using it,
+without loading (nor decompressing) the whole files. It does not require Blender.
+
+
+Index
+=====
+
+The index of ``file.fbx`` is stored next to it, as ``file.fbx.idx.json``,
+and is rebuilt automatically when the FBX file is modified.
+
+Only element headers are read when building it (arrays are never decompressed).
+It stores, for each element up to a given depth (3 by default, e.g. ``Objects/Geometry/Vertices``):
+
+   ``[path, parent, offset, end_offset, "data_types", [array_lengths] or null, uuid or null, name or null]``
+
+Where path is an index in the list of all (``/``-separated) element paths of the file,
+parent is the index of the parent element in the list (-1 for top-level ones),
+and data_types is a string of property types, as in fbx2json output.
+
+
+Queries
+=======
+
+* list: elements matching given path pattern (e.g. ``Objects/*``), with their offset and properties summary.
+* geometries: UUID, name, and vertex & polygon-vertex counts of all geometries.
+* extract: JSON dump (in fbx2json format) of the element with given UUID, read directly from its offset.
+"""
+
+try:
+    from . import parse_fbx, fbx2json
+except:
+    import parse_fbx
+    import fbx2json
+
+import os
+import sys
+import json
+
+FBX_INDEX_FORMAT = 1
+FBX_INDEX_DEPTH_DEFAULT = 3
+FBX_ARRAY_TYPES = b'fidlbc'
+
+# Indices of items in an index element entry.
+IDX_PATH = 0
+IDX_PARENT = 1
+IDX_OFFSET = 2
+IDX_END_OFFSET = 3
+IDX_PROPS_TYPE = 4
+IDX_ARRAY_LENGTHS = 5
+IDX_UUID = 6
+IDX_NAME = 7
+
+
+def fbx_index_path(fn):
+    return fn + ".idx.json"
+
+
+def fbx_index_build(fn, max_depth=FBX_INDEX_DEPTH_DEFAULT):
+    elem_root, fbx_version = parse_fbx.parse_lazy(fn)
+    stat = os.stat(fn)
+
+    paths = {}
+    elems = []
+
+    def _recurse(fbx_elems, parent_path, parent, depth):
+        for fbx_elem in fbx_elems:
+            elem_id = fbx_elem.id.decode('utf-8', 'replace')
+            path = parent_path + "/" + elem_id if parent_path else elem_id
+            path_index = paths.setdefault(path, len(paths))
+
+            props_type = fbx_elem.props_type
+            array_lengths = uuid = name = None
+            if any(t in FBX_ARRAY_TYPES for t in props_type):
+                array_lengths = [l for l in fbx_elem.props_array_lengths() if l is not None]
+            elif props_type[:1] == bytes((parse_fbx.data_types.INT64,)):
+                # Object-like element, uuid and name are cheap to decode (no array here).
+                props = fbx_elem.props
+                uuid = props[0]
+                for prop, prop_type in zip(props, props_type):
+                    if prop_type == parse_fbx.data_types.STRING:
+                        name = prop.decode('utf-8', 'replace').replace('\x00\x01', '::')
+                        break
+
+            index = len(elems)
+            elems.append([path_index, parent, fbx_elem.offset, fbx_elem.end_offset,
+                          props_type.decode('ascii'), array_lengths, uuid, name])
+            if depth < max_depth:
+                _recurse(fbx_elem.elems, path, index, depth + 1)
+
+    _recurse(elem_root.elems, "", -1, 1)
+
+    return {
+        "format": FBX_INDEX_FORMAT,
+        "fbx_version": fbx_version,
+        "file_size": stat.st_size,
+        "file_mtime": stat.st_mtime,
+        "max_depth": max_depth,
+        "paths": sorted(paths, key=paths.get),
+        "elems": elems,
+    }
+
+
+def fbx_index_is_valid(index, fn, max_depth=FBX_INDEX_DEPTH_DEFAULT):
+    stat = os.stat(fn)
+    return (index.get("format") == FBX_INDEX_FORMAT and
+            index.get("file_size") == stat.st_size and
+            index.get("file_mtime") == stat.st_mtime and
+            index.get("max_depth", 0) >= max_depth)
+
+
+def fbx_index_load(fn, max_depth=FBX_INDEX_DEPTH_DEFAULT, use_cache=True):
+    """
+    Return the index of given FBX file, reading it from its cache file if still valid,
+    otherwise (re-)building and saving it.
+    """
+    fn_index = fbx_index_path(fn)
+    if use_cache and os.path.exists(fn_index):
+        try:
+            with open(fn_index, 'r', encoding="utf-8") as f:
+                index = json.load(f)
+            if fbx_index_is_valid(index, fn, max_depth):
+                return index
+        except (OSError, ValueError):
+            pass
+
+    index = fbx_index_build(fn, max_depth)
+    if use_cache:
+        # The cache is only an optimization, e.g. read-only asset directories just do without it.
+        try:
+            with open(fn_index, 'w', encoding="utf-8") as f:
+                json.dump(index, f, separators=(',', ':'))
+        except OSError as e:
+            print("Could not save FBX index cache %r (%s)" % (fn_index, e))
+    return index
+
+
+def fbx_index_find(index, path_pattern):
+    """
+    Yield all index element entries which path matches given (fnmatch-like) pattern.
+    """
+    from fnmatch import fnmatchcase
+    paths = index["paths"]
+    path_indices = {i for i, path in enumerate(paths) if fnmatchcase(path, path_pattern)}
+    for elem in index["elems"]:
+        if elem[IDX_PATH] in path_indices:
+            yield elem
+
+
+def fbx_index_find_uuid(index, uuid):
+    for elem in index["elems"]:
+        if elem[IDX_UUID] == uuid:
+            return elem
+    return None
+
+
+def fbx_index_geometries(index):
+    """
+    Return a list of (uuid, name, vertices count, polygon vertices count) tuples for all geometries.
+    """
+    paths = index["paths"]
+    elems = index["elems"]
+    geoms = {}
+    for i, elem in enumerate(elems):
+        path = paths[elem[IDX_PATH]]
+        if path == "Objects/Geometry":
+            geoms[i] = [elem[IDX_UUID], elem[IDX_NAME], 0, 0]
+        elif elem[IDX_PARENT] in geoms and elem[IDX_ARRAY_LENGTHS]:
+            if path == "Objects/Geometry/Vertices":
+                geoms[elem[IDX_PARENT]][2] = elem[IDX_ARRAY_LENGTHS][0] // 3
+            elif path == "Objects/Geometry/PolygonVertexIndex":
+                geoms[elem[IDX_PARENT]][3] = elem[IDX_ARRAY_LENGTHS][0]
+    return [tuple(geom) for geom in geoms.values()]
+
+
+def fbx_index_extract(fn, index, uuid, fw):
+    """
+    Write the element of given uuid (and its whole subtree) as JSON (fbx2json format), using fw.
+    """
+    elem = fbx_index_find_uuid(index, uuid)
+    if elem is None:
+        raise KeyError("No element with UUID %d in %r" % (uuid, fn))
+    fbx_elem, _fbx_version = parse_fbx.parse_lazy_elem(fn, elem[IDX_OFFSET])
+    fbx2json.fbx2json_recurse(fw, fbx_elem, "", True)
+    fw('\n')
+
+
+# ----------------------------------------------------------------------------
+# Command Line
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Index and query binary FBX files.")
+    parser.add_argument("--depth", type=int, default=FBX_INDEX_DEPTH_DEFAULT,
+                        help="Max depth of indexed elements")
+    parser.add_argument("--no-cache", dest="use_cache", action="store_false",
+                        help="Do not read nor write index files")
+    subparsers = parser.add_subparsers(dest="command")
+
+    sub = subparsers.add_parser("index", help="Build (or update) index of given files")
+    sub.add_argument("files", nargs="+")
+    sub = subparsers.add_parser("list", help="List elements matching given path pattern")
+    sub.add_argument("file")
+    sub.add_argument("path")
+    sub = subparsers.add_parser("geometries", help="List all geometries with their vertex counts")
+    sub.add_argument("files", nargs="+")
+    sub = subparsers.add_parser("extract", help="Write element of given UUID as JSON")
+    sub.add_argument("file")
+    sub.add_argument("uuid", type=int)
+
+    args = parser.parse_args()
+    fw = sys.stdout.write
+
+    if args.command == "index":
+        for fn in args.files:
+            index = fbx_index_load(fn, args.depth, args.use_cache)
+            print("%s: %d elements (version %d)" % (fn, len(index["elems"]), index["fbx_version"]))
+    elif args.command == "list":
+        index = fbx_index_load(args.file, args.depth, args.use_cache)
+        paths = index["paths"]
+        for elem in fbx_index_find(index, args.path):
+            line = "%s @%d-%d [%s]" % (paths[elem[IDX_PATH]], elem[IDX_OFFSET], elem[IDX_END_OFFSET],
+                                       elem[IDX_PROPS_TYPE])
+            if elem[IDX_ARRAY_LENGTHS]:
+                line += " arrays: %r" % elem[IDX_ARRAY_LENGTHS]
+            if elem[IDX_UUID] is not None:
+                line += " uuid: %d name: %r" % (elem[IDX_UUID], elem[IDX_NAME])
+            print(line)
+    elif args.command == "geometries":
+        for fn in args.files:
+            index = fbx_index_load(fn, args.depth, args.use_cache)
+            for uuid, name, num_verts, num_loops in fbx_index_geometries(index):
+                print("%s: %d %r vertices: %d, polygon vertices: %d" % (fn, uuid, name, num_verts, num_loops))
+    elif args.command == "extract":
+        index = fbx_index_load(args.file, args.depth, args.use_cache)
+        fbx_index_extract(args.file, index, args.uuid, fw)
+    else:
+        parser.print_help()
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -34,6 +34,7 @@ if "bpy" in locals():
 
 import bpy
 from mathutils import Matrix, Euler, Vector
+import numpy as np
 
 # -----
 # Utils
@@ -177,8 +178,7 @@ def elem_props_find_first(elem, elem_prop_id):
         # When properties are not found... Should never happen, but happens - as usual.
         return None
     # support for templates (tuple of elems)
-    if type(elem) is not FBXElem:
-        assert(type(elem) is tuple)
+    if type(elem) is tuple:
         for e in elem:
             result = elem_props_find_first(e, elem_prop_id)
             if result is not None:
@@ -758,81 +758,80 @@ def blen_read_geom_layerinfo(fbx_layer):
         )
 
 
-def blen_read_geom_array_setattr(generator, blen_data, blen_attr, fbx_data, stride, item_size, descr, xform):
-    """Generic fbx_layer to blen_data setter, generator is expected to yield tuples (ble_idx, fbx_idx)."""
+def blen_read_geom_array_foreach_dtype(blen_data, blen_attr):
+    """Return the numpy dtype matching given RNA property, for foreach_get/set."""
+    value = getattr(blen_data[0], blen_attr)
+    if isinstance(value, bool):
+        return np.bool_
+    elif isinstance(value, int):
+        return np.int32
+    return np.float32
+
+
+def blen_read_geom_array_setattr(indices, blen_data, blen_attr, fbx_data, stride, item_size, descr, xform):
+    """
+    Generic fbx_layer to blen_data setter, indices is expected to be a pair of (blen_idx, fbx_idx) numpy arrays.
+    blen_data may be either a RNA collection (set in a single foreach_set call), or a (N, item_size) numpy array.
+    """
+    blen_idx, fbx_idx = indices
     max_idx = len(blen_data) - 1
-    print_error = True
+    if max_idx < 0 or not len(blen_idx):
+        return
 
-    def check_skip(blen_idx, fbx_idx):
-        nonlocal print_error
-        if fbx_idx < 0:  # Negative values mean 'skip'.
-            return True
-        if blen_idx > max_idx:
-            if print_error:
-                print("ERROR: too much data in this layer, compared to elements in mesh, skipping!")
-                print_error = False
-            return True
-        return False
+    fbx_data = np.asarray(fbx_data)
 
-    if xform is not None:
-        if isinstance(blen_data, list):
-            if item_size == 1:
-                def _process(blend_data, blen_attr, fbx_data, xform, item_size, blen_idx, fbx_idx):
-                    blen_data[blen_idx] = xform(fbx_data[fbx_idx])
-            else:
-                def _process(blend_data, blen_attr, fbx_data, xform, item_size, blen_idx, fbx_idx):
-                    blen_data[blen_idx] = xform(fbx_data[fbx_idx:fbx_idx + item_size])
-        else:
-            if item_size == 1:
-                def _process(blend_data, blen_attr, fbx_data, xform, item_size, blen_idx, fbx_idx):
-                    setattr(blen_data[blen_idx], blen_attr, xform(fbx_data[fbx_idx]))
-            else:
-                def _process(blend_data, blen_attr, fbx_data, xform, item_size, blen_idx, fbx_idx):
-                    setattr(blen_data[blen_idx], blen_attr, xform(fbx_data[fbx_idx:fbx_idx + item_size]))
+    # Negative values mean 'skip', as well as (broken) indices out of FBX data range.
+    valid = (fbx_idx >= 0) & (fbx_idx + item_size <= len(fbx_data))
+    too_much = blen_idx > max_idx
+    if too_much.any():
+        print("ERROR: too much data in this layer, compared to elements in mesh, skipping!")
+        valid &= ~too_much
+    if not valid.all():
+        blen_idx = blen_idx[valid]
+        fbx_idx = fbx_idx[valid]
+
+    if item_size == 1:
+        values = fbx_data[fbx_idx]
     else:
-        if isinstance(blen_data, list):
-            if item_size == 1:
-                def _process(blend_data, blen_attr, fbx_data, xform, item_size, blen_idx, fbx_idx):
-                    blen_data[blen_idx] = fbx_data[fbx_idx]
-            else:
-                def _process(blend_data, blen_attr, fbx_data, xform, item_size, blen_idx, fbx_idx):
-                    blen_data[blen_idx] = fbx_data[fbx_idx:fbx_idx + item_size]
-        else:
-            if item_size == 1:
-                def _process(blend_data, blen_attr, fbx_data, xform, item_size, blen_idx, fbx_idx):
-                    setattr(blen_data[blen_idx], blen_attr, fbx_data[fbx_idx])
-            else:
-                def _process(blend_data, blen_attr, fbx_data, xform, item_size, blen_idx, fbx_idx):
-                    setattr(blen_data[blen_idx], blen_attr, fbx_data[fbx_idx:fbx_idx + item_size])
+        values = fbx_data[fbx_idx[:, None] + np.arange(item_size)]
+    if xform is not None:
+        values = xform(values)
 
-    for blen_idx, fbx_idx in generator:
-        if check_skip(blen_idx, fbx_idx):
-            continue
-        _process(blen_data, blen_attr, fbx_data, xform, item_size, blen_idx, fbx_idx)
+    if isinstance(blen_data, np.ndarray):
+        blen_data[blen_idx] = values
+        return
 
+    # Fully covered data does not need to get current values first.
+    shape = (len(blen_data), item_size) if item_size > 1 else (len(blen_data),)
+    blen_values = np.empty(shape, dtype=blen_read_geom_array_foreach_dtype(blen_data, blen_attr))
+    if len(blen_idx) != len(blen_data):
+        blen_data.foreach_get(blen_attr, blen_values.ravel())
+    blen_values[blen_idx] = values
+    blen_data.foreach_set(blen_attr, blen_values.ravel())
 
-# generic generators.
+
+# generic index generators, return (blen_idx, fbx_idx) numpy arrays.
 def blen_read_geom_array_gen_allsame(data_len):
-    return zip(*(range(data_len), (0,) * data_len))
+    return np.arange(data_len), np.zeros(data_len, dtype=np.int64)
 
 
 def blen_read_geom_array_gen_direct(fbx_data, stride):
     fbx_data_len = len(fbx_data)
-    return zip(*(range(fbx_data_len // stride), range(0, fbx_data_len, stride)))
+    return np.arange(fbx_data_len // stride), np.arange(0, (fbx_data_len // stride) * stride, stride)
 
 
 def blen_read_geom_array_gen_indextodirect(fbx_layer_index, stride):
-    return ((bi, fi * stride) for bi, fi in enumerate(fbx_layer_index))
+    fbx_layer_index = np.asarray(fbx_layer_index, dtype=np.int64)
+    return np.arange(len(fbx_layer_index)), fbx_layer_index * stride
 
 
 def blen_read_geom_array_gen_direct_looptovert(mesh, fbx_data, stride):
     fbx_data_len = len(fbx_data) // stride
     loops = mesh.loops
-    for p in mesh.polygons:
-        for lidx in p.loop_indices:
-            vidx = loops[lidx].vertex_index
-            if vidx < fbx_data_len:
-                yield lidx, vidx * stride
+    loop_vidx = np.empty(len(loops), dtype=np.int32)
+    loops.foreach_get("vertex_index", loop_vidx)
+    blen_idx = np.flatnonzero(loop_vidx < fbx_data_len)
+    return blen_idx, loop_vidx[blen_idx].astype(np.int64) * stride
 
 
 # generic error printers.
@@ -1098,7 +1097,7 @@ def blen_read_geom_layer_smooth(fbx_obj, mesh):
             fbx_layer_data, None,
             fbx_layer_mapping, fbx_layer_ref,
             1, 1, layer_id,
-            xform=lambda s: not s,
+            xform=np.logical_not,
             )
         # We only set sharp edges here, not face smoothing itself...
         mesh.use_auto_smooth = True
@@ -1117,8 +1116,6 @@ def blen_read_geom_layer_smooth(fbx_obj, mesh):
         return False
 
 def blen_read_geom_layer_edge_crease(fbx_obj, mesh):
-    from math import sqrt
-
     fbx_layer = elem_find_first(fbx_obj, b'LayerElementEdgeCrease')
 
     if fbx_layer is None:
@@ -1155,7 +1152,7 @@ def blen_read_geom_layer_edge_crease(fbx_obj, mesh):
             1, 1, layer_id,
             # Blender squares those values before sending them to OpenSubdiv, when other softwares don't,
             # so we need to compensate that to get similar results through FBX...
-            xform=sqrt,
+            xform=np.sqrt,
             )
     else:
         print("warning layer %r mapping type unsupported: %r" % (fbx_layer.id, fbx_layer_mapping))
@@ -1181,17 +1178,19 @@ def blen_read_geom_layer_normal(fbx_obj, mesh, xform=None):
              (mesh.polygons, "Polygons", True, blen_read_geom_array_mapped_polygon),
              (mesh.vertices, "Vertices", True, blen_read_geom_array_mapped_vert))
     for blen_data, blen_data_type, is_fake, func in tries:
-        bdata = [None] * len(blen_data) if is_fake else blen_data
+        bdata = np.zeros((len(blen_data), 3), dtype=np.float32) if is_fake else blen_data
         if func(mesh, bdata, "normal",
                 fbx_layer_data, fbx_layer_index, fbx_layer_mapping, fbx_layer_ref, 3, 3, layer_id, xform, True):
             if blen_data_type == "Polygons":
-                for pidx, p in enumerate(mesh.polygons):
-                    for lidx in range(p.loop_start, p.loop_start + p.loop_total):
-                        mesh.loops[lidx].normal[:] = bdata[pidx]
-            elif blen_data_type is "Vertices":
-                # We have to copy vnors to lnors! Far from elegant, but simple.
-                for l in mesh.loops:
-                    l.normal[:] = bdata[l.vertex_index]
+                poly_loop_totals = np.empty(len(mesh.polygons), dtype=np.int32)
+                mesh.polygons.foreach_get("loop_total", poly_loop_totals)
+                # Loops of a polygon are contiguous, and polygons are stored in loops order.
+                mesh.loops.foreach_set("normal", np.repeat(bdata, poly_loop_totals, axis=0).ravel())
+            elif blen_data_type == "Vertices":
+                # We have to copy vnors to lnors!
+                loop_vidx = np.empty(len(mesh.loops), dtype=np.int32)
+                mesh.loops.foreach_get("vertex_index", loop_vidx)
+                mesh.loops.foreach_set("normal", bdata[loop_vidx].ravel())
             return True
 
     blen_read_geom_array_error_mapping("normal", fbx_layer_mapping)
@@ -1200,7 +1199,6 @@ def blen_read_geom_layer_normal(fbx_obj, mesh, xform=None):
 
 
 def blen_read_geom(fbx_tmpl, fbx_obj, settings):
-    from itertools import chain
     import array
 
     # Vertices are in object space, but we are post-multiplying all transforms with the inverse of the
@@ -1220,11 +1218,10 @@ def blen_read_geom(fbx_tmpl, fbx_obj, settings):
     fbx_polys = elem_prop_first(elem_find_first(fbx_obj, b'PolygonVertexIndex'))
     fbx_edges = elem_prop_first(elem_find_first(fbx_obj, b'Edges'))
 
-    if geom_mat_co is not None:
-        def _vcos_transformed_gen(raw_cos, m=None):
-            # Note: we could most likely get much better performances with numpy, but will leave this as TODO for now.
-            return chain(*(m @ Vector(v) for v in zip(*(iter(raw_cos),) * 3)))
-        fbx_verts = array.array(fbx_verts.typecode, _vcos_transformed_gen(fbx_verts, geom_mat_co))
+    if geom_mat_co is not None and fbx_verts is not None:
+        geom_mat_co_np = np.array(geom_mat_co, dtype=np.float64)
+        fbx_verts = np.asarray(fbx_verts, dtype=np.float64).reshape(-1, 3)
+        fbx_verts = (fbx_verts @ geom_mat_co_np[:3, :3].T + geom_mat_co_np[:3, 3]).ravel()
 
     if fbx_verts is None:
         fbx_verts = ()
@@ -1237,17 +1234,14 @@ def blen_read_geom(fbx_tmpl, fbx_obj, settings):
 
     if fbx_polys:
         mesh.loops.add(len(fbx_polys))
-        poly_loop_starts = []
-        poly_loop_totals = []
-        poly_loop_prev = 0
-        for i, l in enumerate(mesh.loops):
-            index = fbx_polys[i]
-            if index < 0:
-                poly_loop_starts.append(poly_loop_prev)
-                poly_loop_totals.append((i - poly_loop_prev) + 1)
-                poly_loop_prev = i + 1
-                index ^= -1
-            l.vertex_index = index
+        fbx_polys_np = np.asarray(fbx_polys, dtype=np.int32)
+        # Last index of each polygon is negative (bitwise-not'ed).
+        poly_loop_ends = np.flatnonzero(fbx_polys_np < 0)
+        poly_loop_starts = np.empty(len(poly_loop_ends), dtype=np.int32)
+        poly_loop_starts[:1] = 0
+        poly_loop_starts[1:] = poly_loop_ends[:-1] + 1
+        poly_loop_totals = (poly_loop_ends + 1 - poly_loop_starts).astype(np.int32)
+        mesh.loops.foreach_set("vertex_index", np.where(fbx_polys_np < 0, ~fbx_polys_np, fbx_polys_np))
 
         mesh.polygons.add(len(poly_loop_starts))
         mesh.polygons.foreach_set("loop_start", poly_loop_starts)
@@ -1301,8 +1295,10 @@ def blen_read_geom(fbx_tmpl, fbx_obj, settings):
         if geom_mat_no is None:
             ok_normals = blen_read_geom_layer_normal(fbx_obj, mesh)
         else:
+            geom_mat_no_np = np.array(geom_mat_no.to_3x3(), dtype=np.float64)
+
             def nortrans(v):
-                return geom_mat_no @ Vector(v)
+                return v @ geom_mat_no_np.T
             ok_normals = blen_read_geom_layer_normal(fbx_obj, mesh, nortrans)
 
     mesh.validate(clean_customdata=False)  # *Very* important to not remove lnors here!
@@ -2338,7 +2334,9 @@ def load(operator, context, filepath="",
          automatic_bone_orientation=False,
          primary_bone_axis='Y',
          secondary_bone_axis='X',
-         use_prepost_rot=True):
+         use_prepost_rot=True,
+         use_lazy_parsing=True,
+         decompression_threads=0):
 
     global fbx_elem_nil
     fbx_elem_nil = FBXElem('', (), (), ())
@@ -2364,7 +2362,9 @@ def load(operator, context, filepath="",
         return {'CANCELLED'}
 
     try:
-        elem_root, version = parse_fbx.parse(filepath)
+        # Lazy parsing only decodes (and keeps in memory) the parts of the file we actually use.
+        # In both cases, compressed arrays get decompressed in parallel by decompression_threads (0: all cores).
+        elem_root, version = parse_fbx.parse(filepath, use_lazy=use_lazy_parsing, num_threads=decompression_threads)
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -2477,6 +2477,10 @@ def load(operator, context, filepath="",
     if fbx_nodes is None:
         operator.report({'ERROR'}, "No 'Objects' found in file %r" % filepath)
         return {'CANCELLED'}
+    if use_lazy_parsing and decompression_threads != 1:
+        # All objects get read, so decompress their arrays upfront, in parallel.
+        perfmon.step("FBX import: Decompressing arrays...")
+        parse_fbx.lazy_decode_arrays(fbx_nodes.elems, decompression_threads)
     if fbx_connections is None:
         operator.report({'ERROR'}, "No 'Connections' found in file %r" % filepath)
         return {'CANCELLED'}
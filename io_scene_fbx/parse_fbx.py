@@ -23,16 +23,22 @@
 
 __all__ = (
     "parse",
+    "parse_lazy",
+    "parse_lazy_elem",
     "data_types",
     "parse_version",
     "FBXElem",
+    "FBXElemLazy",
     )
 
-from struct import unpack
+from struct import unpack, unpack_from
 import array
 import zlib
 
-from . import data_types
+try:
+    from . import data_types
+except:
+    import data_types
 
 # at the end of each nested block, there is a NUL record to indicate
 # that the sub-scope exists (i.e. to distinguish between P: and P : {})
@@ -76,6 +82,10 @@ def unpack_array(read, array_type, array_stride, array_byteswap):
     elif encoding == 1:
         data = zlib.decompress(data)
 
+    return unpack_array_data(data, length, array_type, array_stride, array_byteswap)
+
+
+def unpack_array_data(data, length, array_type, array_stride, array_byteswap):
     assert(length * array_stride == len(data))
 
     data_array = array.array(array_type, data)
@@ -101,6 +111,67 @@ read_data_dict = {
     b'c'[0]: lambda read: unpack_array(read, data_types.ARRAY_BYTE, 1, False),  # array (ubyte)
     }
 
+# Array properties: type -> (array type, array stride, array byteswap).
+_prop_array_info = {
+    data_types.FLOAT32_ARRAY: (data_types.ARRAY_FLOAT32, 4, False),
+    data_types.INT32_ARRAY: (data_types.ARRAY_INT32, 4, True),
+    data_types.FLOAT64_ARRAY: (data_types.ARRAY_FLOAT64, 8, False),
+    data_types.INT64_ARRAY: (data_types.ARRAY_INT64, 8, True),
+    data_types.BOOL_ARRAY: (data_types.ARRAY_BOOL, 1, False),
+    data_types.BYTE_ARRAY: (data_types.ARRAY_BYTE, 1, False),
+    }
+
+# Compressed arrays smaller than this are always decompressed immediately,
+# not worth the overhead of dispatching them to a worker thread.
+_DEFERRED_ARRAY_MIN_SIZE = 16 * 1024
+
+
+def read_array_deferred(read, props_data, index, array_jobs, array_info):
+    """
+    Read a compressed array property, and queue its decompression in array_jobs instead of doing it immediately
+    (props_data[index] will be filled by decode_array_jobs()).
+    """
+    length = read_uint(read)
+    encoding = read_uint(read)
+    comp_len = read_uint(read)
+
+    data = read(comp_len)
+
+    if encoding == 1 and comp_len >= _DEFERRED_ARRAY_MIN_SIZE:
+        array_jobs.append((props_data, index, data, length, array_info))
+        return None
+    elif encoding == 1:
+        data = zlib.decompress(data)
+
+    return unpack_array_data(data, length, *array_info)
+
+
+def decode_array_job(job):
+    props_data, index, data, length, array_info = job
+    # zlib releases the GIL while decompressing, so this scales over several threads.
+    props_data[index] = unpack_array_data(zlib.decompress(data), length, *array_info)
+
+
+def decode_array_jobs(array_jobs, num_threads):
+    """
+    Decompress all queued arrays, using a pool of num_threads worker threads.
+    """
+    if not array_jobs:
+        return
+    if num_threads == 1 or len(array_jobs) == 1:
+        for job in array_jobs:
+            decode_array_job(job)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Biggest arrays first, gives better load balancing between the threads.
+        array_jobs.sort(key=lambda job: len(job[2]), reverse=True)
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            # Consume the results so that exceptions raised in worker threads are propagated.
+            for _ in executor.map(decode_array_job, array_jobs):
+                pass
+    array_jobs.clear()
+
 
 # FBX 7500 (aka FBX2016) introduces incompatible changes at binary level:
 #   * The NULL block marking end of nested stuff switches from 13 bytes long to 25 bytes long.
@@ -121,7 +192,7 @@ def init_version(fbx_version):
     _BLOCK_SENTINEL_DATA = (b'\0' * _BLOCK_SENTINEL_LENGTH)
 
 
-def read_elem(read, tell, use_namedtuple):
+def read_elem(read, tell, use_namedtuple, array_jobs=None):
     # [0] the offset at which this block ends
     # [1] the number of properties in the scope
     # [2] the length of the property list
@@ -139,12 +210,16 @@ def read_elem(read, tell, use_namedtuple):
 
     for i in range(prop_count):
         data_type = read(1)[0]
-        elem_props_data[i] = read_data_dict[data_type](read)
+        if array_jobs is not None and data_type in _prop_array_info:
+            array_info = _prop_array_info[data_type]
+            elem_props_data[i] = read_array_deferred(read, elem_props_data, i, array_jobs, array_info)
+        else:
+            elem_props_data[i] = read_data_dict[data_type](read)
         elem_props_type[i] = data_type
 
     if tell() < end_offset:
         while tell() < (end_offset - _BLOCK_SENTINEL_LENGTH):
-            elem_subtree.append(read_elem(read, tell, use_namedtuple))
+            elem_subtree.append(read_elem(read, tell, use_namedtuple, array_jobs))
 
         if read(_BLOCK_SENTINEL_LENGTH) != _BLOCK_SENTINEL_DATA:
             raise IOError("failed to read nested block sentinel, "
@@ -171,7 +246,26 @@ def parse_version(fn):
         return read_uint(read)
 
 
-def parse(fn, use_namedtuple=True):
+def parse(fn, use_namedtuple=True, use_lazy=False, num_threads=1):
+    """
+    Parse a binary FBX file, return a (root_elem, fbx_version) tuple.
+
+    When use_lazy is set, the file is memory-mapped and the returned elements are FBXElemLazy instances,
+    only decoding their properties and children when accessed (use_namedtuple and num_threads are ignored then,
+    see lazy_decode_arrays() to decompress the arrays of the parts that will be used in parallel).
+
+    num_threads is the number of threads used to decompress the arrays
+    (zero to use as many as there are CPU cores, one to decompress them immediately while parsing).
+    """
+    if use_lazy:
+        return parse_lazy(fn)
+
+    if num_threads == 0:
+        import os
+        num_threads = os.cpu_count() or 1
+    # Compressed arrays are collected during the structural pass, and decompressed afterwards in parallel.
+    array_jobs = [] if num_threads > 1 else None
+
     root_elems = []
 
     with open(fn, 'rb') as f:
@@ -185,10 +279,324 @@ def parse(fn, use_namedtuple=True):
         init_version(fbx_version)
 
         while True:
-            elem = read_elem(read, tell, use_namedtuple)
+            elem = read_elem(read, tell, use_namedtuple, array_jobs)
             if elem is None:
                 break
             root_elems.append(elem)
 
+    if array_jobs is not None:
+        decode_array_jobs(array_jobs, num_threads)
+
     args = (b'', [], bytearray(0), root_elems)
     return FBXElem(*args) if use_namedtuple else args, fbx_version
+
+
+# ----------------------------------------------------------------------------
+# Lazy, memory-mapped parsing.
+#
+# Only the element headers (end_offset, prop count & length, id) are read when walking a scope,
+# properties (and especially the potentially huge, compressed arrays) and sub-scopes are only decoded
+# when actually accessed. Memory usage thus scales with what is used from the file, not with its size.
+
+# Simple properties: type -> (struct format, size).
+_lazy_prop_simple = {
+    data_types.INT16: (b'<h', 2),
+    data_types.BOOL: (b'?', 1),
+    data_types.INT32: (b'<i', 4),
+    data_types.FLOAT32: (b'<f', 4),
+    data_types.FLOAT64: (b'<d', 8),
+    data_types.INT64: (b'<q', 8),
+    }
+
+
+class _FBXLazyFile:
+    """
+    Memory-mapped FBX file, shared by all lazy elements read from it
+    (also stores the version-dependent binary layout, so that several files can be used at the same time).
+    """
+    __slots__ = (
+        "data",
+        "fbx_version",
+        "elem_header_fmt",
+        "elem_header_size",
+        "sentinel_length",
+        )
+
+    def __init__(self, data, fbx_version):
+        self.data = data
+        self.fbx_version = fbx_version
+        if fbx_version < 7500:
+            self.elem_header_fmt = b'<3I'
+            self.elem_header_size = 12
+            self.sentinel_length = 13
+        else:
+            self.elem_header_fmt = b'<3Q'
+            self.elem_header_size = 24
+            self.sentinel_length = 25
+
+
+class FBXElemLazy:
+    """
+    FBXElem compatible element (same id, props, props_type and elems attributes),
+    properties and children are decoded from the memory-mapped file on first access only.
+    """
+    __slots__ = (
+        "id",
+
+        "_file",
+        "_offset",
+        "_props_offset",
+        "_prop_count",
+        "_elems_offset",
+        "_end_offset",
+
+        "_props",
+        "_props_type",
+        "_elems",
+        )
+
+    def __init__(self, lfile, elem_id, offset, props_offset, prop_count, elems_offset, end_offset):
+        self.id = elem_id
+        self._file = lfile
+        self._offset = offset
+        self._props_offset = props_offset
+        self._prop_count = prop_count
+        self._elems_offset = elems_offset
+        self._end_offset = end_offset
+        self._props = None
+        self._props_type = None
+        self._elems = None
+
+    def __repr__(self):
+        return "<FBXElemLazy %r, %d props, offsets %d-%d>" % (self.id, self._prop_count,
+                                                               self._offset, self._end_offset)
+
+    @property
+    def offset(self):
+        """Offset of this element in the file."""
+        return self._offset
+
+    @property
+    def end_offset(self):
+        """Offset of the end of this element (and its children) in the file."""
+        return self._end_offset
+
+    def props_array_lengths(self):
+        """
+        Return the number of items of each array property (None for other types of properties),
+        without decoding them.
+        """
+        data = self._file.data
+        props_type, props_offset = _lazy_read_props_type(data, self._props_offset, self._prop_count)
+        return [unpack_from(b'<I', data, ofs + 1)[0] if props_type[i] in _prop_array_info else None
+                for i, ofs in enumerate(props_offset)]
+
+    @property
+    def props_type(self):
+        if self._props_type is None:
+            self._props_type = _lazy_read_props_type(self._file.data, self._props_offset, self._prop_count)[0]
+        return self._props_type
+
+    @property
+    def props(self):
+        if self._props is None:
+            props_type, props_offset = _lazy_read_props_type(self._file.data, self._props_offset, self._prop_count)
+            self._props_type = props_type
+            self._props = [_lazy_read_prop(self._file.data, ofs) for ofs in props_offset]
+        return self._props
+
+    @property
+    def elems(self):
+        if self._elems is None:
+            self._elems = _lazy_read_elems(self._file, self._elems_offset, self._end_offset)
+        return self._elems
+
+
+def _lazy_read_props_type(data, offset, prop_count):
+    """
+    Return the types of the properties starting at given offset, and their offsets in the file,
+    without decoding their actual data.
+    """
+    props_type = bytearray(prop_count)
+    props_offset = [0] * prop_count
+    for i in range(prop_count):
+        data_type = data[offset]
+        props_type[i] = data_type
+        props_offset[i] = offset
+        offset += 1
+        simple = _lazy_prop_simple.get(data_type)
+        if simple is not None:
+            offset += simple[1]
+        elif data_type in _prop_array_info:
+            # length, encoding, comp_len
+            offset += 12 + unpack_from(b'<I', data, offset + 8)[0]
+        elif data_type in {data_types.BYTES, data_types.STRING}:
+            offset += 4 + unpack_from(b'<I', data, offset)[0]
+        else:
+            raise IOError("unknown property type %r at offset %d" % (bytes((data_type,)), offset - 1))
+    return props_type, props_offset
+
+
+def _lazy_read_prop(data, offset):
+    data_type = data[offset]
+    offset += 1
+    simple = _lazy_prop_simple.get(data_type)
+    if simple is not None:
+        return unpack_from(simple[0], data, offset)[0]
+    array_info = _prop_array_info.get(data_type)
+    if array_info is not None:
+        length, encoding, comp_len = unpack_from(b'<3I', data, offset)
+        offset += 12
+        array_data = data[offset:offset + comp_len]
+        if encoding == 1:
+            array_data = zlib.decompress(array_data)
+        return unpack_array_data(array_data, length, *array_info)
+    # BYTES or STRING.
+    size = unpack_from(b'<I', data, offset)[0]
+    offset += 4
+    return data[offset:offset + size]
+
+
+def _lazy_compressed_size(elem):
+    """
+    Return the total size of the compressed arrays of given lazy element's properties (zero if there is none).
+    """
+    data = elem._file.data
+    props_type, props_offset = _lazy_read_props_type(data, elem._props_offset, elem._prop_count)
+    size = 0
+    for i, ofs in enumerate(props_offset):
+        if props_type[i] in _prop_array_info:
+            length, encoding, comp_len = unpack_from(b'<3I', data, ofs + 1)
+            if encoding == 1:
+                size += comp_len
+    return size
+
+
+def lazy_decode_arrays(elems, num_threads):
+    """
+    Decode the properties of given lazy elements and of all their children which have compressed arrays,
+    decompressing them on a pool of num_threads worker threads (zero to use as many as there are CPU cores),
+    so that they are already available when accessed.
+    """
+    if num_threads == 0:
+        import os
+        num_threads = os.cpu_count() or 1
+
+    array_elems = []
+    stack = list(elems)
+    while stack:
+        elem = stack.pop()
+        if elem._props is None:
+            size = _lazy_compressed_size(elem)
+            if size >= _DEFERRED_ARRAY_MIN_SIZE:
+                array_elems.append((size, elem))
+        stack.extend(elem.elems)
+    if not array_elems:
+        return
+
+    def decode(elem):
+        # zlib releases the GIL while decompressing, so this scales over several threads.
+        elem.props
+
+    # Biggest arrays first, gives better load balancing between the threads.
+    array_elems.sort(key=lambda item: item[0], reverse=True)
+    if num_threads == 1 or len(array_elems) == 1:
+        for _size, elem in array_elems:
+            decode(elem)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=num_threads) as executor:
+            # Consume the results so that exceptions raised in worker threads are propagated.
+            for _ in executor.map(decode, (elem for _size, elem in array_elems)):
+                pass
+
+
+def _lazy_read_elem(lfile, offset):
+    """
+    Read only the header of the element at given offset, return None for the 'NULL' end record.
+    """
+    data = lfile.data
+    end_offset, prop_count, prop_length = unpack_from(lfile.elem_header_fmt, data, offset)
+    if end_offset == 0:
+        return None
+
+    id_offset = offset + lfile.elem_header_size
+    id_end = id_offset + 1 + data[id_offset]
+    elem_id = data[id_offset + 1:id_end]
+    return FBXElemLazy(lfile, elem_id, offset, id_end, prop_count, id_end + prop_length, end_offset)
+
+
+def _lazy_read_elems(lfile, offset, end_offset):
+    """
+    Read the headers of all children elements in given scope (from the end of its properties to its end_offset).
+    """
+    elems = []
+    if offset >= end_offset:
+        if offset != end_offset:
+            raise IOError("scope length not reached, something is wrong")
+        return elems
+
+    sentinel_offset = end_offset - lfile.sentinel_length
+    while offset < sentinel_offset:
+        elem = _lazy_read_elem(lfile, offset)
+        if elem is None:
+            raise IOError("unexpected empty element at offset %d" % offset)
+        elems.append(elem)
+        offset = elem._end_offset
+
+    if offset != sentinel_offset or lfile.data[offset:end_offset].count(0) != lfile.sentinel_length:
+        raise IOError("failed to read nested block sentinel, "
+                      "expected all bytes to be 0")
+    return elems
+
+
+def _lazy_open(fn):
+    import mmap
+
+    with open(fn, 'rb') as f:
+        read = f.read
+
+        if read(len(_HEAD_MAGIC)) != _HEAD_MAGIC:
+            raise IOError("Invalid header")
+
+        fbx_version = read_uint(read)
+        offset = f.tell()
+
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    return _FBXLazyFile(data, fbx_version), offset
+
+
+def parse_lazy_elem(fn, offset):
+    """
+    Memory-map given binary FBX file, and return a (elem, fbx_version) tuple,
+    where elem is the FBXElemLazy starting at given offset (as given by FBXElemLazy.offset).
+    """
+    lfile, _offset = _lazy_open(fn)
+    elem = _lazy_read_elem(lfile, offset)
+    if elem is None:
+        raise IOError("no element at offset %d" % offset)
+    return elem, lfile.fbx_version
+
+
+def parse_lazy(fn):
+    """
+    Memory-map given binary FBX file, and return a (root_elem, fbx_version) tuple,
+    where all elements are FBXElemLazy ones.
+
+    The file remains mapped as long as some of its elements are referenced.
+    """
+    lfile, offset = _lazy_open(fn)
+    fbx_version = lfile.fbx_version
+
+    root_elems = []
+    while True:
+        elem = _lazy_read_elem(lfile, offset)
+        if elem is None:
+            break
+        root_elems.append(elem)
+        offset = elem._end_offset
+
+    elem_root = FBXElem(b'', [], bytearray(0), root_elems)
+    return elem_root, fbx_version
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# Script copyright (C) 2019 Blender Foundation
+
+"""
+Usage
+=====
+
+   parse_fbx_bench [--meshes N] [--verts N] [--repeat N] [--lazy]
+
+This script writes a synthetic multi-mesh binary FBX file (using encode_bin),
+and times its parsing with an increasing number of array decompression threads,
+from one up to the number of CPU cores.
+
+With --lazy, the file is parsed lazily, and the arrays of its objects are then
+decompressed with parse_fbx.lazy_decode_arrays() (as done by the importer).
+
+It does not require Blender.
+"""
+
+import os
+import sys
+import time
+import array
+
+import encode_bin
+import parse_fbx
+import data_types
+
+
+def bench_write_file(fn, num_meshes, num_verts):
+    import random
+    rand = random.Random(0)
+
+    elem_root = encode_bin.FBXElem(b'')
+
+    elem = encode_bin.FBXElem(b'FileId')
+    elem.add_bytes(b'\0' * 16)
+    elem_root.elems.append(elem)
+    elem = encode_bin.FBXElem(b'CreationTime')
+    elem.add_string(b'')
+    elem_root.elems.append(elem)
+
+    elem_objects = encode_bin.FBXElem(b'Objects')
+    elem_root.elems.append(elem_objects)
+
+    # Some noise, so that zlib has actual work to do (it would be unrealistically fast on constant data).
+    co = array.array(data_types.ARRAY_FLOAT64, (round(rand.random(), 3) for _ in range(num_verts * 3)))
+    indices = array.array(data_types.ARRAY_INT32, (rand.randrange(num_verts) for _ in range(num_verts * 4)))
+    indices[3::4] = array.array(data_types.ARRAY_INT32, (~i for i in indices[3::4]))
+
+    for i in range(num_meshes):
+        elem_geom = encode_bin.FBXElem(b'Geometry')
+        elem_geom.add_int64(i + 1)
+        elem_geom.add_string(b'Mesh%d\x00\x01Geometry' % i)
+        elem_geom.add_string(b'Mesh')
+
+        elem = encode_bin.FBXElem(b'Vertices')
+        elem.add_float64_array(co)
+        elem_geom.elems.append(elem)
+        elem = encode_bin.FBXElem(b'PolygonVertexIndex')
+        elem.add_int32_array(indices)
+        elem_geom.elems.append(elem)
+
+        elem_objects.elems.append(elem_geom)
+
+    encode_bin.write(fn, elem_root, 7400)
+
+
+def bench_parse(fn, num_threads, repeat, use_lazy=False):
+    best = None
+    for _ in range(repeat):
+        t = time.perf_counter()
+        elem_root, _fbx_version = parse_fbx.parse(fn, use_lazy=use_lazy, num_threads=num_threads)
+        if use_lazy:
+            for elem in elem_root.elems:
+                if elem.id == b'Objects':
+                    parse_fbx.lazy_decode_arrays(elem.elems, num_threads)
+        t = time.perf_counter() - t
+        del elem_root
+        best = t if best is None else min(best, t)
+    return best
+
+
+def main():
+    import argparse
+    import tempfile
+
+    parser = argparse.ArgumentParser(description="Benchmark threaded decompression of FBX arrays.")
+    parser.add_argument("--meshes", type=int, default=32, help="Number of meshes in the synthetic file")
+    parser.add_argument("--verts", type=int, default=100000, help="Number of vertices per mesh")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timings per thread count (best is kept)")
+    parser.add_argument("--lazy", action="store_true", help="Use lazy parsing")
+    args = parser.parse_args()
+
+    num_cores = os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        fn = os.path.join(tmpdir, "bench.fbx")
+        print("Writing %d meshes of %d vertices..." % (args.meshes, args.verts))
+        bench_write_file(fn, args.meshes, args.verts)
+        print("File size: %.1f MiB, %d CPU cores" % (os.path.getsize(fn) / (1024 * 1024), num_cores))
+
+        num_threads_all = sorted({1, 2, 4, 8, 16, 32, num_cores})
+        time_ref = None
+        for num_threads in num_threads_all:
+            if num_threads > num_cores:
+                break
+            t = bench_parse(fn, num_threads, args.repeat, args.lazy)
+            if time_ref is None:
+                time_ref = t
+            print("%3d thread(s): %.3f sec (x%.2f)" % (num_threads, t, time_ref / t))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -313,6 +313,21 @@ class ExportGLTF2_Base:
         default=False
     )
 
+    export_deduplicate_buffers: BoolProperty(
+        name='Deduplicate Binary Data',
+        description='Share a single buffer view between identical binary data blocks '
+                    '(e.g. identical meshes), reducing file size',
+        default=False
+    )
+
+    export_image_cache_directory: StringProperty(
+        name='Image Cache Directory',
+        description='Directory where encoded images are cached between exports (no caching if empty)',
+        subtype='DIR_PATH',
+        default='',
+        options={'HIDDEN'}
+    )
+
     will_save_settings: BoolProperty(
         name='Remember Export Settings',
         description='Store glTF export settings in the Blender project',
@@ -424,6 +439,11 @@ class ExportGLTF2_Base:
 
         export_settings['gltf_lights'] = self.export_lights
         export_settings['gltf_displacement'] = self.export_displacement
+        export_settings['gltf_deduplicate_buffers'] = self.export_deduplicate_buffers
+        if self.export_image_cache_directory:
+            export_settings['gltf_image_cache_directory'] = bpy.path.abspath(self.export_image_cache_directory)
+        else:
+            export_settings['gltf_image_cache_directory'] = None
 
         export_settings['gltf_binary'] = bytearray()
         export_settings['gltf_binaryfilename'] = os.path.splitext(os.path.basename(
@@ -553,6 +573,7 @@ class GLTF_PT_export_geometry(bpy.types.Panel):
         col = layout.column()
         col.active = operator.export_materials
         col.prop(operator, 'export_image_format')
+        layout.prop(operator, 'export_deduplicate_buffers')
 
 
 class GLTF_PT_export_geometry_compression(bpy.types.Panel):
@@ -813,7 +834,10 @@ class ImportGLTF2(Operator, ImportHelper):
             return {'CANCELLED'}
         self.gltf_importer.log.critical("Data are loaded, start creating Blender stuff")
         start_time = time.time()
-        BlenderGlTF.create(self.gltf_importer)
+        try:
+            BlenderGlTF.create(self.gltf_importer)
+        finally:
+            self.gltf_importer.close()
         elapsed_s = "{:.2f}s".format(time.time() - start_time)
         self.gltf_importer.log.critical("glTF import finished in " + elapsed_s)
         self.gltf_importer.log.removeHandler(self.gltf_importer.log_handler)
@@ -50,7 +50,8 @@ def save(context, export_settings):
 
 def __export(export_settings):
     export_settings['gltf_channelcache'] = dict()
-    exporter = GlTF2Exporter(__get_copyright(export_settings))
+    exporter = GlTF2Exporter(__get_copyright(export_settings),
+                             export_settings[gltf2_blender_export_keys.DEDUPLICATE_BUFFERS])
     __gather_gltf(exporter, export_settings)
     buffer = __create_buffer(exporter, export_settings)
     exporter.finalize_images(export_settings[gltf2_blender_export_keys.FILE_DIRECTORY])
@@ -52,6 +52,8 @@ ANIMATIONS = 'gltf_animations'
 EMBED_IMAGES = 'gltf_embed_images'
 BINARY = 'gltf_binary'
 EMBED_BUFFERS = 'gltf_embed_buffers'
+DEDUPLICATE_BUFFERS = 'gltf_deduplicate_buffers'
+IMAGE_CACHE_DIRECTORY = 'gltf_image_cache_directory'
 USE_NO_COLOR = 'gltf_use_no_color'
 
 METALLIC_ROUGHNESS_IMAGE = "metallic_roughness_image"
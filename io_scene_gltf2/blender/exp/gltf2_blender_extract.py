@@ -16,13 +16,13 @@
 # Imports
 #
 
+import numpy as np
 from mathutils import Vector, Quaternion, Matrix
-from mathutils.geometry import tessellate_polygon
 from operator import attrgetter
 
 from . import gltf2_blender_export_keys
 from ...io.com.gltf2_io_debug import print_console
-from ...io.com.gltf2_io_color_management import color_srgb_to_scene_linear
+from ...io.com.gltf2_io_color_management import colors_srgb_to_scene_linear
 from io_scene_gltf2.blender.exp import gltf2_blender_gather_skins
 import bpy
 
@@ -145,288 +145,86 @@ def decompose_transition(matrix, export_settings):
 
     return translation, rotation, scale
 
-def extract_primitive_floor(a, indices, use_tangents):
-    """Shift indices, that the first one starts with 0. It is assumed, that the indices are packed."""
-    attributes = {
-        POSITION_ATTRIBUTE: [],
-        NORMAL_ATTRIBUTE: []
-    }
 
-    if use_tangents:
-        attributes[TANGENT_ATTRIBUTE] = []
-
-    result_primitive = {
-        MATERIAL_ID: a[MATERIAL_ID],
-        INDICES_ID: [],
-        ATTRIBUTES_ID: attributes
-    }
-
-    source_attributes = a[ATTRIBUTES_ID]
-
-    #
-
-    tex_coord_index = 0
-    process_tex_coord = True
-    while process_tex_coord:
-        tex_coord_id = TEXCOORD_PREFIX + str(tex_coord_index)
-
-        if source_attributes.get(tex_coord_id) is not None:
-            attributes[tex_coord_id] = []
-            tex_coord_index += 1
-        else:
-            process_tex_coord = False
-
-    tex_coord_max = tex_coord_index
-
-    #
-
-    color_index = 0
-    process_color = True
-    while process_color:
-        color_id = COLOR_PREFIX + str(color_index)
-
-        if source_attributes.get(color_id) is not None:
-            attributes[color_id] = []
-            color_index += 1
-        else:
-            process_color = False
-
-    color_max = color_index
-
-    #
-
-    bone_index = 0
-    process_bone = True
-    while process_bone:
-        joint_id = JOINTS_PREFIX + str(bone_index)
-        weight_id = WEIGHTS_PREFIX + str(bone_index)
-
-        if source_attributes.get(joint_id) is not None:
-            attributes[joint_id] = []
-            attributes[weight_id] = []
-            bone_index += 1
-        else:
-            process_bone = False
-
-    bone_max = bone_index
-
-    #
-
-    morph_index = 0
-    process_morph = True
-    while process_morph:
-        morph_position_id = MORPH_POSITION_PREFIX + str(morph_index)
-        morph_normal_id = MORPH_NORMAL_PREFIX + str(morph_index)
-        morph_tangent_id = MORPH_TANGENT_PREFIX + str(morph_index)
-
-        if source_attributes.get(morph_position_id) is not None:
-            attributes[morph_position_id] = []
-            attributes[morph_normal_id] = []
-            if use_tangents:
-                attributes[morph_tangent_id] = []
-            morph_index += 1
-        else:
-            process_morph = False
-
-    morph_max = morph_index
-
-    #
-
-    min_index = min(indices)
-    max_index = max(indices)
-
-    for old_index in indices:
-        result_primitive[INDICES_ID].append(old_index - min_index)
-
-    for old_index in range(min_index, max_index + 1):
-        for vi in range(0, 3):
-            attributes[POSITION_ATTRIBUTE].append(source_attributes[POSITION_ATTRIBUTE][old_index * 3 + vi])
-            attributes[NORMAL_ATTRIBUTE].append(source_attributes[NORMAL_ATTRIBUTE][old_index * 3 + vi])
-
-        if use_tangents:
-            for vi in range(0, 4):
-                attributes[TANGENT_ATTRIBUTE].append(source_attributes[TANGENT_ATTRIBUTE][old_index * 4 + vi])
-
-        for tex_coord_index in range(0, tex_coord_max):
-            tex_coord_id = TEXCOORD_PREFIX + str(tex_coord_index)
-            for vi in range(0, 2):
-                attributes[tex_coord_id].append(source_attributes[tex_coord_id][old_index * 2 + vi])
-
-        for color_index in range(0, color_max):
-            color_id = COLOR_PREFIX + str(color_index)
-            for vi in range(0, 4):
-                attributes[color_id].append(source_attributes[color_id][old_index * 4 + vi])
-
-        for bone_index in range(0, bone_max):
-            joint_id = JOINTS_PREFIX + str(bone_index)
-            weight_id = WEIGHTS_PREFIX + str(bone_index)
-            for vi in range(0, 4):
-                attributes[joint_id].append(source_attributes[joint_id][old_index * 4 + vi])
-                attributes[weight_id].append(source_attributes[weight_id][old_index * 4 + vi])
-
-        for morph_index in range(0, morph_max):
-            morph_position_id = MORPH_POSITION_PREFIX + str(morph_index)
-            morph_normal_id = MORPH_NORMAL_PREFIX + str(morph_index)
-            morph_tangent_id = MORPH_TANGENT_PREFIX + str(morph_index)
-            for vi in range(0, 3):
-                attributes[morph_position_id].append(source_attributes[morph_position_id][old_index * 3 + vi])
-                attributes[morph_normal_id].append(source_attributes[morph_normal_id][old_index * 3 + vi])
-            if use_tangents:
-                for vi in range(0, 4):
-                    attributes[morph_tangent_id].append(source_attributes[morph_tangent_id][old_index * 4 + vi])
-
-    return result_primitive
-
-
-def extract_primitive_pack(a, indices, use_tangents):
-    """Pack indices, that the first one starts with 0. Current indices can have gaps."""
-    attributes = {
-        POSITION_ATTRIBUTE: [],
-        NORMAL_ATTRIBUTE: []
-    }
-
-    if use_tangents:
-        attributes[TANGENT_ATTRIBUTE] = []
-
-    result_primitive = {
-        MATERIAL_ID: a[MATERIAL_ID],
-        INDICES_ID: [],
-        ATTRIBUTES_ID: attributes
-    }
-
-    source_attributes = a[ATTRIBUTES_ID]
-
-    #
-
-    tex_coord_index = 0
-    process_tex_coord = True
-    while process_tex_coord:
-        tex_coord_id = TEXCOORD_PREFIX + str(tex_coord_index)
-
-        if source_attributes.get(tex_coord_id) is not None:
-            attributes[tex_coord_id] = []
-            tex_coord_index += 1
-        else:
-            process_tex_coord = False
-
-    tex_coord_max = tex_coord_index
-
-    #
-
-    color_index = 0
-    process_color = True
-    while process_color:
-        color_id = COLOR_PREFIX + str(color_index)
-
-        if source_attributes.get(color_id) is not None:
-            attributes[color_id] = []
-            color_index += 1
-        else:
-            process_color = False
-
-    color_max = color_index
-
-    #
-
-    bone_index = 0
-    process_bone = True
-    while process_bone:
-        joint_id = JOINTS_PREFIX + str(bone_index)
-        weight_id = WEIGHTS_PREFIX + str(bone_index)
-
-        if source_attributes.get(joint_id) is not None:
-            attributes[joint_id] = []
-            attributes[weight_id] = []
-            bone_index += 1
-        else:
-            process_bone = False
-
-    bone_max = bone_index
-
-    #
-
-    morph_index = 0
-    process_morph = True
-    while process_morph:
-        morph_position_id = MORPH_POSITION_PREFIX + str(morph_index)
-        morph_normal_id = MORPH_NORMAL_PREFIX + str(morph_index)
-        morph_tangent_id = MORPH_TANGENT_PREFIX + str(morph_index)
-
-        if source_attributes.get(morph_position_id) is not None:
-            attributes[morph_position_id] = []
-            attributes[morph_normal_id] = []
-            if use_tangents:
-                attributes[morph_tangent_id] = []
-            morph_index += 1
-        else:
-            process_morph = False
+def convert_swizzle_locations(locs, armature, blender_object, export_settings):
+    """Convert an (N, 3) array of locations from Blender coordinate system to glTF coordinate system."""
+    if armature:
+        # Mesh is skined, we have to apply armature transforms on data
+        apply_matrix = armature.matrix_world.inverted() @ blender_object.matrix_world
+        mat = np.array(armature.matrix_world @ apply_matrix, dtype=np.float64)
+        locs = locs @ mat[:3, :3].T + mat[:3, 3]
 
-    morph_max = morph_index
+    if export_settings[gltf2_blender_export_keys.YUP]:
+        return np.column_stack((locs[:, 0], locs[:, 2], -locs[:, 1]))
+    else:
+        return np.array(locs, dtype=np.float64)
 
-    #
 
-    old_to_new_indices = {}
-    new_to_old_indices = {}
+def convert_swizzle_normals_and_tangents(vecs, armature, blender_object, export_settings):
+    """Convert an (N, 3) array of normals (or tangents) from Blender coordinate system to glTF coordinate system."""
+    if armature:
+        # Mesh is skined, we have to apply armature transforms on data
+        apply_matrix = armature.matrix_world.inverted() @ blender_object.matrix_world
+        mat = np.array(apply_matrix.to_quaternion().to_matrix(), dtype=np.float64)
+        vecs = vecs @ mat.T
 
-    new_index = 0
-    for old_index in indices:
-        if old_to_new_indices.get(old_index) is None:
-            old_to_new_indices[old_index] = new_index
-            new_to_old_indices[new_index] = old_index
-            new_index += 1
+    if export_settings[gltf2_blender_export_keys.YUP]:
+        return np.column_stack((vecs[:, 0], vecs[:, 2], -vecs[:, 1]))
+    else:
+        return np.array(vecs, dtype=np.float64)
 
-        result_primitive[INDICES_ID].append(old_to_new_indices[old_index])
 
-    end_new_index = new_index
+def normalize_vectors(vecs):
+    """Normalize an (N, 3) array of vectors in place, leaving null ones unchanged."""
+    lengths = np.sqrt(np.einsum('ij,ij->i', vecs, vecs))
+    non_null = lengths != 0.0
+    vecs[non_null] /= lengths[non_null, np.newaxis]
+    return vecs
 
-    for new_index in range(0, end_new_index):
-        old_index = new_to_old_indices[new_index]
 
-        for vi in range(0, 3):
-            attributes[POSITION_ATTRIBUTE].append(source_attributes[POSITION_ATTRIBUTE][old_index * 3 + vi])
-            attributes[NORMAL_ATTRIBUTE].append(source_attributes[NORMAL_ATTRIBUTE][old_index * 3 + vi])
+def rotate_vectors_by_rotation_difference(vecs, vecs_from, vecs_to):
+    """
+    Rotate each vector of an (N, 3) array by the rotation between the matching vectors of vecs_from and vecs_to.
 
-        if use_tangents:
-            for vi in range(0, 4):
-                attributes[TANGENT_ATTRIBUTE].append(source_attributes[TANGENT_ATTRIBUTE][old_index * 4 + vi])
+    Vectorized equivalent of: vec.rotate(vec_from.rotation_difference(vec_to)).
+    """
+    vecs_from = normalize_vectors(np.array(vecs_from, dtype=np.float64))
+    vecs_to = normalize_vectors(np.array(vecs_to, dtype=np.float64))
+    axis = np.cross(vecs_from, vecs_to)
+    sin_angle = np.sqrt(np.einsum('ij,ij->i', axis, axis))
+    cos_angle = np.einsum('ij,ij->i', vecs_from, vecs_to)
 
-        for tex_coord_index in range(0, tex_coord_max):
-            tex_coord_id = TEXCOORD_PREFIX + str(tex_coord_index)
-            for vi in range(0, 2):
-                attributes[tex_coord_id].append(source_attributes[tex_coord_id][old_index * 2 + vi])
+    result = np.array(vecs, dtype=np.float64)
 
-        for color_index in range(0, color_max):
-            color_id = COLOR_PREFIX + str(color_index)
-            for vi in range(0, 4):
-                attributes[color_id].append(source_attributes[color_id][old_index * 4 + vi])
+    # Rodrigues' rotation formula.
+    rotated = sin_angle > np.finfo(np.float32).eps
+    k = axis[rotated] / sin_angle[rotated, np.newaxis]
+    v = result[rotated]
+    angle = np.arctan2(sin_angle[rotated], cos_angle[rotated])
+    cos_a = np.cos(angle)[:, np.newaxis]
+    sin_a = np.sin(angle)[:, np.newaxis]
+    result[rotated] = (v * cos_a + np.cross(k, v) * sin_a +
+                       k * np.einsum('ij,ij->i', k, v)[:, np.newaxis] * (1.0 - cos_a))
 
-        for bone_index in range(0, bone_max):
-            joint_id = JOINTS_PREFIX + str(bone_index)
-            weight_id = WEIGHTS_PREFIX + str(bone_index)
-            for vi in range(0, 4):
-                attributes[joint_id].append(source_attributes[joint_id][old_index * 4 + vi])
-                attributes[weight_id].append(source_attributes[weight_id][old_index * 4 + vi])
-
-        for morph_index in range(0, morph_max):
-            morph_position_id = MORPH_POSITION_PREFIX + str(morph_index)
-            morph_normal_id = MORPH_NORMAL_PREFIX + str(morph_index)
-            morph_tangent_id = MORPH_TANGENT_PREFIX + str(morph_index)
-            for vi in range(0, 3):
-                attributes[morph_position_id].append(source_attributes[morph_position_id][old_index * 3 + vi])
-                attributes[morph_normal_id].append(source_attributes[morph_normal_id][old_index * 3 + vi])
-            if use_tangents:
-                for vi in range(0, 4):
-                    attributes[morph_tangent_id].append(source_attributes[morph_tangent_id][old_index * 4 + vi])
+    # Opposite vectors: half turn around an arbitrary orthogonal axis, let mathutils pick it.
+    for i in np.nonzero(~rotated & (cos_angle < 0.0))[0]:
+        vec = Vector(result[i])
+        vec.rotate(Vector(vecs_from[i]).rotation_difference(Vector(vecs_to[i])))
+        result[i] = vec
 
-    return result_primitive
+    return result
 
 
 def extract_primitives(glTF, blender_mesh, blender_object, blender_vertex_groups, modifiers, export_settings):
     """
     Extract primitives from a mesh. Polygons are triangulated and sorted by material.
 
-    Furthermore, primitives are split up, if the indices range is exceeded.
+    Primitives are not split up when the indices range is exceeded, their indices then use UNSIGNED_INT
+    components instead (see gltf2_blender_gather_primitives).
     Finally, triangles are also split up/duplicated, if face normals are used instead of vertex normals.
+
+    All attributes are gathered per triangle corner (loop) into numpy arrays, and vertices are
+    deduplicated at once (per material) on their packed attributes.
     """
     print_console('INFO', 'Extracting primitive: ' + blender_mesh.name)
 
@@ -442,539 +240,299 @@ def extract_primitives(glTF, blender_mesh, blender_object, blender_vertex_groups
         except Exception:
             print_console('WARNING', 'Could not calculate tangents. Please try to triangulate the mesh first.')
 
-    #
-
-    material_map = {}
+    armature = None
+    if modifiers is not None:
+        modifiers_dict = {m.type: m for m in modifiers}
+        if "ARMATURE" in modifiers_dict:
+            modifier = modifiers_dict["ARMATURE"]
+            armature = modifier.object
 
     #
-    # Gathering position, normal and tex_coords.
+    # Triangulation of polygons. Blender handles non-convex polygons.
     #
-    no_material_attributes = {
-        POSITION_ATTRIBUTE: [],
-        NORMAL_ATTRIBUTE: []
-    }
-
-    if use_tangents:
-        no_material_attributes[TANGENT_ATTRIBUTE] = []
+    blender_mesh.calc_loop_triangles()
+    tri_count = len(blender_mesh.loop_triangles)
+    tri_loops = np.empty(tri_count * 3, dtype=np.int32)
+    blender_mesh.loop_triangles.foreach_get('loops', tri_loops)
+    tri_polygons = np.empty(tri_count, dtype=np.int32)
+    blender_mesh.loop_triangles.foreach_get('polygon_index', tri_polygons)
 
     #
-    # Directory of materials with its primitive.
+    # Mesh data.
     #
-    no_material_primitives = {
-        MATERIAL_ID: 0,
-        INDICES_ID: [],
-        ATTRIBUTES_ID: no_material_attributes
-    }
-
-    material_idx_to_primitives = {0: no_material_primitives}
-
-    #
-
-    vertex_index_to_new_indices = {}
-
-    material_map[0] = vertex_index_to_new_indices
+    vertex_count = len(blender_mesh.vertices)
+    loop_count = len(blender_mesh.loops)
+    polygon_count = len(blender_mesh.polygons)
+
+    vertex_co = np.empty(vertex_count * 3, dtype=np.float32)
+    blender_mesh.vertices.foreach_get('co', vertex_co)
+    vertex_co = vertex_co.reshape(vertex_count, 3)
+    vertex_normals = np.empty(vertex_count * 3, dtype=np.float32)
+    blender_mesh.vertices.foreach_get('normal', vertex_normals)
+    vertex_normals = vertex_normals.reshape(vertex_count, 3)
+
+    loop_vertex_indices = np.empty(loop_count, dtype=np.int32)
+    blender_mesh.loops.foreach_get('vertex_index', loop_vertex_indices)
+
+    polygon_normals = np.empty(polygon_count * 3, dtype=np.float32)
+    blender_mesh.polygons.foreach_get('normal', polygon_normals)
+    polygon_normals = polygon_normals.reshape(polygon_count, 3)
+    polygon_smooth = np.empty(polygon_count, dtype=np.bool_)
+    blender_mesh.polygons.foreach_get('use_smooth', polygon_smooth)
+    polygon_material_indices = np.empty(polygon_count, dtype=np.int32)
+    blender_mesh.polygons.foreach_get('material_index', polygon_material_indices)
+    polygon_loop_starts = np.empty(polygon_count, dtype=np.int32)
+    blender_mesh.polygons.foreach_get('loop_start', polygon_loop_starts)
+    polygon_loop_totals = np.empty(polygon_count, dtype=np.int32)
+    blender_mesh.polygons.foreach_get('loop_total', polygon_loop_totals)
+
+    # Polygon of each loop.
+    loop_polygons = np.zeros(loop_count, dtype=np.int32)
+    loop_offsets = np.arange(polygon_loop_totals.sum()) - np.repeat(
+        np.cumsum(polygon_loop_totals) - polygon_loop_totals, polygon_loop_totals)
+    loop_polygons[np.repeat(polygon_loop_starts, polygon_loop_totals) + loop_offsets] = \
+        np.repeat(np.arange(polygon_count, dtype=np.int32), polygon_loop_totals)
 
     #
-    # Create primitive for each material.
+    # From here, everything is per triangle corner ('corner' arrays, in triangles order).
     #
-    for (mat_idx, _) in enumerate(blender_mesh.materials):
-        attributes = {
-            POSITION_ATTRIBUTE: [],
-            NORMAL_ATTRIBUTE: []
-        }
-
-        if use_tangents:
-            attributes[TANGENT_ATTRIBUTE] = []
-
-        primitive = {
-            MATERIAL_ID: mat_idx,
-            INDICES_ID: [],
-            ATTRIBUTES_ID: attributes
-        }
+    corner_loops = tri_loops
+    corner_vertices = loop_vertex_indices[corner_loops]
+    corner_polygons = np.repeat(tri_polygons, 3)
 
-        material_idx_to_primitives[mat_idx] = primitive
+    if export_settings['gltf_materials'] is False or len(blender_mesh.materials) == 0:
+        corner_materials = np.zeros(len(corner_loops), dtype=np.int32)
+    else:
+        corner_materials = polygon_material_indices[corner_polygons]
+        corner_materials[corner_materials >= len(blender_mesh.materials)] = 0
 
-        #
+    corner_smooth = polygon_smooth[corner_polygons]
+    if blender_mesh.use_auto_smooth:
+        corner_smooth[:] = True
 
-        vertex_index_to_new_indices = {}
+    # Position.
+    v = convert_swizzle_locations(vertex_co, armature, blender_object, export_settings)
+    corner_positions = v[corner_vertices]
 
-        material_map[mat_idx] = vertex_index_to_new_indices
+    # Normal.
+    if blender_mesh.has_custom_normals:
+        loop_normals = np.empty(loop_count * 3, dtype=np.float32)
+        blender_mesh.loops.foreach_get('normal', loop_normals)
+        smooth_normals = loop_normals.reshape(loop_count, 3)[corner_loops]
+    else:
+        smooth_normals = vertex_normals[corner_vertices]
+    corner_normals = np.where(corner_smooth[:, np.newaxis], smooth_normals, polygon_normals[corner_polygons])
+    corner_normals = convert_swizzle_normals_and_tangents(corner_normals, armature, blender_object, export_settings)
 
-    tex_coord_max = 0
+    # Tangent.
+    if use_tangents:
+        loop_tangents = np.empty(loop_count * 3, dtype=np.float32)
+        blender_mesh.loops.foreach_get('tangent', loop_tangents)
+        loop_tangents = loop_tangents.reshape(loop_count, 3)
+        loop_bitangents = np.empty(loop_count * 3, dtype=np.float32)
+        blender_mesh.loops.foreach_get('bitangent', loop_bitangents)
+        loop_bitangents = loop_bitangents.reshape(loop_count, 3)
+
+        # Face tangents (for flat shaded polygons) are the normalized sum of their loops tangents.
+        face_tangents = np.zeros((polygon_count, 3))
+        face_bitangents = np.zeros((polygon_count, 3))
+        np.add.at(face_tangents, loop_polygons, loop_tangents)
+        np.add.at(face_bitangents, loop_polygons, loop_bitangents)
+        normalize_vectors(face_tangents)
+        normalize_vectors(face_bitangents)
+
+        smooth = corner_smooth[:, np.newaxis]
+        t = np.where(smooth, loop_tangents[corner_loops], face_tangents[corner_polygons])
+        b = np.where(smooth, loop_bitangents[corner_loops], face_bitangents[corner_polygons])
+
+        if not np.all(np.any(t != 0.0, axis=1)):
+            print_console('WARNING', 'Tangent has zero length.')
+
+        t = convert_swizzle_normals_and_tangents(t, armature, blender_object, export_settings)
+        b = convert_swizzle_locations(b, armature, blender_object, export_settings)
+
+        handedness = np.where(np.einsum('ij,ij->i', np.cross(corner_normals, t), b) < 0.0, -1.0, 1.0)
+        corner_tangents = np.column_stack((t, handedness))
+
+    # Texture coordinates.
+    corner_uvs = []
     if blender_mesh.uv_layers.active:
-        tex_coord_max = len(blender_mesh.uv_layers)
-
-    #
-
-    vertex_colors = {}
-
-    color_index = 0
+        for uv_layer in blender_mesh.uv_layers:
+            uvs = np.empty(loop_count * 2, dtype=np.float32)
+            uv_layer.data.foreach_get('uv', uvs)
+            uvs = uvs.reshape(loop_count, 2)[corner_loops].astype(np.float64)
+            uvs[:, 1] = 1.0 - uvs[:, 1]
+            corner_uvs.append(uvs)
+
+    # Colors.
+    corner_colors = []
     for vertex_color in blender_mesh.vertex_colors:
-        vertex_color_name = COLOR_PREFIX + str(color_index)
-        vertex_colors[vertex_color_name] = vertex_color
-
-        color_index += 1
-        if color_index >= GLTF_MAX_COLORS:
+        num_components = len(vertex_color.data[0].color) if len(vertex_color.data) > 0 else 4
+        colors = np.empty(loop_count * num_components, dtype=np.float32)
+        vertex_color.data.foreach_get('color', colors)
+        colors = colors.reshape(loop_count, num_components)[corner_loops]
+        alpha = colors[:, 3] if num_components == 4 else np.ones(len(colors))
+        corner_colors.append(np.column_stack((colors_srgb_to_scene_linear(colors[:, :3]), alpha)))
+
+        if len(corner_colors) >= GLTF_MAX_COLORS:
             break
-    color_max = color_index
 
-    #
+    # Joints and weights (gathered per vertex, as groups are of variable length).
+    corner_joints = []
+    corner_weights = []
+    used_vertices = np.unique(corner_vertices)
 
     bone_max = 0
-    for blender_polygon in blender_mesh.polygons:
-        for loop_index in blender_polygon.loop_indices:
-            vertex_index = blender_mesh.loops[loop_index].vertex_index
-            bones_count = len(blender_mesh.vertices[vertex_index].groups)
-            if bones_count > 0:
-                if bones_count % 4 == 0:
-                    bones_count -= 1
-                bone_max = max(bone_max, bones_count // 4 + 1)
-
-    #
-
-    morph_max = 0
-
-    blender_shape_keys = []
-
-    if blender_mesh.shape_keys is not None:
-        for blender_shape_key in blender_mesh.shape_keys.key_blocks:
-            if blender_shape_key != blender_shape_key.relative_key:
-                if blender_shape_key.mute is False:
-                    morph_max += 1
-                    blender_shape_keys.append(ShapeKey(
-                        blender_shape_key,
-                        blender_shape_key.normals_vertex_get(),  # calculate vertex normals for this shape key
-                        blender_shape_key.normals_polygon_get()))  # calculate polygon normals for this shape key
-
-
-    armature = None
-    if modifiers is not None:
-        modifiers_dict = {m.type: m for m in modifiers}
-        if "ARMATURE" in modifiers_dict:
-            modifier = modifiers_dict["ARMATURE"]
-            armature = modifier.object
-
-
-    #
-    # Convert polygon to primitive indices and eliminate invalid ones. Assign to material.
-    #
-    for blender_polygon in blender_mesh.polygons:
-        export_color = True
-
-        #
-
-        if export_settings['gltf_materials'] is False:
-            primitive = material_idx_to_primitives[0]
-            vertex_index_to_new_indices = material_map[0]
-        elif not blender_polygon.material_index in material_idx_to_primitives:
-            primitive = material_idx_to_primitives[0]
-            vertex_index_to_new_indices = material_map[0]
-        else:
-            primitive = material_idx_to_primitives[blender_polygon.material_index]
-            vertex_index_to_new_indices = material_map[blender_polygon.material_index]
-        #
-
-        attributes = primitive[ATTRIBUTES_ID]
-
-        face_normal = blender_polygon.normal
-        face_tangent = Vector((0.0, 0.0, 0.0))
-        face_bitangent = Vector((0.0, 0.0, 0.0))
-        if use_tangents:
-            for loop_index in blender_polygon.loop_indices:
-                temp_vertex = blender_mesh.loops[loop_index]
-                face_tangent += temp_vertex.tangent
-                face_bitangent += temp_vertex.bitangent
-
-            face_tangent.normalize()
-            face_bitangent.normalize()
-
-        #
-
-        indices = primitive[INDICES_ID]
-
-        loop_index_list = []
-
-        if len(blender_polygon.loop_indices) == 3:
-            loop_index_list.extend(blender_polygon.loop_indices)
-        elif len(blender_polygon.loop_indices) > 3:
-            # Triangulation of polygon. Using internal function, as non-convex polygons could exist.
-            polyline = []
-
-            for loop_index in blender_polygon.loop_indices:
-                vertex_index = blender_mesh.loops[loop_index].vertex_index
-                v = blender_mesh.vertices[vertex_index].co
-                polyline.append(Vector((v[0], v[1], v[2])))
-
-            triangles = tessellate_polygon((polyline,))
-
-            for triangle in triangles:
-
-                for triangle_index in triangle:
-                    loop_index_list.append(blender_polygon.loop_indices[triangle_index])
-        else:
-            continue
-
-        for loop_index in loop_index_list:
-            vertex_index = blender_mesh.loops[loop_index].vertex_index
-
-            if vertex_index_to_new_indices.get(vertex_index) is None:
-                vertex_index_to_new_indices[vertex_index] = []
-
-            #
-
-            v = None
-            n = None
-            t = None
-            b = None
-            uvs = []
-            colors = []
-            joints = []
-            weights = []
-
-            target_positions = []
-            target_normals = []
-            target_tangents = []
-
-            vertex = blender_mesh.vertices[vertex_index]
-
-            v = convert_swizzle_location(vertex.co, armature, blender_object, export_settings)
-            if blender_polygon.use_smooth or blender_mesh.use_auto_smooth:
-                if blender_mesh.has_custom_normals:
-                    n = convert_swizzle_normal_and_tangent(blender_mesh.loops[loop_index].normal, armature, blender_object, export_settings)
-                else:
-                    n = convert_swizzle_normal_and_tangent(vertex.normal, armature, blender_object, export_settings)
-                if use_tangents:
-                    t = convert_swizzle_tangent(blender_mesh.loops[loop_index].tangent, armature, blender_object, export_settings)
-                    b = convert_swizzle_location(blender_mesh.loops[loop_index].bitangent, armature, blender_object, export_settings)
-            else:
-                n = convert_swizzle_normal_and_tangent(face_normal, armature, blender_object, export_settings)
-                if use_tangents:
-                    t = convert_swizzle_tangent(face_tangent, armature, blender_object, export_settings)
-                    b = convert_swizzle_location(face_bitangent, armature, blender_object, export_settings)
+    for vertex_index in used_vertices.tolist():
+        bones_count = len(blender_mesh.vertices[vertex_index].groups)
+        if bones_count > 0:
+            if bones_count % 4 == 0:
+                bones_count -= 1
+            bone_max = max(bone_max, bones_count // 4 + 1)
+
+    if bone_max > 0 and export_settings[gltf2_blender_export_keys.SKINS]:
+        vertex_joints = np.zeros((vertex_count, bone_max * 4), dtype=np.uint32)
+        vertex_weights = np.zeros((vertex_count, bone_max * 4), dtype=np.float32)
+
+        if blender_vertex_groups is not None:
+            group_joint_indices = {}
+            if armature:
+                skin = gltf2_blender_gather_skins.gather_skin(armature, export_settings)
+                joint_name_indices = {}
+                for index, j in enumerate(skin.joints):
+                    joint_name_indices.setdefault(j.name, index)
+                for group_index, vertex_group in enumerate(blender_vertex_groups):
+                    joint_index = joint_name_indices.get(vertex_group.name)
+                    if joint_index is not None:
+                        group_joint_indices[group_index] = joint_index
 
-            if use_tangents:
-                tv = Vector((t[0], t[1], t[2]))
-                bv = Vector((b[0], b[1], b[2]))
-                nv = Vector((n[0], n[1], n[2]))
-
-                if (nv.cross(tv)).dot(bv) < 0.0:
-                    t[3] = -1.0
-
-            if blender_mesh.uv_layers.active:
-                for tex_coord_index in range(0, tex_coord_max):
-                    uv = blender_mesh.uv_layers[tex_coord_index].data[loop_index].uv
-                    uvs.append([uv.x, 1.0 - uv.y])
-
-            #
-
-            if color_max > 0 and export_color:
-                for color_index in range(0, color_max):
-                    color_name = COLOR_PREFIX + str(color_index)
-                    color = vertex_colors[color_name].data[loop_index].color
-                    if len(color) == 3:
-                        colors.append([
-                            color_srgb_to_scene_linear(color[0]),
-                            color_srgb_to_scene_linear(color[1]),
-                            color_srgb_to_scene_linear(color[2]),
-                            1.0
-                        ])
-                    else:
-                        colors.append([
-                            color_srgb_to_scene_linear(color[0]),
-                            color_srgb_to_scene_linear(color[1]),
-                            color_srgb_to_scene_linear(color[2]),
-                            color[3]
-                        ])
-
-            #
-
-            bone_count = 0
-
-            if blender_vertex_groups is not None and vertex.groups is not None and len(vertex.groups) > 0 and export_settings[gltf2_blender_export_keys.SKINS]:
-                joint = []
-                weight = []
-                vertex_groups = vertex.groups
+            for vertex_index in used_vertices.tolist():
+                vertex_groups = blender_mesh.vertices[vertex_index].groups
                 if not export_settings['gltf_all_vertex_influences']:
                     # sort groups by weight descending
-                    vertex_groups = sorted(vertex.groups, key=attrgetter('weight'), reverse=True)
-                for group_element in vertex_groups:
-
-                    if len(joint) == 4:
-                        bone_count += 1
-                        joints.append(joint)
-                        weights.append(weight)
-                        joint = []
-                        weight = []
+                    vertex_groups = sorted(vertex_groups, key=attrgetter('weight'), reverse=True)
 
-                    #
+                # Influences are packed by sets of 4, a set being ended as soon as it is full.
+                set_index = 0
+                set_size = 0
+                for group_element in vertex_groups:
+                    if set_size == 4:
+                        set_index += 1
+                        set_size = 0
 
                     joint_weight = group_element.weight
                     if joint_weight <= 0.0:
                         continue
 
-                    #
-
-                    vertex_group_index = group_element.group
-                    vertex_group_name = blender_vertex_groups[vertex_group_index].name
-
-                    joint_index = None
-
-                    if armature:
-                        skin = gltf2_blender_gather_skins.gather_skin(armature, export_settings)
-                        for index, j in enumerate(skin.joints):
-                            if j.name == vertex_group_name:
-                                joint_index = index
-                                break
-
-                    #
+                    joint_index = group_joint_indices.get(group_element.group)
                     if joint_index is not None:
-                        joint.append(joint_index)
-                        weight.append(joint_weight)
-
-                if len(joint) > 0:
-                    bone_count += 1
-
-                    for fill in range(0, 4 - len(joint)):
-                        joint.append(0)
-                        weight.append(0.0)
-
-                    joints.append(joint)
-                    weights.append(weight)
-
-            for fill in range(0, bone_max - bone_count):
-                joints.append([0, 0, 0, 0])
-                weights.append([0.0, 0.0, 0.0, 0.0])
-
-            #
-
-            if morph_max > 0 and export_settings[gltf2_blender_export_keys.MORPH]:
-                for morph_index in range(0, morph_max):
-                    blender_shape_key = blender_shape_keys[morph_index]
-
-                    v_morph = convert_swizzle_location(blender_shape_key.shape_key.data[vertex_index].co,
-                                                       armature, blender_object,
-                                                       export_settings)
-
-                    # Store delta.
-                    v_morph -= v
-
-                    target_positions.append(v_morph)
+                        vertex_joints[vertex_index, set_index * 4 + set_size] = joint_index
+                        vertex_weights[vertex_index, set_index * 4 + set_size] = joint_weight
+                        set_size += 1
 
-                    #
-
-                    n_morph = None
-
-                    if blender_polygon.use_smooth:
-                        temp_normals = blender_shape_key.vertex_normals
-                        n_morph = (temp_normals[vertex_index * 3 + 0], temp_normals[vertex_index * 3 + 1],
-                                   temp_normals[vertex_index * 3 + 2])
-                    else:
-                        temp_normals = blender_shape_key.polygon_normals
-                        n_morph = (
-                            temp_normals[blender_polygon.index * 3 + 0], temp_normals[blender_polygon.index * 3 + 1],
-                            temp_normals[blender_polygon.index * 3 + 2])
-
-                    n_morph = convert_swizzle_normal_and_tangent(Vector(n_morph), armature, blender_object, export_settings)
-
-                    # Store delta.
-                    n_morph -= n
-
-                    target_normals.append(n_morph)
-
-                    #
-
-                    if use_tangents:
-                        rotation = n_morph.rotation_difference(n)
-
-                        t_morph = Vector((t[0], t[1], t[2]))
-
-                        t_morph.rotate(rotation)
-
-                        target_tangents.append(t_morph)
-
-            #
-            #
-
-            create = True
-
-            for current_new_index in vertex_index_to_new_indices[vertex_index]:
-                found = True
-
-                for i in range(0, 3):
-                    if attributes[POSITION_ATTRIBUTE][current_new_index * 3 + i] != v[i]:
-                        found = False
-                        break
-
-                    if attributes[NORMAL_ATTRIBUTE][current_new_index * 3 + i] != n[i]:
-                        found = False
-                        break
-
-                if use_tangents:
-                    for i in range(0, 4):
-                        if attributes[TANGENT_ATTRIBUTE][current_new_index * 4 + i] != t[i]:
-                            found = False
-                            break
-
-                if not found:
-                    continue
-
-                for tex_coord_index in range(0, tex_coord_max):
-                    uv = uvs[tex_coord_index]
-
-                    tex_coord_id = TEXCOORD_PREFIX + str(tex_coord_index)
-                    for i in range(0, 2):
-                        if attributes[tex_coord_id][current_new_index * 2 + i] != uv[i]:
-                            found = False
-                            break
-
-                if export_color:
-                    for color_index in range(0, color_max):
-                        color = colors[color_index]
-
-                        color_id = COLOR_PREFIX + str(color_index)
-                        for i in range(0, 3):
-                            # Alpha is always 1.0 - see above.
-                            current_color = attributes[color_id][current_new_index * 4 + i]
-                            if color_srgb_to_scene_linear(current_color) != color[i]:
-                                found = False
-                                break
-
-                if export_settings[gltf2_blender_export_keys.SKINS]:
-                    for bone_index in range(0, bone_max):
-                        joint = joints[bone_index]
-                        weight = weights[bone_index]
-
-                        joint_id = JOINTS_PREFIX + str(bone_index)
-                        weight_id = WEIGHTS_PREFIX + str(bone_index)
-                        for i in range(0, 4):
-                            if attributes[joint_id][current_new_index * 4 + i] != joint[i]:
-                                found = False
-                                break
-                            if attributes[weight_id][current_new_index * 4 + i] != weight[i]:
-                                found = False
-                                break
-
-                if export_settings[gltf2_blender_export_keys.MORPH]:
-                    for morph_index in range(0, morph_max):
-                        target_position = target_positions[morph_index]
-                        target_normal = target_normals[morph_index]
-                        if use_tangents:
-                            target_tangent = target_tangents[morph_index]
-
-                        target_position_id = MORPH_POSITION_PREFIX + str(morph_index)
-                        target_normal_id = MORPH_NORMAL_PREFIX + str(morph_index)
-                        target_tangent_id = MORPH_TANGENT_PREFIX + str(morph_index)
-                        for i in range(0, 3):
-                            if attributes[target_position_id][current_new_index * 3 + i] != target_position[i]:
-                                found = False
-                                break
-                            if attributes[target_normal_id][current_new_index * 3 + i] != target_normal[i]:
-                                found = False
-                                break
-                            if use_tangents:
-                                if attributes[target_tangent_id][current_new_index * 3 + i] != target_tangent[i]:
-                                    found = False
-                                    break
-
-                if found:
-                    indices.append(current_new_index)
-
-                    create = False
-                    break
-
-            if not create:
+        for bone_index in range(0, bone_max):
+            corner_joints.append(vertex_joints[corner_vertices, bone_index * 4:bone_index * 4 + 4])
+            corner_weights.append(vertex_weights[corner_vertices, bone_index * 4:bone_index * 4 + 4])
+
+    # Morph targets.
+    corner_target_positions = []
+    corner_target_normals = []
+    corner_target_tangents = []
+    if blender_mesh.shape_keys is not None and export_settings[gltf2_blender_export_keys.MORPH]:
+        for blender_shape_key in blender_mesh.shape_keys.key_blocks:
+            if blender_shape_key == blender_shape_key.relative_key or blender_shape_key.mute:
                 continue
 
-            new_index = 0
-
-            if primitive.get('max_index') is not None:
-                new_index = primitive['max_index'] + 1
+            shape_key_co = np.empty(vertex_count * 3, dtype=np.float32)
+            blender_shape_key.data.foreach_get('co', shape_key_co)
+            v_morph = convert_swizzle_locations(shape_key_co.reshape(vertex_count, 3),
+                                                armature, blender_object, export_settings)
+            # Store delta.
+            corner_target_positions.append(v_morph[corner_vertices] - corner_positions)
+
+            # Calculate vertex and polygon normals for this shape key.
+            shape_key_vertex_normals = np.array(blender_shape_key.normals_vertex_get()).reshape(-1, 3)
+            shape_key_polygon_normals = np.array(blender_shape_key.normals_polygon_get()).reshape(-1, 3)
+            n_morph = np.where(polygon_smooth[corner_polygons][:, np.newaxis],
+                               shape_key_vertex_normals[corner_vertices],
+                               shape_key_polygon_normals[corner_polygons])
+            n_morph = convert_swizzle_normals_and_tangents(n_morph, armature, blender_object, export_settings)
+            # Store delta.
+            n_morph -= corner_normals
+            corner_target_normals.append(n_morph)
 
-            primitive['max_index'] = new_index
-
-            vertex_index_to_new_indices[vertex_index].append(new_index)
-
-            #
-            #
-
-            indices.append(new_index)
-
-            #
-
-            attributes[POSITION_ATTRIBUTE].extend(v)
-            attributes[NORMAL_ATTRIBUTE].extend(n)
             if use_tangents:
-                attributes[TANGENT_ATTRIBUTE].extend(t)
-
-            if blender_mesh.uv_layers.active:
-                for tex_coord_index in range(0, tex_coord_max):
-                    tex_coord_id = TEXCOORD_PREFIX + str(tex_coord_index)
-
-                    if attributes.get(tex_coord_id) is None:
-                        attributes[tex_coord_id] = []
+                corner_target_tangents.append(
+                    rotate_vectors_by_rotation_difference(corner_tangents[:, :3], n_morph, corner_normals))
 
-                    attributes[tex_coord_id].extend(uvs[tex_coord_index])
-
-            if export_color:
-                for color_index in range(0, color_max):
-                    color_id = COLOR_PREFIX + str(color_index)
-
-                    if attributes.get(color_id) is None:
-                        attributes[color_id] = []
-
-                    attributes[color_id].extend(colors[color_index])
-
-            if export_settings[gltf2_blender_export_keys.SKINS]:
-                for bone_index in range(0, bone_max):
-                    joint_id = JOINTS_PREFIX + str(bone_index)
-
-                    if attributes.get(joint_id) is None:
-                        attributes[joint_id] = []
-
-                    attributes[joint_id].extend(joints[bone_index])
-
-                    weight_id = WEIGHTS_PREFIX + str(bone_index)
-
-                    if attributes.get(weight_id) is None:
-                        attributes[weight_id] = []
-
-                    attributes[weight_id].extend(weights[bone_index])
-
-            if export_settings[gltf2_blender_export_keys.MORPH]:
-                for morph_index in range(0, morph_max):
-                    target_position_id = MORPH_POSITION_PREFIX + str(morph_index)
-
-                    if attributes.get(target_position_id) is None:
-                        attributes[target_position_id] = []
-
-                    attributes[target_position_id].extend(target_positions[morph_index])
-
-                    target_normal_id = MORPH_NORMAL_PREFIX + str(morph_index)
-
-                    if attributes.get(target_normal_id) is None:
-                        attributes[target_normal_id] = []
-
-                    attributes[target_normal_id].extend(target_normals[morph_index])
-
-                    if use_tangents:
-                        target_tangent_id = MORPH_TANGENT_PREFIX + str(morph_index)
-
-                        if attributes.get(target_tangent_id) is None:
-                            attributes[target_tangent_id] = []
-
-                        attributes[target_tangent_id].extend(target_tangents[morph_index])
+    #
+    # Gather all attributes of each triangle corner as a single row of 32 bits values, used both to
+    # deduplicate vertices (with their blender vertex index, vertices are never merged together),
+    # and to build the primitives.
+    #
+    attribute_ids = [(POSITION_ATTRIBUTE, corner_positions), (NORMAL_ATTRIBUTE, corner_normals)]
+    if use_tangents:
+        attribute_ids.append((TANGENT_ATTRIBUTE, corner_tangents))
+    for tex_coord_index, uvs in enumerate(corner_uvs):
+        attribute_ids.append((TEXCOORD_PREFIX + str(tex_coord_index), uvs))
+    for color_index, colors in enumerate(corner_colors):
+        attribute_ids.append((COLOR_PREFIX + str(color_index), colors))
+    for bone_index, (joints, weights) in enumerate(zip(corner_joints, corner_weights)):
+        attribute_ids.append((JOINTS_PREFIX + str(bone_index), joints))
+        attribute_ids.append((WEIGHTS_PREFIX + str(bone_index), weights))
+    for morph_index in range(len(corner_target_positions)):
+        attribute_ids.append((MORPH_POSITION_PREFIX + str(morph_index), corner_target_positions[morph_index]))
+        attribute_ids.append((MORPH_NORMAL_PREFIX + str(morph_index), corner_target_normals[morph_index]))
+        if use_tangents:
+            attribute_ids.append((MORPH_TANGENT_PREFIX + str(morph_index), corner_target_tangents[morph_index]))
+
+    columns = [corner_vertices.astype(np.uint32)[:, np.newaxis]]
+    attribute_columns = []
+    column = 1
+    for attribute_id, data in attribute_ids:
+        if data.dtype == np.uint32:
+            columns.append(data)
+        else:
+            columns.append(data.astype(np.float32).view(np.uint32))
+        attribute_columns.append((attribute_id, data.dtype == np.uint32, column, column + data.shape[1]))
+        column += data.shape[1]
+    corner_rows = np.ascontiguousarray(np.hstack(columns))
+    corner_keys = corner_rows.view(np.dtype((np.void, corner_rows.dtype.itemsize * corner_rows.shape[1])))[:, 0]
 
     #
-    # Add non-empty primitives
+    # Create primitive for each material.
     #
+    result_primitives = []
+    material_count = max(len(blender_mesh.materials), 1)
+    for mat_idx in range(material_count):
+        material_corners = np.nonzero(corner_materials == mat_idx)[0]
+        if len(material_corners) == 0:
+            continue
 
-    result_primitives = [
-        primitive
-        for primitive in material_idx_to_primitives.values()
-        if len(primitive[INDICES_ID]) != 0
-    ]
+        _, first_corners, indices = np.unique(corner_keys[material_corners],
+                                              return_index=True, return_inverse=True)
+        indices = indices.reshape(-1)
+
+        # Number vertices in order of first use (as unique() sorts them).
+        order = np.argsort(first_corners)
+        new_indices = np.empty(len(order), dtype=np.int64)
+        new_indices[order] = np.arange(len(order))
+        indices = new_indices[indices]
+        vertex_rows = corner_rows[material_corners[first_corners[order]]]
+
+        attributes = {}
+        for attribute_id, is_int, start, end in attribute_columns:
+            data = vertex_rows[:, start:end]
+            if not is_int:
+                data = data.view(np.float32)
+            attributes[attribute_id] = data.reshape(-1).tolist()
+
+        result_primitives.append({
+            MATERIAL_ID: mat_idx,
+            INDICES_ID: indices.tolist(),
+            ATTRIBUTES_ID: attributes
+        })
 
     print_console('INFO', 'Primitives created: ' + str(len(result_primitives)))
 
     return result_primitives
-
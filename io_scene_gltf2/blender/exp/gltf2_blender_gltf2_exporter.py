@@ -29,7 +29,7 @@ class GlTF2Exporter:
     Any child properties are replaced with references where necessary
     """
 
-    def __init__(self, copyright=None):
+    def __init__(self, copyright=None, deduplicate_buffers=False):
         self.__finalized = False
 
         asset = gltf2_io.Asset(
@@ -62,7 +62,7 @@ class GlTF2Exporter:
             textures=[]
         )
 
-        self.__buffer = gltf2_io_buffer.Buffer()
+        self.__buffer = gltf2_io_buffer.Buffer(deduplicate=deduplicate_buffers)
         self.__images = {}
 
         # mapping of all glTFChildOfRootProperty types to their corresponding root level arrays
@@ -115,7 +115,7 @@ class GlTF2Exporter:
                 uri = None
             elif output_path and buffer_name:
                 with open(output_path + buffer_name, 'wb') as f:
-                    f.write(self.__buffer.to_bytes())
+                    self.__buffer.write_to(f)
                 uri = buffer_name
             else:
                 uri = self.__buffer.to_embed_string()
@@ -132,7 +132,8 @@ class GlTF2Exporter:
         self.__finalized = True
 
         if is_glb:
-            return self.__buffer.to_bytes()
+            # Returned as is, so that it can be written to the GLB file chunk by chunk.
+            return self.__buffer
 
     def add_draco_extension(self):
         """
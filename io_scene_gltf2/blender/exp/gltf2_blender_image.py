@@ -15,9 +15,16 @@
 import bpy
 import os
 import typing
+import hashlib
 import numpy as np
 import tempfile
 
+from io_scene_gltf2.io.com.gltf2_io_debug import print_console
+
+
+# Increment when the encoding changes, to invalidate existing cache files.
+ENCODE_CACHE_VERSION = 1
+
 
 class ExportImage:
     """Custom image class that allows manipulation and encoding of images"""
@@ -101,7 +108,18 @@ class ExportImage:
     def __add__(self, other):
         self.append(other)
 
-    def encode(self, mime_type: typing.Optional[str]) -> bytes:
+    def cache_key(self, file_format: str) -> str:
+        """
+        Return a key identifying the encoded image: a hash of the (already channel-packed) pixels,
+        alpha mode and file format.
+        """
+        img = np.ascontiguousarray(self._img)
+        key = hashlib.sha256()
+        key.update(repr((ENCODE_CACHE_VERSION, file_format, self._has_alpha, img.shape, img.dtype.str)).encode())
+        key.update(img.data)
+        return key.hexdigest()
+
+    def encode(self, mime_type: typing.Optional[str], cache_directory: typing.Optional[str] = None) -> bytes:
         file_format = {
             "image/jpeg": "JPEG",
             "image/png": "PNG"
@@ -114,9 +132,42 @@ class ExportImage:
                     encoded_image = f.read()
                 return encoded_image
 
+        if not cache_directory:
+            return self._encode(file_format)
+
+        # Persistent cache of encoded images (shared between exports), addressed by their content.
+        cache_path = os.path.join(cache_directory, self.cache_key(file_format) + "." + file_format.lower())
+        if os.path.isfile(cache_path):
+            with open(cache_path, "rb") as f:
+                return f.read()
+
+        encoded_image = self._encode(file_format)
+
+        try:
+            os.makedirs(cache_directory, exist_ok=True)
+            # Write to a temporary file first, so that concurrent exports never read a partial file.
+            fd, tmp_path = tempfile.mkstemp(dir=cache_directory)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(encoded_image)
+                os.replace(tmp_path, cache_path)
+            finally:
+                # Only left when writing or replacing failed.
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        except OSError as e:
+            print_console('WARNING', 'Could not write image cache file {}: {}'.format(cache_path, e))
+
+        return encoded_image
+
+    def _encode(self, file_format: str) -> bytes:
         image = bpy.data.images.new("TmpImage", width=self.width, height=self.height, alpha=self._has_alpha)
-        pixels = self._img.flatten().tolist()
-        image.pixels = pixels
+        pixels = np.ascontiguousarray(self._img, dtype=np.float32).reshape(-1)
+        if hasattr(image.pixels, "foreach_set"):
+            # Copied straight from the numpy buffer, without creating a Python float per channel.
+            image.pixels.foreach_set(pixels)
+        else:
+            image.pixels[:] = memoryview(pixels)
 
         # we just use blenders built in save mechanism, this can be considered slightly dodgy but currently is the only
         # way to support
@@ -14,11 +14,12 @@
 
 import json
 import bpy
+import numpy as np
 from mathutils import Matrix
 
 from ..com.gltf2_blender_conversion import loc_gltf_to_blender, quaternion_gltf_to_blender, scale_to_matrix
 from ...io.imp.gltf2_io_binary import BinaryData
-from .gltf2_blender_animation_utils import simulate_stash, make_fcurve
+from .gltf2_blender_animation_utils import simulate_stash, make_fcurve, make_coords, quaternions_continuous
 
 
 class BlenderBoneAnim():
@@ -32,8 +33,8 @@ class BlenderBoneAnim():
         blender_path = "pose.bones[" + json.dumps(bone.name) + "].location"
         group_name = bone.name
 
-        keys = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].input)
-        values = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].output)
+        keys = BinaryData.decode_accessor(gltf, animation.samplers[channel.sampler].input)
+        values = BinaryData.decode_accessor(gltf, animation.samplers[channel.sampler].output)
         inv_bind_matrix = node.blender_bone_matrix.to_quaternion().to_matrix().to_4x4().inverted() \
             @ Matrix.Translation(node.blender_bone_matrix.to_translation()).inverted()
 
@@ -76,8 +77,8 @@ class BlenderBoneAnim():
         blender_path = "pose.bones[" + json.dumps(bone.name) + "].rotation_quaternion"
         group_name = bone.name
 
-        keys = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].input)
-        values = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].output)
+        keys = BinaryData.decode_accessor(gltf, animation.samplers[channel.sampler].input)
+        values = BinaryData.decode_accessor(gltf, animation.samplers[channel.sampler].output)
         bind_rotation = node.blender_bone_matrix.to_quaternion()
 
         if animation.samplers[channel.sampler].interpolation == "CUBICSPLINE":
@@ -115,9 +116,7 @@ class BlenderBoneAnim():
                 ]
 
         # Manage antipodal quaternions
-        for i in range(1, len(final_rots)):
-            if final_rots[i].dot(final_rots[i-1]) < 0:
-                final_rots[i] = -final_rots[i]
+        final_rots = quaternions_continuous(final_rots)
 
         BlenderBoneAnim.fill_fcurves(
             obj.animation_data.action,
@@ -134,8 +133,8 @@ class BlenderBoneAnim():
         blender_path = "pose.bones[" + json.dumps(bone.name) + "].scale"
         group_name = bone.name
 
-        keys = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].input)
-        values = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].output)
+        keys = BinaryData.decode_accessor(gltf, animation.samplers[channel.sampler].input)
+        values = BinaryData.decode_accessor(gltf, animation.samplers[channel.sampler].output)
         bind_scale = scale_to_matrix(node.blender_bone_matrix.to_scale())
 
         if animation.samplers[channel.sampler].interpolation == "CUBICSPLINE":
@@ -176,11 +175,11 @@ class BlenderBoneAnim():
         """Create FCurves from the keyframe-value pairs (one per component)."""
         fps = bpy.context.scene.render.fps
 
-        coords = [0] * (2 * len(keys))
-        coords[::2] = (key[0] * fps for key in keys)
+        coords = make_coords(keys, fps)
+        values = np.array(values, dtype=np.float64)
 
-        for i in range(0, len(values[0])):
-            coords[1::2] = (vals[i] for vals in values)
+        for i in range(0, values.shape[1]):
+            coords[1::2] = values[:, i]
             make_fcurve(
                 action,
                 coords,
@@ -18,7 +18,7 @@ from mathutils import Vector
 from ..com.gltf2_blender_conversion import loc_gltf_to_blender, quaternion_gltf_to_blender, scale_gltf_to_blender
 from ..com.gltf2_blender_conversion import correction_rotation
 from ...io.imp.gltf2_io_binary import BinaryData
-from .gltf2_blender_animation_utils import simulate_stash, make_fcurve
+from .gltf2_blender_animation_utils import simulate_stash, make_fcurve, make_coords, quaternions_continuous
 
 
 class BlenderNodeAnim():
@@ -56,8 +56,8 @@ class BlenderNodeAnim():
         for channel_idx in node.animations[anim_idx]:
             channel = animation.channels[channel_idx]
 
-            keys = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].input)
-            values = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].output)
+            keys = BinaryData.decode_accessor(gltf, animation.samplers[channel.sampler].input)
+            values = BinaryData.decode_accessor(gltf, animation.samplers[channel.sampler].output)
 
             if channel.target.path not in ['translation', 'rotation', 'scale']:
                 continue
@@ -68,13 +68,13 @@ class BlenderNodeAnim():
 
             if animation.samplers[channel.sampler].interpolation == "CUBICSPLINE":
                 # TODO manage tangent?
-                values = [values[idx * 3 + 1] for idx in range(0, len(keys))]
+                values = values[1::3][:len(keys)]
 
             if channel.target.path == "translation":
                 blender_path = "location"
                 group_name = "Location"
                 num_components = 3
-                values = [loc_gltf_to_blender(vals) for vals in values]
+                values = loc_gltf_to_blender(values)
 
             elif channel.target.path == "rotation":
                 blender_path = "rotation_quaternion"
@@ -86,25 +86,22 @@ class BlenderNodeAnim():
                         for vals in values
                     ]
                 else:
-                    values = [quaternion_gltf_to_blender(vals) for vals in values]
-
+                    # Vectorized quaternion_gltf_to_blender: (x, y, z, w) -> (w, x, y, z)
+                    values = values[:, [3, 0, 1, 2]]
 
                 # Manage antipodal quaternions
-                for i in range(1, len(values)):
-                    if values[i].dot(values[i-1]) < 0:
-                        values[i] = -values[i]
+                values = quaternions_continuous(values)
 
             elif channel.target.path == "scale":
                 blender_path = "scale"
                 group_name = "Scale"
                 num_components = 3
-                values = [scale_gltf_to_blender(vals) for vals in values]
+                values = scale_gltf_to_blender(values)
 
-            coords = [0] * (2 * len(keys))
-            coords[::2] = (key[0] * fps for key in keys)
+            coords = make_coords(keys, fps)
 
             for i in range(0, num_components):
-                coords[1::2] = (vals[i] for vals in values)
+                coords[1::2] = values[:, i]
                 make_fcurve(
                     action,
                     coords,
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import bpy
+import numpy as np
 
 def simulate_stash(obj, track_name, action, start_frame=None):
     # Simulate stash :
@@ -45,6 +46,27 @@ def restore_animation_on_object(obj, anim_name):
 
     obj.animation_data.action = None
 
+def make_coords(keys, fps):
+    """Return an (uninitialized values) keyframe coordinates array for given keys accessor data."""
+    coords = np.empty(2 * len(keys), dtype=np.float32)
+    coords[::2] = keys[:, 0] * fps
+    return coords
+
+def quaternions_continuous(quats):
+    """
+    Manage antipodal quaternions: negate each quaternion of the (N, 4) array
+    whose dot product with the previous (final) one is negative.
+    """
+    quats = np.array(quats, dtype=np.float64)
+    if len(quats) < 2:
+        return quats
+    dots = np.einsum('ij,ij->i', quats[1:], quats[:-1])
+    # A quaternion is negated when the number of negative dots since the last null one is odd.
+    num_neg = np.cumsum(dots < 0)
+    num_neg_at_zero = np.maximum.accumulate(np.where(dots == 0, num_neg, 0))
+    quats[1:][(num_neg - num_neg_at_zero) % 2 == 1] *= -1
+    return quats
+
 def make_fcurve(action, co, data_path, index=0, group_name=None, interpolation=None):
     try:
         fcurve = action.fcurves.new(data_path=data_path, index=index)
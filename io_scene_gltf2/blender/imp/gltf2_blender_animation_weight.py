@@ -16,7 +16,7 @@ import json
 import bpy
 
 from ...io.imp.gltf2_io_binary import BinaryData
-from .gltf2_blender_animation_utils import simulate_stash, make_fcurve
+from .gltf2_blender_animation_utils import simulate_stash, make_fcurve, make_coords
 
 
 class BlenderWeightAnim():
@@ -52,8 +52,8 @@ class BlenderWeightAnim():
             obj.data.shape_keys.animation_data_create()
         obj.data.shape_keys.animation_data.action = action
 
-        keys = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].input)
-        values = BinaryData.get_data_from_accessor(gltf, animation.samplers[channel.sampler].output)
+        keys = BinaryData.decode_accessor(gltf, animation.samplers[channel.sampler].input)
+        values = BinaryData.decode_accessor(gltf, animation.samplers[channel.sampler].output)
 
         # retrieve number of targets
         pymesh = gltf.data.meshes[gltf.data.nodes[node_idx].mesh]
@@ -66,12 +66,11 @@ class BlenderWeightAnim():
             offset = 0
             stride = nb_targets
 
-        coords = [0] * (2 * len(keys))
-        coords[::2] = (key[0] * fps for key in keys)
+        coords = make_coords(keys, fps)
 
         for sk in range(nb_targets):
             if pymesh.shapekey_names[sk] is not None: # Do not animate shapekeys not created
-                coords[1::2] = (values[offset + stride * i + sk][0] for i in range(len(keys)))
+                coords[1::2] = values[offset + sk::stride, 0][:len(keys)]
                 kb_name = pymesh.shapekey_names[sk]
                 data_path = "key_blocks[" + json.dumps(kb_name) + "].value"
 
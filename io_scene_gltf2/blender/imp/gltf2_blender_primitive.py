@@ -13,12 +13,12 @@
 # limitations under the License.
 
 import bpy
-from mathutils import Vector
+import numpy as np
 
 from .gltf2_blender_material import BlenderMaterial
 from ..com.gltf2_blender_conversion import loc_gltf_to_blender
 from ...io.imp.gltf2_io_binary import BinaryData
-from ...io.com.gltf2_io_color_management import color_linear_to_srgb
+from ...io.com.gltf2_io_color_management import colors_linear_to_srgb
 from ...io.com import gltf2_io_debug
 
 
@@ -44,12 +44,12 @@ class BlenderPrimitive():
             pyprimitive.num_faces = 0
             return
 
-        positions = BinaryData.get_data_from_accessor(gltf, attributes['POSITION'], cache=True)
+        positions = BinaryData.decode_accessor(gltf, attributes['POSITION'], cache=True)
 
         if pyprimitive.indices is not None:
             # Not using cache, this is not useful for indices
-            indices = BinaryData.get_data_from_accessor(gltf, pyprimitive.indices)
-            indices = [i[0] for i in indices]
+            indices = BinaryData.decode_accessor(gltf, pyprimitive.indices)
+            indices = indices[:, 0].tolist()
         else:
             indices = list(range(len(positions)))
 
@@ -73,8 +73,9 @@ class BlenderPrimitive():
         if bpy.app.debug:
             used_pidxs = list(used_pidxs)
             used_pidxs.sort()
+        positions_list = positions.tolist()
         for pidx in used_pidxs:
-            bme_verts.new(positions[pidx])
+            bme_verts.new(positions_list[pidx])
             vert_idxs.append((bidx, pidx))
             pidx_to_bidx[pidx] = bidx
             bidx += 1
@@ -112,7 +113,8 @@ class BlenderPrimitive():
 
         # Set normals
         if 'NORMAL' in attributes:
-            normals = BinaryData.get_data_from_accessor(gltf, attributes['NORMAL'], cache=True)
+            normals = BinaryData.decode_accessor(gltf, attributes['NORMAL'], cache=True)
+            normals = normals.tolist()
 
             for bidx, pidx in vert_idxs:
                 bme_verts[bidx].normal = normals[pidx]
@@ -129,27 +131,27 @@ class BlenderPrimitive():
             layer_name = 'COLOR_%d' % set_num
             layer = BlenderPrimitive.get_layer(bme.loops.layers.color, layer_name)
 
-            colors = BinaryData.get_data_from_accessor(gltf, attributes[layer_name], cache=True)
+            colors = BinaryData.decode_accessor(gltf, attributes[layer_name], cache=True)
 
             # Check whether Blender takes RGB or RGBA colors (old versions only take RGB)
-            num_components = len(colors[0])
+            num_components = colors.shape[1]
             blender_num_components = len(bme_verts[0].link_loops[0][layer])
             if num_components == 3 and blender_num_components == 4:
                 # RGB -> RGBA
-                colors = [color+(1,) for color in colors]
+                colors = np.hstack((colors, np.ones((len(colors), 1), dtype=colors.dtype)))
             if num_components == 4 and blender_num_components == 3:
                 # RGBA -> RGB
-                colors = [color[:3] for color in colors]
+                colors = colors[:, :3]
                 gltf2_io_debug.print_console("WARNING",
                     "this Blender doesn't support RGBA vertex colors; dropping A"
                 )
 
+            colors = colors_linear_to_srgb(colors).tolist()
+
             for bidx, pidx in vert_idxs:
+                color = colors[pidx]
                 for loop in bme_verts[bidx].link_loops:
-                    loop[layer] = tuple(
-                        color_linear_to_srgb(c)
-                        for c in colors[pidx]
-                    )
+                    loop[layer] = color
 
             set_num += 1
 
@@ -165,12 +167,13 @@ class BlenderPrimitive():
             layer_name = 'TEXCOORD_%d' % set_num
             layer = BlenderPrimitive.get_layer(bme.loops.layers.uv, layer_name)
 
-            uvs = BinaryData.get_data_from_accessor(gltf, attributes[layer_name], cache=True)
+            uvs = BinaryData.decode_accessor(gltf, attributes[layer_name], cache=True)
+
+            # UV transform
+            uvs = np.column_stack((uvs[:, 0], 1 - uvs[:, 1])).tolist()
 
             for bidx, pidx in vert_idxs:
-                # UV transform
-                u, v = uvs[pidx]
-                uv = (u, 1 - v)
+                uv = uvs[pidx]
 
                 for loop in bme_verts[bidx].link_loops:
                     loop[layer].uv = uv
@@ -182,11 +185,11 @@ class BlenderPrimitive():
         weight_sets = []
         set_num = 0
         while 'JOINTS_%d' % set_num in attributes and 'WEIGHTS_%d' % set_num in attributes:
-            joint_data = BinaryData.get_data_from_accessor(gltf, attributes['JOINTS_%d' % set_num], cache=True)
-            weight_data = BinaryData.get_data_from_accessor(gltf, attributes['WEIGHTS_%d' % set_num], cache=True)
+            joint_data = BinaryData.decode_accessor(gltf, attributes['JOINTS_%d' % set_num], cache=True)
+            weight_data = BinaryData.decode_accessor(gltf, attributes['WEIGHTS_%d' % set_num], cache=True)
 
-            joint_sets.append(joint_data)
-            weight_sets.append(weight_data)
+            joint_sets.append(joint_data.tolist())
+            weight_sets.append(weight_data.tolist())
 
             set_num += 1
 
@@ -209,13 +212,11 @@ class BlenderPrimitive():
             layer_name = pymesh.shapekey_names[sk]
             layer = BlenderPrimitive.get_layer(bme.verts.layers.shape, layer_name)
 
-            morph_positions = BinaryData.get_data_from_accessor(gltf, target['POSITION'], cache=True)
+            morph_positions = BinaryData.decode_accessor(gltf, target['POSITION'], cache=True)
+            morph_positions = (positions + morph_positions).tolist()
 
             for bidx, pidx in vert_idxs:
-                bme_verts[bidx][layer] = (
-                    Vector(positions[pidx]) +
-                    Vector(morph_positions[pidx])
-                )
+                bme_verts[bidx][layer] = morph_positions[pidx]
 
     @staticmethod
     def edges_and_faces(mode, indices):
@@ -57,11 +57,11 @@ class BlenderSkin():
         if node_id in pyskin.joints:
             index_in_skel = pyskin.joints.index(node_id)
             if pyskin.inverse_bind_matrices is not None:
-                inverse_bind_matrices = BinaryData.get_data_from_accessor(gltf, pyskin.inverse_bind_matrices)
+                inverse_bind_matrices = BinaryData.decode_accessor(gltf, pyskin.inverse_bind_matrices, cache=True)
                 # Needed to keep scale in matrix, as bone.matrix seems to drop it
                 if index_in_skel < len(inverse_bind_matrices):
                     pynode.blender_bone_matrix = matrix_gltf_to_blender(
-                        inverse_bind_matrices[index_in_skel]
+                        inverse_bind_matrices[index_in_skel].tolist()
                     ).inverted()
                     bone.matrix = pynode.blender_bone_matrix
                 else:
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
 
 def color_srgb_to_scene_linear(c):
     """
@@ -35,3 +36,26 @@ def color_linear_to_srgb(c):
     else:
         return 1.055 * pow(c, 1.0 / 2.4) - 0.055
 
+def colors_srgb_to_scene_linear(color):
+    """
+    Convert an array of colors (or color components) from sRGB to scene linear color space.
+
+    Vectorized version of color_srgb_to_scene_linear.
+    """
+    color = np.asarray(color, dtype=np.float64)
+    not_small = color >= 0.04045
+    small_result = np.where(color < 0.0, 0.0, color * (1.0 / 12.92))
+    large_result = np.power((np.maximum(color, 0.04045) + 0.055) * (1.0 / 1.055), 2.4)
+    return np.where(not_small, large_result, small_result)
+
+def colors_linear_to_srgb(color):
+    """
+    Convert an array of colors (or color components) from linear to sRGB color space.
+
+    Vectorized version of color_linear_to_srgb.
+    """
+    color = np.asarray(color, dtype=np.float64)
+    not_small = color >= 0.0031308
+    small_result = np.where(color < 0.0, 0.0, color * 12.92)
+    large_result = 1.055 * np.power(np.maximum(color, 0.0031308), 1.0 / 2.4) - 0.055
+    return np.where(not_small, large_result, small_result)
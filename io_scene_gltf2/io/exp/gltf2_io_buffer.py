@@ -21,18 +21,29 @@ from io_scene_gltf2.io.exp import gltf2_io_binary_data
 class Buffer:
     """Class representing binary data for use in a glTF file as 'buffer' property."""
 
-    def __init__(self, buffer_index=0):
-        self.__data = b""
+    def __init__(self, buffer_index=0, deduplicate=False):
+        # Data is stored as a list of chunks, only joined when needed (see to_bytes()).
+        self.__chunks = []
+        self.__byte_length = 0
         self.__buffer_index = buffer_index
+        self.__deduplicate = deduplicate
+        self.__views = {}
 
     def add_and_get_view(self, binary_data: gltf2_io_binary_data.BinaryData) -> gltf2_io.BufferView:
         """Add binary data to the buffer. Return a glTF BufferView."""
-        offset = len(self.__data)
-        self.__data += binary_data.data
+        if self.__deduplicate:
+            buffer_view = self.__views.get(binary_data.data)
+            if buffer_view is not None:
+                return buffer_view
+
+        offset = self.__byte_length
+        self.__chunks.append(binary_data.data)
 
         # offsets should be a multiple of 4 --> therefore add padding if necessary
         padding = (4 - (binary_data.byte_length % 4)) % 4
-        self.__data += b"\x00" * padding
+        if padding:
+            self.__chunks.append(b"\x00" * padding)
+        self.__byte_length += binary_data.byte_length + padding
 
         buffer_view = gltf2_io.BufferView(
             buffer=self.__buffer_index,
@@ -44,18 +55,28 @@ class Buffer:
             name=None,
             target=None
         )
+        if self.__deduplicate:
+            self.__views[binary_data.data] = buffer_view
         return buffer_view
 
     @property
     def byte_length(self):
-        return len(self.__data)
+        return self.__byte_length
 
     def to_bytes(self):
-        return self.__data
+        if len(self.__chunks) > 1:
+            self.__chunks = [b"".join(self.__chunks)]
+        return self.__chunks[0] if self.__chunks else b""
+
+    def write_to(self, file):
+        """Write the buffer data to given (binary) file object, without joining it in memory first."""
+        for chunk in self.__chunks:
+            file.write(chunk)
 
     def to_embed_string(self):
-        return 'data:application/octet-stream;base64,' + base64.b64encode(self.__data).decode('ascii')
+        return 'data:application/octet-stream;base64,' + base64.b64encode(self.to_bytes()).decode('ascii')
 
     def clear(self):
-        self.__data = b""
-
+        self.__chunks = []
+        self.__byte_length = 0
+        self.__views = {}
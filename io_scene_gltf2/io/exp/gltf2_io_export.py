@@ -19,6 +19,8 @@
 import json
 import struct
 
+from io_scene_gltf2.io.exp.gltf2_io_buffer import Buffer
+
 #
 # Globals
 #
@@ -86,7 +88,8 @@ def save_gltf(gltf, export_settings, encoder, glb_buffer):
         spaces_gltf = (4 - (length_gltf & 3)) & 3
         length_gltf += spaces_gltf
 
-        length_bin = len(binary)
+        # Binary may be a buffer object (written chunk by chunk, never joined in memory), or plain bytes.
+        length_bin = binary.byte_length if isinstance(binary, Buffer) else len(binary)
         zeros_bin = (4 - (length_bin & 3)) & 3
         length_bin += zeros_bin
 
@@ -110,7 +113,10 @@ def save_gltf(gltf, export_settings, encoder, glb_buffer):
         if length_bin > 0:
             file.write(struct.pack("I", length_bin))
             file.write('BIN\0'.encode())
-            file.write(binary)
+            if isinstance(binary, Buffer):
+                binary.write_to(file)
+            else:
+                file.write(binary)
             for i in range(0, zeros_bin):
                 file.write('\0'.encode())
 
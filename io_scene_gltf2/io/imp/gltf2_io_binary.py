@@ -12,8 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import struct
 import base64
+import numpy as np
 
 from ..com.gltf2_io import Accessor
 
@@ -74,47 +74,69 @@ class BinaryData():
 
     @staticmethod
     def get_data_from_accessor_obj(gltf, accessor):
+        """Get data from accessor, as a list of tuples."""
+        return [tuple(item) for item in BinaryData.decode_accessor_obj(gltf, accessor).tolist()]
+
+    @staticmethod
+    def decode_accessor(gltf, accessor_idx, cache=False):
+        """Decode accessor into a (count, number of components) numpy array.
+
+        The array may be a view of the buffer data, and is always read-only when cached (copy it to modify it).
+        """
+        if accessor_idx in gltf.decode_accessor_cache:
+            return gltf.decode_accessor_cache[accessor_idx]
+
+        accessor = gltf.data.accessors[accessor_idx]
+        array = BinaryData.decode_accessor_obj(gltf, accessor)
+
+        if cache:
+            array.flags.writeable = False
+            gltf.decode_accessor_cache[accessor_idx] = array
+
+        return array
+
+    @staticmethod
+    def decode_accessor_obj(gltf, accessor):
+        """Decode accessor object into a (count, number of components) numpy array."""
+        dtype = np.dtype('<' + gltf.fmt_char_dict[accessor.component_type])
+        component_nb = gltf.component_nb_dict[accessor.type]
+
         if accessor.buffer_view is not None:
             bufferView = gltf.data.buffer_views[accessor.buffer_view]
             buffer_data = BinaryData.get_buffer_view(gltf, accessor.buffer_view)
 
             accessor_offset = accessor.byte_offset or 0
-            buffer_data = buffer_data[accessor_offset:]
-
-            fmt_char = gltf.fmt_char_dict[accessor.component_type]
-            component_nb = gltf.component_nb_dict[accessor.type]
-            fmt = '<' + (fmt_char * component_nb)
-            default_stride = struct.calcsize(fmt)
 
             # Special layouts for certain formats; see the section about
-            # data alignment in the glTF 2.0 spec.
-            component_size = struct.calcsize('<' + fmt_char)
-            if accessor.type == 'MAT2' and component_size == 1:
-                fmt = '<FFxxFF'.replace('F', fmt_char)
-                default_stride = 8
-            elif accessor.type == 'MAT3' and component_size == 1:
-                fmt = '<FFFxFFFxFFF'.replace('F', fmt_char)
-                default_stride = 12
-            elif accessor.type == 'MAT3' and component_size == 2:
-                fmt = '<FFFxxFFFxxFFF'.replace('F', fmt_char)
-                default_stride = 24
+            # data alignment in the glTF 2.0 spec: matrices columns start on 4-bytes boundaries.
+            component_size = dtype.itemsize
+            if accessor.type in {'MAT2', 'MAT3'} and component_size < 4:
+                column_nb = 2 if accessor.type == 'MAT2' else 3
+                column_stride = (column_nb * component_size + 3) & ~3
+                default_stride = column_nb * column_stride
+                shape = (accessor.count, column_nb, column_nb)
+                strides = (column_stride, component_size)
+            else:
+                default_stride = component_nb * component_size
+                shape = (accessor.count, component_nb)
+                strides = (component_size,)
 
             stride = bufferView.byte_stride or default_stride
 
-            # Decode
-            unpack_from = struct.Struct(fmt).unpack_from
-            data = [
-                unpack_from(buffer_data, offset)
-                for offset in range(0, accessor.count*stride, stride)
-            ]
+            # View on buffer data (no copy), numpy checks it fits into the buffer.
+            array = np.ndarray(
+                shape=shape,
+                dtype=dtype,
+                buffer=buffer_data,
+                offset=accessor_offset,
+                strides=(stride,) + strides,
+            )
+            if len(shape) == 3:
+                array = array.reshape(accessor.count, component_nb)
 
         else:
             # No buffer view; initialize to zeros
-            component_nb = gltf.component_nb_dict[accessor.type]
-            data = [
-                (0,) * component_nb
-                for i in range(accessor.count)
-            ]
+            array = np.zeros((accessor.count, component_nb), dtype=dtype)
 
         if accessor.sparse:
             sparse_indices_obj = Accessor.from_dict({
@@ -131,31 +153,27 @@ class BinaryData():
                 'componentType': accessor.component_type,
                 'type': accessor.type,
             })
-            sparse_indices = BinaryData.get_data_from_accessor_obj(gltf, sparse_indices_obj)
-            sparse_values = BinaryData.get_data_from_accessor_obj(gltf, sparse_values_obj)
+            sparse_indices = BinaryData.decode_accessor_obj(gltf, sparse_indices_obj)
+            sparse_values = BinaryData.decode_accessor_obj(gltf, sparse_values_obj)
 
-            # Apply sparse
-            for i in range(accessor.sparse.count):
-                data[sparse_indices[i][0]] = sparse_values[i]
+            # Apply sparse (never modify buffer data itself).
+            array = array.copy()
+            array[sparse_indices[:, 0]] = sparse_values
 
         # Normalization
         if accessor.normalized:
-            for idx, tuple in enumerate(data):
-                new_tuple = ()
-                for i in tuple:
-                    if accessor.component_type == 5120:
-                        new_tuple += (max(float(i / 127.0 ), -1.0),)
-                    elif accessor.component_type == 5121:
-                        new_tuple += (float(i / 255.0),)
-                    elif accessor.component_type == 5122:
-                        new_tuple += (max(float(i / 32767.0), -1.0),)
-                    elif accessor.component_type == 5123:
-                        new_tuple += (i / 65535.0,)
-                    else:
-                        new_tuple += (float(i),)
-                data[idx] = new_tuple
-
-        return data
+            if accessor.component_type == 5120:
+                array = np.maximum(array / 127.0, -1.0)
+            elif accessor.component_type == 5121:
+                array = array / 255.0
+            elif accessor.component_type == 5122:
+                array = np.maximum(array / 32767.0, -1.0)
+            elif accessor.component_type == 5123:
+                array = array / 65535.0
+            else:
+                array = array.astype(np.float64)
+
+        return array
 
     @staticmethod
     def get_image_data(gltf, img_idx):
@@ -18,6 +18,7 @@ import logging
 import json
 import struct
 import base64
+import mmap
 from os.path import dirname, join, isfile, basename
 from urllib.parse import unquote
 
@@ -31,7 +32,9 @@ class glTFImporter():
         self.import_settings = import_settings
         self.glb_buffer = None
         self.buffers = {}
+        self.mmaps = []
         self.accessor_cache = {}
+        self.decode_accessor_cache = {}
 
         if 'loglevel' not in self.import_settings.keys():
             self.import_settings['loglevel'] = logging.ERROR
@@ -152,8 +155,7 @@ class glTFImporter():
             return False, "Please select a file"
 
         # Check if file is gltf or glb
-        with open(self.filename, 'rb') as f:
-            self.content = memoryview(f.read())
+        self.content = self.map_file(self.filename)
 
         self.is_glb_format = self.content[:4] == b'glTF'
 
@@ -161,6 +163,7 @@ class glTFImporter():
         if not self.is_glb_format:
             content = str(self.content, encoding='utf-8')
             self.content = None
+            self.close()
             try:
                 self.data = gltf_from_dict(json.loads(content, parse_constant=glTFImporter.bad_json_value))
                 return True, None
@@ -172,8 +175,38 @@ class glTFImporter():
             # Parsing glb file
             success, txt = self.load_glb()
             self.content = None
+            if not success:
+                self.close()
             return success, txt
 
+    def map_file(self, path):
+        """Map a whole file in memory (read-only), as a memoryview.
+
+        Slicing the returned memoryview never copies data, pages are only read from disk when accessed.
+        """
+        with open(path, 'rb') as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files can't be mapped
+                return memoryview(f.read())
+        self.mmaps.append(mapped)
+        return memoryview(mapped)
+
+    def close(self):
+        """Release buffers, and unmap files (once nothing else references their data)."""
+        self.glb_buffer = None
+        self.buffers = {}
+        self.accessor_cache = {}
+        self.decode_accessor_cache = {}
+        for mapped in self.mmaps:
+            try:
+                mapped.close()
+            except BufferError:
+                # Still exported (some data is still referenced), will be unmapped once garbage collected.
+                pass
+        self.mmaps = []
+
     def is_node_joint(self, node_idx):
         """Check if node is a joint."""
         if not self.data.skins:  # if no skin in gltf file
@@ -212,8 +245,7 @@ class glTFImporter():
 
         path = join(dirname(self.filename), unquote(uri))
         try:
-            with open(path, 'rb') as f_:
-                return memoryview(f_.read()), basename(path)
+            return self.map_file(path), basename(path)
         except Exception:
             self.log.error("Couldn't read file: " + path)
             return None, None
@@ -109,6 +109,13 @@ class ImportOBJ(bpy.types.Operator, ImportHelper):
                    ),
             )
 
+    use_parallel: BoolProperty(
+            name="Parallel Parsing",
+            description="Parse objects and groups of the file concurrently, using all CPU cores "
+                        "(faster for big files made of many parts, Linux only)",
+            default=False,
+            )
+
     global_clight_size: FloatProperty(
             name="Clamp Size",
             description="Clamp bounds under this value (zero to disable)",
@@ -172,6 +179,7 @@ class OBJ_PT_import_include(bpy.types.Panel):
         layout.prop(operator, 'use_image_search')
         layout.prop(operator, 'use_smooth_groups')
         layout.prop(operator, 'use_edges')
+        layout.prop(operator, 'use_parallel')
 
 
 class OBJ_PT_import_transform(bpy.types.Panel):
@@ -321,6 +329,7 @@ class OBJ_PT_export_geometry(bpy.types.Panel):
         layout.prop(operator, 'use_triangles')
         layout.prop(operator, 'use_nurbs', text="Curves as NURBS")
         layout.prop(operator, 'keep_vertex_order')
+        layout.prop(operator, 'use_parallel')
 
 
 @orientation_helper(axis_forward='-Z', axis_up='Y')
@@ -432,6 +441,12 @@ class ExportOBJ(bpy.types.Operator, ExportHelper):
             description="",
             default=False,
             )
+    use_parallel: BoolProperty(
+            name="Parallel Formatting",
+            description="Format geometry data using all CPU cores "
+                        "(faster for big scenes, Linux only)",
+            default=False,
+            )
 
     global_scale: FloatProperty(
             name="Scale",
@@ -21,6 +21,7 @@
 import os
 
 import bpy
+import numpy as np
 from mathutils import Matrix, Vector, Color
 from bpy_extras import io_utils, node_shader_utils
 
@@ -46,6 +47,107 @@ def mesh_triangulate(me):
     bm.free()
 
 
+# Number of rows (vertices, faces...) formatted at once.
+FORMAT_CHUNK_SIZE = 1 << 16
+
+
+def loop_indices(loop_start, loop_total):
+    """Return the indices of all loops of given faces, as a flat array."""
+    loop_total = loop_total.astype(np.int64)
+    loop_offset = np.cumsum(loop_total) - loop_total
+    return np.repeat(loop_start - loop_offset, loop_total) + np.arange(loop_total.sum(), dtype=np.int64)
+
+
+def unique_first_use(keys):
+    """
+    Return (first, inverse) for rows of given (N, K) array of keys, first being the index of the first row of each
+    unique key, in order of first use, and inverse the index of the unique key of each row (in that same order).
+    """
+    # + 0.0 so that -0.0 and 0.0 are the same key.
+    keys = np.ascontiguousarray(keys, dtype=np.float64) + 0.0
+    if not len(keys):
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    keys = keys.view(np.dtype((np.void, keys.dtype.itemsize * keys.shape[1]))).ravel()
+    _keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    rank = np.empty(len(order), dtype=np.int64)
+    rank[order] = np.arange(len(order))
+    return first[order], rank[inverse.reshape(-1)]
+
+
+def format_rows(fmt, values):
+    """Return given format applied to each row of given 2D array, as a single string."""
+    return (fmt * len(values)) % tuple(values.ravel().tolist())
+
+
+def format_faces(item_fmt, values, faces_loop_total):
+    """
+    Return the 'f' lines of given faces, item format being applied to each row of given 2D array of loops values.
+    """
+    runs_start = np.flatnonzero(faces_loop_total[1:] != faces_loop_total[:-1]) + 1
+    runs_count = np.diff(np.concatenate(([0], runs_start, [len(faces_loop_total)])))
+    fmt = "".join([('f' + item_fmt * n + '\n') * count
+                   for n, count in zip(faces_loop_total[np.insert(runs_start, 0, 0)].tolist(), runs_count.tolist())])
+    return fmt % tuple(values.ravel().tolist())
+
+
+class ChunkWriter:
+    """
+    Write strings to a file, and large blocks of data once formatted by given functions (see write_format).
+
+    With more than one worker, formatting is done by a pool of worker processes, results being still written
+    in order. Those are forked (they only run NumPy/string code, and cannot import bpy), which is only safe on
+    Linux (forking the multi-threaded Blender process is not on macOS), elsewhere formatting is always done directly.
+    """
+    __slots__ = ("file", "pending", "max_pending", "executor")
+
+    def __init__(self, file, num_workers=1):
+        import multiprocessing
+        import sys
+        from collections import deque
+
+        self.file = file
+        self.pending = deque()
+        self.max_pending = num_workers * 4
+        self.executor = None
+        if num_workers > 1 and sys.platform.startswith("linux"):
+            from concurrent.futures import ProcessPoolExecutor
+            self.executor = ProcessPoolExecutor(num_workers, mp_context=multiprocessing.get_context("fork"))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+        if self.executor is not None:
+            for item in self.pending:
+                if not isinstance(item, str):
+                    item.cancel()
+            self.executor.shutdown()
+
+    def write(self, data):
+        if self.executor is None:
+            self.file.write(data)
+        else:
+            self.pending.append(data)
+
+    def write_format(self, func, *args):
+        """Write the string returned by func(*args)."""
+        if self.executor is None:
+            self.file.write(func(*args))
+        else:
+            self.pending.append(self.executor.submit(func, *args))
+            self.flush(self.max_pending)
+
+    def flush(self, max_pending=0):
+        """Write pending data, until at most max_pending items remain (waiting for them to be formatted if needed)."""
+        pending = self.pending
+        while len(pending) > max_pending:
+            item = pending.popleft()
+            self.file.write(item if isinstance(item, str) else item.result())
+
+
 def write_mtl(scene, filepath, path_mode, copy_set, mtl_dict):
     world = scene.world
     world_amb = Color((0.8, 0.8, 0.8))
@@ -254,6 +356,7 @@ def write_file(filepath, objects, depsgraph, scene,
                EXPORT_GLOBAL_MATRIX=None,
                EXPORT_PATH_MODE='AUTO',
                progress=ProgressReport(),
+               EXPORT_PARALLEL=False,
                ):
     """
     Basic write function. The context and options must be already set
@@ -264,35 +367,61 @@ def write_file(filepath, objects, depsgraph, scene,
     if EXPORT_GLOBAL_MATRIX is None:
         EXPORT_GLOBAL_MATRIX = Matrix()
 
-    def veckey3d(v):
-        return round(v.x, 4), round(v.y, 4), round(v.z, 4)
-
-    def veckey2d(v):
-        return round(v[0], 4), round(v[1], 4)
-
-    def findVertexGroupName(face, vWeightMap):
+    def findVertexGroups(me_verts, face_loop_vert, face_loop_total, vGroupNames):
         """
-        Searches the vertexDict to see what groups is assigned to a given face.
+        Return the index (in vGroupNames) of the vertex group assigned to each face, -1 for faces without any.
         We use a frequency system in order to sort out the name because a given vertex can
         belong to two or more groups at the same time. To find the right name for the face
-        we list all the possible vertex group names with their frequency and then sort by
-        frequency in descend order. The top element is the one shared by the highest number
-        of vertices is the face's group
+        we sum the weights of all the possible vertex groups of its vertices, the group with
+        the highest total weight (then the highest name) is the face's group
         """
-        weightDict = {}
-        for vert_index in face.vertices:
-            vWeights = vWeightMap[vert_index]
-            for vGroupName, weight in vWeights:
-                weightDict[vGroupName] = weightDict.get(vGroupName, 0.0) + weight
-
-        if weightDict:
-            return max((weight, vGroupName) for vGroupName, weight in weightDict.items())[1]
-        else:
-            return '(null)'
+        vert_groups_total = []
+        groups = []
+        weights = []
+        for v in me_verts:
+            v_groups = v.groups
+            vert_groups_total.append(len(v_groups))
+            for g in v_groups:
+                groups.append(g.group)
+                weights.append(g.weight)
+        vert_groups_total = np.array(vert_groups_total, dtype=np.int64)
+        groups = np.array(groups, dtype=np.int64)
+        weights = np.array(weights, dtype=np.float64)
+
+        # All (vertex group, weight) items of all face vertices, summed per face and group.
+        loop_groups_total = vert_groups_total[face_loop_vert]
+        items = loop_indices((np.cumsum(vert_groups_total) - vert_groups_total)[face_loop_vert], loop_groups_total)
+        num_faces = len(face_loop_total)
+        item_face = np.repeat(np.repeat(np.arange(num_faces), face_loop_total), loop_groups_total)
+        face_groups, item_face_group = np.unique(item_face * len(vGroupNames) + groups[items], return_inverse=True)
+        face_groups_weight = np.bincount(item_face_group.reshape(-1), weights=weights[items],
+                                         minlength=len(face_groups))
+        face_groups_face, face_groups = np.divmod(face_groups, len(vGroupNames))
+
+        # Keep the (weight, name) max of each face.
+        names_rank = {name: i for i, name in enumerate(sorted(vGroupNames))}
+        names_rank = np.array([names_rank[name] for name in vGroupNames], dtype=np.int64)
+        order = np.lexsort((names_rank[face_groups], face_groups_weight, face_groups_face))
+        face_groups_face = face_groups_face[order]
+        face_groups = face_groups[order]
+        is_last = np.ones(len(order), dtype=bool)
+        is_last[:-1] = face_groups_face[1:] != face_groups_face[:-1]
+
+        face_vgroup = np.full(num_faces, -1, dtype=np.int64)
+        face_vgroup[face_groups_face[is_last]] = face_groups[is_last]
+        return face_vgroup
 
     with ProgressReportSubstep(progress, 2, "OBJ Export path: %r" % filepath, "OBJ Export Finished") as subprogress1:
-        with open(filepath, "w", encoding="utf8", newline="\n") as f:
-            fw = f.write
+        num_workers = (os.cpu_count() or 1) if EXPORT_PARALLEL else 1
+        with open(filepath, "w", encoding="utf8", newline="\n") as f, ChunkWriter(f, num_workers) as writer:
+            fw = writer.write
+
+            def fw_rows(fmt, values):
+                for start in range(0, len(values), FORMAT_CHUNK_SIZE):
+                    writer.write_format(format_rows, fmt, values[start:start + FORMAT_CHUNK_SIZE])
+
+            def fw_faces(item_fmt, values, faces_loop_total):
+                writer.write_format(format_faces, item_fmt, values, faces_loop_total)
 
             # Write Header
             fw('# Blender v%s OBJ File: %r\n' % (bpy.app.version_string, os.path.basename(bpy.data.filepath)))
@@ -307,8 +436,6 @@ def write_file(filepath, objects, depsgraph, scene,
             # Initialize totals, these are updated each object
             totverts = totuvco = totno = 1
 
-            face_vert_index = 1
-
             # A Dict of Materials
             # (material.name, image.name):matname_imagename # matname_imagename has gaps removed.
             mtl_dict = {}
@@ -369,32 +496,30 @@ def write_file(filepath, objects, depsgraph, scene,
                         if EXPORT_UV:
                             faceuv = len(me.uv_layers) > 0
                             if faceuv:
-                                uv_layer = me.uv_layers.active.data[:]
+                                uv_layer = me.uv_layers.active.data
                         else:
                             faceuv = False
 
-                        me_verts = me.vertices[:]
-
-                        # Make our own list so it can be sorted to reduce context switching
-                        face_index_pairs = [(face, index) for index, face in enumerate(me.polygons)]
+                        me_verts = me.vertices
+                        me_polys = me.polygons
 
                         if EXPORT_EDGES:
                             edges = me.edges
                         else:
                             edges = []
 
-                        if not (len(face_index_pairs) + len(edges) + len(me.vertices)):  # Make sure there is something to write
+                        if not (len(me_polys) + len(edges) + len(me_verts)):  # Make sure there is something to write
                             # clean up
                             ob_for_convert.to_mesh_clear()
                             continue  # dont bother with this mesh.
 
-                        if EXPORT_NORMALS and face_index_pairs:
+                        if EXPORT_NORMALS and len(me_polys):
                             me.calc_normals_split()
                             # No need to call me.free_normals_split later, as this mesh is deleted anyway!
 
                         loops = me.loops
 
-                        if (EXPORT_SMOOTH_GROUPS or EXPORT_SMOOTH_GROUPS_BITFLAGS) and face_index_pairs:
+                        if (EXPORT_SMOOTH_GROUPS or EXPORT_SMOOTH_GROUPS_BITFLAGS) and len(me_polys):
                             smooth_groups, smooth_groups_tot = me.calc_smooth_groups(use_bitflags=EXPORT_SMOOTH_GROUPS_BITFLAGS)
                             if smooth_groups_tot <= 1:
                                 smooth_groups, smooth_groups_tot = (), 0
@@ -409,32 +534,52 @@ def write_file(filepath, objects, depsgraph, scene,
                             materials = [None]
                             material_names = [name_compat(None)]
 
+                        num_verts = len(me_verts)
+                        num_polys = len(me_polys)
+                        num_loops = len(loops)
+
+                        poly_loop_start = np.empty(num_polys, dtype=np.int32)
+                        poly_loop_total = np.empty(num_polys, dtype=np.int32)
+                        poly_material = np.empty(num_polys, dtype=np.int32)
+                        poly_smooth = np.empty(num_polys, dtype=bool)
+                        me_polys.foreach_get("loop_start", poly_loop_start)
+                        me_polys.foreach_get("loop_total", poly_loop_total)
+                        me_polys.foreach_get("material_index", poly_material)
+                        me_polys.foreach_get("use_smooth", poly_smooth)
+                        loop_vert = np.empty(num_loops, dtype=np.int32)
+                        loops.foreach_get("vertex_index", loop_vert)
+
+                        # Smoothing value of each face, as written in 's' lines (0 being 'off').
+                        if smooth_groups:
+                            poly_smooth_group = np.array(smooth_groups, dtype=np.int64)
+                            poly_smooth_value = np.where(poly_smooth, poly_smooth_group, 0)
+                        else:
+                            poly_smooth_value = poly_smooth.astype(np.int64)
+
                         # Sort by Material, then images
                         # so we dont over context switch in the obj file.
                         if EXPORT_KEEP_VERT_ORDER:
-                            pass
+                            face_order = np.arange(num_polys)
                         else:
                             if len(materials) > 1:
-                                if smooth_groups:
-                                    sort_func = lambda a: (a[0].material_index,
-                                                           smooth_groups[a[1]] if a[0].use_smooth else False)
-                                else:
-                                    sort_func = lambda a: (a[0].material_index,
-                                                           a[0].use_smooth)
+                                face_order = np.lexsort((poly_smooth_value, poly_material))
                             else:
                                 # no materials
                                 if smooth_groups:
-                                    sort_func = lambda a: smooth_groups[a[1] if a[0].use_smooth else False]
+                                    # Flat faces are sorted with the smooth group of the first face.
+                                    sort_key = poly_smooth_group[np.where(poly_smooth, np.arange(num_polys), 0)]
                                 else:
-                                    sort_func = lambda a: a[0].use_smooth
-
-                            face_index_pairs.sort(key=sort_func)
-
-                            del sort_func
-
-                        # Set the default mat to no material and no image.
-                        contextMat = 0, 0  # Can never be this, so we will label a new material the first chance we get.
-                        contextSmooth = None  # Will either be true or false,  set bad to force initialization switch.
+                                    sort_key = poly_smooth
+                                face_order = np.argsort(sort_key, kind='stable')
+                                del sort_key
+
+                        # Data of sorted faces, and of their loops.
+                        face_loop_total = poly_loop_total[face_order]
+                        face_loops = loop_indices(poly_loop_start[face_order], face_loop_total)
+                        face_mat = np.minimum(poly_material[face_order], len(materials) - 1)
+                        face_smooth_value = poly_smooth_value[face_order]
+                        face_loop_vert = loop_vert[face_loops]
+                        face_values = [totverts + face_loop_vert.astype(np.int64)]
 
                         if EXPORT_BLEN_OBS or EXPORT_GROUP_BY_OB:
                             name1 = ob.name
@@ -452,97 +597,85 @@ def write_file(filepath, objects, depsgraph, scene,
                         subprogress2.step()
 
                         # Vert
-                        for v in me_verts:
-                            fw('v %.6f %.6f %.6f\n' % v.co[:])
+                        co = np.empty(num_verts * 3, dtype=np.float32)
+                        me_verts.foreach_get("co", co)
+                        fw_rows('v %.6f %.6f %.6f\n', co.reshape(-1, 3))
+                        del co
 
                         subprogress2.step()
 
                         # UV
                         if faceuv:
-                            # in case removing some of these dont get defined.
-                            uv = f_index = uv_index = uv_key = uv_val = uv_ls = None
-
-                            uv_face_mapping = [None] * len(face_index_pairs)
-
-                            uv_dict = {}
-                            uv_get = uv_dict.get
-                            for f, f_index in face_index_pairs:
-                                uv_ls = uv_face_mapping[f_index] = []
-                                for uv_index, l_index in enumerate(f.loop_indices):
-                                    uv = uv_layer[l_index].uv
-                                    # include the vertex index in the key so we don't share UV's between vertices,
-                                    # allowed by the OBJ spec but can cause issues for other importers, see: T47010.
-
-                                    # this works too, shared UV's for all verts
-                                    #~ uv_key = veckey2d(uv)
-                                    uv_key = loops[l_index].vertex_index, veckey2d(uv)
-
-                                    uv_val = uv_get(uv_key)
-                                    if uv_val is None:
-                                        uv_val = uv_dict[uv_key] = uv_unique_count
-                                        fw('vt %.6f %.6f\n' % uv[:])
-                                        uv_unique_count += 1
-                                    uv_ls.append(uv_val)
-
-                            del uv_dict, uv, f_index, uv_index, uv_ls, uv_get, uv_key, uv_val
-                            # Only need uv_unique_count and uv_face_mapping
+                            uv = np.empty(num_loops * 2, dtype=np.float32)
+                            uv_layer.foreach_get("uv", uv)
+                            uv = uv.reshape(-1, 2)[face_loops]
+                            # include the vertex index in the key so we don't share UV's between vertices,
+                            # allowed by the OBJ spec but can cause issues for other importers, see: T47010.
+                            uv_key = np.column_stack((face_loop_vert, np.round(uv.astype(np.float64), 4)))
+                            uv_first, face_loop_uv = unique_first_use(uv_key)
+                            fw_rows('vt %.6f %.6f\n', uv[uv_first])
+                            uv_unique_count = len(uv_first)
+                            face_values.append(totuvco + face_loop_uv)
+                            del uv, uv_key, uv_first, face_loop_uv
 
                         subprogress2.step()
 
                         # NORMAL, Smooth/Non smoothed.
                         if EXPORT_NORMALS:
-                            no_key = no_val = None
-                            normals_to_idx = {}
-                            no_get = normals_to_idx.get
-                            loops_to_normals = [0] * len(loops)
-                            for f, f_index in face_index_pairs:
-                                for l_idx in f.loop_indices:
-                                    no_key = veckey3d(loops[l_idx].normal)
-                                    no_val = no_get(no_key)
-                                    if no_val is None:
-                                        no_val = normals_to_idx[no_key] = no_unique_count
-                                        fw('vn %.4f %.4f %.4f\n' % no_key)
-                                        no_unique_count += 1
-                                    loops_to_normals[l_idx] = no_val
-                            del normals_to_idx, no_get, no_key, no_val
-                        else:
-                            loops_to_normals = []
+                            no = np.empty(num_loops * 3, dtype=np.float32)
+                            loops.foreach_get("normal", no)
+                            no_key = np.round(no.reshape(-1, 3)[face_loops].astype(np.float64), 4)
+                            no_first, face_loop_no = unique_first_use(no_key)
+                            fw_rows('vn %.4f %.4f %.4f\n', no_key[no_first])
+                            no_unique_count = len(no_first)
+                            face_values.append(totno + face_loop_no)
+                            del no, no_key, no_first, face_loop_no
 
                         subprogress2.step()
 
+                        # Context switches, only written at the first face of each run of faces sharing
+                        # the same vertex group, material and smoothing.
+                        # Faces of materials with a same name share a same context.
+                        context_changes = np.zeros(num_polys, dtype=bool)
+                        context_changes[:1] = True
+                        mat_key = np.array([material_names.index(name) for name in material_names])[face_mat]
+                        mat_changes = context_changes.copy()
+                        mat_changes[1:] = mat_key[1:] != mat_key[:-1]
+                        smooth_changes = context_changes.copy()
+                        smooth_changes[1:] = face_smooth_value[1:] != face_smooth_value[:-1]
+                        context_changes |= mat_changes | smooth_changes
+
                         # XXX
-                        if EXPORT_POLYGROUPS:
-                            # Retrieve the list of vertex groups
-                            vertGroupNames = ob.vertex_groups.keys()
-                            if vertGroupNames:
-                                currentVGroup = ''
-                                # Create a dictionary keyed by face id and listing, for each vertex, the vertex groups it belongs to
-                                vgroupsMap = [[] for _i in range(len(me_verts))]
-                                for v_idx, v_ls in enumerate(vgroupsMap):
-                                    v_ls[:] = [(vertGroupNames[g.group], g.weight) for g in me_verts[v_idx].groups]
-
-                        for f, f_index in face_index_pairs:
-                            f_smooth = f.use_smooth
-                            if f_smooth and smooth_groups:
-                                f_smooth = smooth_groups[f_index]
-                            f_mat = min(f.material_index, len(materials) - 1)
+                        vertGroupNames = ob.vertex_groups.keys() if EXPORT_POLYGROUPS else ()
+                        if vertGroupNames:
+                            face_vgroup = findVertexGroups(me_verts, face_loop_vert, face_loop_total,
+                                                           vertGroupNames)
+                            vgroup_changes = context_changes.copy()
+                            vgroup_changes[1:] = face_vgroup[1:] != face_vgroup[:-1]
+                            context_changes |= vgroup_changes
+                            vertGroupNames = vertGroupNames + ['(null)']  # face_vgroup is -1 for faces without groups.
+
+                        if faceuv:
+                            face_fmt = " %d/%d/%d" if EXPORT_NORMALS else " %d/%d"
+                        else:
+                            face_fmt = " %d//%d" if EXPORT_NORMALS else " %d"
+                        face_values = np.column_stack(face_values)
+                        face_loop_end = np.cumsum(face_loop_total)
+
+                        runs_start = np.flatnonzero(context_changes).tolist()
+                        runs_end = runs_start[1:] + [num_polys]
+                        for run_start, run_end in zip(runs_start, runs_end):
+                            f_mat = int(face_mat[run_start])
 
                             # MAKE KEY
                             key = material_names[f_mat], None  # No image, use None instead.
 
                             # Write the vertex group
-                            if EXPORT_POLYGROUPS:
-                                if vertGroupNames:
-                                    # find what vertext group the face belongs to
-                                    vgroup_of_face = findVertexGroupName(f, vgroupsMap)
-                                    if vgroup_of_face != currentVGroup:
-                                        currentVGroup = vgroup_of_face
-                                        fw('g %s\n' % vgroup_of_face)
+                            if vertGroupNames and vgroup_changes[run_start]:
+                                fw('g %s\n' % vertGroupNames[face_vgroup[run_start]])
 
                             # CHECK FOR CONTEXT SWITCH
-                            if key == contextMat:
-                                pass  # Context already switched, dont do anything
-                            else:
+                            if mat_changes[run_start]:
                                 if key[0] is None and key[1] is None:
                                     # Write a null material, since we know the context has changed.
                                     if EXPORT_GROUP_BY_MAT:
@@ -583,54 +716,31 @@ def write_file(filepath, objects, depsgraph, scene,
                                     if EXPORT_MTL:
                                         fw("usemtl %s\n" % mat_data[0])  # can be mat_image or (null)
 
-                            contextMat = key
-                            if f_smooth != contextSmooth:
+                            if smooth_changes[run_start]:
+                                f_smooth = int(face_smooth_value[run_start])
                                 if f_smooth:  # on now off
                                     if smooth_groups:
-                                        f_smooth = smooth_groups[f_index]
                                         fw('s %d\n' % f_smooth)
                                     else:
                                         fw('s 1\n')
                                 else:  # was off now on
                                     fw('s off\n')
-                                contextSmooth = f_smooth
 
-                            f_v = [(vi, me_verts[v_idx], l_idx)
-                                   for vi, (v_idx, l_idx) in enumerate(zip(f.vertices, f.loop_indices))]
-
-                            fw('f')
-                            if faceuv:
-                                if EXPORT_NORMALS:
-                                    for vi, v, li in f_v:
-                                        fw(" %d/%d/%d" % (totverts + v.index,
-                                                          totuvco + uv_face_mapping[f_index][vi],
-                                                          totno + loops_to_normals[li],
-                                                          ))  # vert, uv, normal
-                                else:  # No Normals
-                                    for vi, v, li in f_v:
-                                        fw(" %d/%d" % (totverts + v.index,
-                                                       totuvco + uv_face_mapping[f_index][vi],
-                                                       ))  # vert, uv
-
-                                face_vert_index += len(f_v)
-
-                            else:  # No UV's
-                                if EXPORT_NORMALS:
-                                    for vi, v, li in f_v:
-                                        fw(" %d//%d" % (totverts + v.index, totno + loops_to_normals[li]))
-                                else:  # No Normals
-                                    for vi, v, li in f_v:
-                                        fw(" %d" % (totverts + v.index))
-
-                            fw('\n')
+                            for start in range(run_start, run_end, FORMAT_CHUNK_SIZE):
+                                end = min(start + FORMAT_CHUNK_SIZE, run_end)
+                                loop_start = face_loop_end[start] - face_loop_total[start]
+                                fw_faces(face_fmt, face_values[loop_start:face_loop_end[end - 1]],
+                                         face_loop_total[start:end])
 
                         subprogress2.step()
 
                         # Write edges.
                         if EXPORT_EDGES:
-                            for ed in edges:
-                                if ed.is_loose:
-                                    fw('l %d %d\n' % (totverts + ed.vertices[0], totverts + ed.vertices[1]))
+                            edge_verts = np.empty(len(edges) * 2, dtype=np.int32)
+                            edge_loose = np.empty(len(edges), dtype=bool)
+                            edges.foreach_get("vertices", edge_verts)
+                            edges.foreach_get("is_loose", edge_loose)
+                            fw_rows('l %d %d\n', totverts + edge_verts.reshape(-1, 2)[edge_loose].astype(np.int64))
 
                         # Make the indices global rather then per mesh
                         totverts += len(me_verts)
@@ -673,6 +783,7 @@ def _write(context, filepath,
            EXPORT_ANIMATION,
            EXPORT_GLOBAL_MATRIX,
            EXPORT_PATH_MODE,  # Not used
+           EXPORT_PARALLEL=False,
            ):
 
     with ProgressReport(context.window_manager) as progress:
@@ -730,6 +841,7 @@ def _write(context, filepath,
                        EXPORT_GLOBAL_MATRIX,
                        EXPORT_PATH_MODE,
                        progress,
+                       EXPORT_PARALLEL,
                        )
             progress.leave_substeps()
 
@@ -765,7 +877,8 @@ def save(context,
          use_selection=True,
          use_animation=False,
          global_matrix=None,
-         path_mode='AUTO'
+         path_mode='AUTO',
+         use_parallel=False
          ):
 
     _write(context, filepath,
@@ -788,6 +901,7 @@ def save(context,
            EXPORT_ANIMATION=use_animation,
            EXPORT_GLOBAL_MATRIX=global_matrix,
            EXPORT_PATH_MODE=path_mode,
+           EXPORT_PARALLEL=use_parallel,
            )
 
     return {'FINISHED'}
@@ -36,8 +36,8 @@ import os
 import time
 import bpy
 import mathutils
+import numpy as np
 
-from bpy_extras.io_utils import unpack_list
 from bpy_extras.image_utils import load_image
 from bpy_extras.wm_utils.progress_report import ProgressReport
 
@@ -470,14 +470,13 @@ def create_materials(filepath, relpath,
             mtl.close()
 
 
-def face_is_edge(face):
-    """Simple check to test whether given (temp, working) data is an edge, and not a real face."""
-    face_vert_loc_indices = face[0]
-    face_vert_nor_indices = face[1]
-    return len(face_vert_nor_indices) == 1 or len(face_vert_loc_indices) == 2
+def face_loop_indices(faces_loop_start, faces_loop_total):
+    """Return the (flat) indices of all loops of given faces (defined by their first loop index and loops count)."""
+    loops_face_start = np.repeat(faces_loop_start - (np.cumsum(faces_loop_total) - faces_loop_total), faces_loop_total)
+    return loops_face_start + np.arange(len(loops_face_start))
 
 
-def split_mesh(verts_loc, faces, unique_materials, filepath, SPLIT_OB_OR_GROUP):
+def split_mesh(verts_loc, faces, contexts, unique_materials, filepath, SPLIT_OB_OR_GROUP):
     """
     Takes vert_loc and faces, and separates into multiple sets of
     (verts_loc, faces, unique_materials, dataname)
@@ -485,11 +484,15 @@ def split_mesh(verts_loc, faces, unique_materials, filepath, SPLIT_OB_OR_GROUP):
 
     filename = os.path.splitext((os.path.basename(filepath)))[0]
 
-    if not SPLIT_OB_OR_GROUP or not faces:
-        use_verts_nor = any(f[1] for f in faces)
-        use_verts_tex = any(f[2] for f in faces)
+    loops, faces = faces
+    faces_loop_total = faces[:, FACE_LOOP_TOTAL]
+    faces_is_polyline = (faces[:, FACE_FLAGS] & FACE_EDGE).astype(bool)
+
+    if not SPLIT_OB_OR_GROUP or not len(faces):
+        use_verts_nor = bool(np.any(faces_is_polyline | (faces_loop_total > 0)))
+        use_verts_tex = bool(np.any(~faces_is_polyline & (faces_loop_total > 0)))
         # use the filename for the object name since we aren't chopping up the mesh.
-        return [(verts_loc, faces, unique_materials, filename, use_verts_nor, use_verts_tex)]
+        return [(verts_loc, (loops, faces), unique_materials, filename, use_verts_nor, use_verts_tex)]
 
     def key_to_name(key):
         # if the key is a tuple, join it to make a string
@@ -500,54 +503,59 @@ def split_mesh(verts_loc, faces, unique_materials, filepath, SPLIT_OB_OR_GROUP):
         else:
             return "_".join(k.decode('utf-8', 'replace') for k in key)
 
-    # Return a key that makes the faces unique.
-    face_split_dict = {}
-
-    oldkey = -1  # initialize to a value that will never match the key
-
-    for face in faces:
-        (face_vert_loc_indices,
-         face_vert_nor_indices,
-         face_vert_tex_indices,
-         context_material,
-         context_smooth_group,
-         context_object_key,
-         face_invalid_blenpoly,
-         ) = face
-        key = context_object_key
-
-        if oldkey != key:
-            # Check the key has changed.
-            (verts_split, faces_split, unique_materials_split, vert_remap,
-             use_verts_nor, use_verts_tex) = face_split_dict.setdefault(key, ([], [], {}, {}, [], []))
-            oldkey = key
-
-        if not face_is_edge(face):
-            if not use_verts_nor and face_vert_nor_indices:
-                use_verts_nor.append(True)
-
-            if not use_verts_tex and face_vert_tex_indices:
-                use_verts_tex.append(True)
-
-        # Remap verts to new vert list and add where needed
-        for loop_idx, vert_idx in enumerate(face_vert_loc_indices):
-            map_index = vert_remap.get(vert_idx)
-            if map_index is None:
-                map_index = len(verts_split)
-                vert_remap[vert_idx] = map_index  # set the new remapped index so we only add once and can reference next time.
-                verts_split.append(verts_loc[vert_idx])  # add the vert to the local verts
-
-            face_vert_loc_indices[loop_idx] = map_index  # remap to the local index
-
-            if context_material not in unique_materials_split:
-                unique_materials_split[context_material] = unique_materials[context_material]
-
-        faces_split.append(face)
-
-    # remove one of the items and reorder
-    return [(verts_split, faces_split, unique_materials_split, key_to_name(key), bool(use_vnor), bool(use_vtex))
-            for key, (verts_split, faces_split, unique_materials_split, _, use_vnor, use_vtex)
-            in face_split_dict.items()]
+    # Object keys, in order of first use.
+    keys = {}
+    contexts_key = np.array([keys.setdefault(context_object_key, len(keys))
+                             for _, _, context_object_key in contexts], dtype=np.int32)
+    faces_key = contexts_key[faces[:, FACE_CONTEXT]]
+    keys_first_face = np.full(len(keys), len(faces), dtype=np.int64)
+    np.minimum.at(keys_first_face, faces_key, np.arange(len(faces)))
+    keys_order = np.argsort(keys_first_face, kind='stable')
+    keys_rank = np.empty_like(keys_order)
+    keys_rank[keys_order] = np.arange(len(keys_order))
+
+    # Faces (and their loops) grouped by object, keeping their order.
+    faces_order = np.argsort(keys_rank[faces_key], kind='stable')
+    faces_loop_start = np.cumsum(faces_loop_total) - faces_loop_total
+    loops = loops[face_loop_indices(faces_loop_start[faces_order], faces_loop_total[faces_order])]
+    faces = faces[faces_order]
+    faces_key = faces_key[faces_order]
+    faces_is_edge = (faces_is_polyline | (faces_loop_total == 1) | (faces_loop_total == 2))[faces_order]
+    keys_faces_end = np.cumsum(np.bincount(faces_key, minlength=len(keys))[keys_order])
+    keys_loops_end = np.cumsum(faces[:, FACE_LOOP_TOTAL])[keys_faces_end - 1]
+
+    keys = list(keys)
+    ret = []
+    face_start = loop_start = 0
+    for key_index, face_end, loop_end in zip(keys_order.tolist(), keys_faces_end.tolist(), keys_loops_end.tolist()):
+        if face_end == face_start:
+            continue  # Not used by any face.
+        faces_split = faces[face_start:face_end]
+        loops_split = loops[loop_start:loop_end].copy()
+        use_verts_nor = use_verts_tex = not np.all(faces_is_edge[face_start:face_end])
+
+        # Remap verts to new vert list (in order of first use).
+        verts_idx, verts_first_loop, loops_vert = np.unique(loops_split[:, LOOP_VERT],
+                                                           return_index=True, return_inverse=True)
+        verts_order = np.argsort(verts_first_loop)
+        verts_rank = np.empty_like(verts_order)
+        verts_rank[verts_order] = np.arange(len(verts_order))
+        loops_split[:, LOOP_VERT] = verts_rank[loops_vert.reshape(-1)]
+        verts_split = verts_loc[verts_idx[verts_order]]
+
+        # Materials, in order of first use.
+        unique_materials_split = {}
+        contexts_idx, contexts_first_face = np.unique(faces_split[:, FACE_CONTEXT][faces_split[:, FACE_LOOP_TOTAL] > 0],
+                                                      return_index=True)
+        for context_idx in contexts_idx[np.argsort(contexts_first_face)].tolist():
+            context_material = contexts[context_idx][0]
+            unique_materials_split[context_material] = unique_materials[context_material]
+
+        ret.append((verts_split, (loops_split, faces_split), unique_materials_split, key_to_name(keys[key_index]),
+                    use_verts_nor, use_verts_tex))
+        face_start, loop_start = face_end, loop_end
+
+    return ret
 
 
 def create_mesh(new_objects,
@@ -556,6 +564,7 @@ def create_mesh(new_objects,
                 verts_nor,
                 verts_tex,
                 faces,
+                contexts,
                 unique_materials,
                 unique_smooth_groups,
                 vertex_groups,
@@ -566,112 +575,87 @@ def create_mesh(new_objects,
     deals with ngons, sharp edges and assigning materials
     """
 
-    if unique_smooth_groups:
-        sharp_edges = set()
-        smooth_group_users = {context_smooth_group: {} for context_smooth_group in unique_smooth_groups.keys()}
-        context_smooth_group_old = -1
+    loops, faces = faces
+    loops_vert = loops[:, LOOP_VERT]
+    faces_loop_total = faces[:, FACE_LOOP_TOTAL]
+    faces_loop_start = np.cumsum(faces_loop_total) - faces_loop_total
+    faces_context = faces[:, FACE_CONTEXT]
+    faces_flags = faces[:, FACE_FLAGS]
 
-    fgon_edges = set()  # Used for storing fgon keys when we need to tessellate/untessellate them (ngons with hole).
-    edges = []
-    tot_loops = 0
+    # Single vert faces are dropped, faces with a single item in face_vert_nor_indices are actually polylines!
+    faces_is_edge = (faces_loop_total >= 2) & ((faces_flags & FACE_EDGE).astype(bool) | (faces_loop_total == 2))
+    faces_is_face = (faces_loop_total >= 3) & ~(faces_flags & FACE_EDGE).astype(bool)
 
-    context_object_key = None
-
-    # reverse loop through face indices
-    for f_idx in range(len(faces) - 1, -1, -1):
-        face = faces[f_idx]
-
-        (face_vert_loc_indices,
-         face_vert_nor_indices,
-         face_vert_tex_indices,
-         context_material,
-         context_smooth_group,
-         context_object_key,
-         face_invalid_blenpoly,
-         ) = face
-
-        len_face_vert_loc_indices = len(face_vert_loc_indices)
-
-        if len_face_vert_loc_indices == 1:
-            faces.pop(f_idx)  # cant add single vert faces
-
-        # Face with a single item in face_vert_nor_indices is actually a polyline!
-        elif face_is_edge(face):
-            if use_edges:
-                edges.extend((face_vert_loc_indices[i], face_vert_loc_indices[i + 1])
-                             for i in range(len_face_vert_loc_indices - 1))
-            faces.pop(f_idx)
+    # map the material names to an index
+    material_mapping = {name: i for i, name in enumerate(unique_materials)}  # enumerate over unique_materials keys()
+    smooth_group_mapping = {name: i for i, name in enumerate(unique_smooth_groups, 1)}
+    contexts_material = np.array([material_mapping.get(context_material, 0)
+                                  for context_material, _, _ in contexts], dtype=np.int32)
+    contexts_smooth_group = np.array([smooth_group_mapping.get(context_smooth_group, 0) if context_smooth_group else 0
+                                      for _, context_smooth_group, _ in contexts], dtype=np.int32)
+    faces_smooth_group = contexts_smooth_group[faces_context]
+
+    # Polylines edges, in reversed faces order.
+    edges = np.zeros((0, 2), dtype=np.int32)
+    if use_edges:
+        edges_face = np.flatnonzero(faces_is_edge)[::-1]
+        edges_loop = face_loop_indices(faces_loop_start[edges_face], faces_loop_total[edges_face] - 1)
+        edges = np.column_stack((loops_vert[edges_loop], loops_vert[edges_loop + 1]))
 
-        else:
-            # Smooth Group
-            if unique_smooth_groups and context_smooth_group:
-                # Is a part of of a smooth group and is a face
-                if context_smooth_group_old is not context_smooth_group:
-                    edge_dict = smooth_group_users[context_smooth_group]
-                    context_smooth_group_old = context_smooth_group
-
-                prev_vidx = face_vert_loc_indices[-1]
-                for vidx in face_vert_loc_indices:
+    sharp_edges = None
+    if unique_smooth_groups:
+        # Edges used only once by faces of a smooth group are on its boundary.
+        smooth_faces = np.flatnonzero(faces_is_face & (faces_smooth_group != 0))
+        smooth_loops = face_loop_indices(faces_loop_start[smooth_faces], faces_loop_total[smooth_faces])
+        loops_face_start = np.repeat(faces_loop_start[smooth_faces], faces_loop_total[smooth_faces])
+        loops_face_total = np.repeat(faces_loop_total[smooth_faces], faces_loop_total[smooth_faces])
+        prev_loops = np.where(smooth_loops == loops_face_start, smooth_loops + loops_face_total - 1, smooth_loops - 1)
+        vidx, prev_vidx = loops_vert[smooth_loops], loops_vert[prev_loops]
+        edge_users = np.column_stack((np.repeat(faces_smooth_group[smooth_faces], faces_loop_total[smooth_faces]),
+                                      np.minimum(prev_vidx, vidx), np.maximum(prev_vidx, vidx))).astype(np.int64)
+        edge_users, users = np.unique(edge_users, axis=0, return_counts=True)
+        sharp_edges = np.unique(edge_users[users == 1, 1:], axis=0)
+
+    # NGons into triangles
+    fgon_edges = set()  # Used for storing fgon keys when we need to tessellate/untessellate them (ngons with hole).
+    tris_loops = []
+    tris_context = []
+    invalid_faces = np.flatnonzero(faces_is_face & (faces_flags & FACE_INVALID).astype(bool) & (faces_loop_total > 3))
+    for f_idx in reversed(invalid_faces.tolist()):
+        # ignore triangles with invalid indices
+        from bpy_extras.mesh_utils import ngon_tessellate
+        face_loops = loops[faces_loop_start[f_idx]:faces_loop_start[f_idx] + faces_loop_total[f_idx]]
+        face_vert_loc_indices = face_loops[:, LOOP_VERT].tolist()
+        ngon_face_indices = ngon_tessellate(verts_loc[face_vert_loc_indices].tolist(),
+                                            list(range(len(face_vert_loc_indices))), debug_print=bpy.app.debug)
+        tris_loops.extend(face_loops[list(ngon)] for ngon in ngon_face_indices)
+        tris_context.extend([faces_context[f_idx]] * len(ngon_face_indices))
+
+        # edges to make ngons
+        if len(ngon_face_indices) > 1:
+            edge_users = set()
+            for ngon in ngon_face_indices:
+                prev_vidx = face_vert_loc_indices[ngon[-1]]
+                for ngidx in ngon:
+                    vidx = face_vert_loc_indices[ngidx]
+                    if vidx == prev_vidx:
+                        continue  # broken OBJ... Just skip.
                     edge_key = (prev_vidx, vidx) if (prev_vidx < vidx) else (vidx, prev_vidx)
                     prev_vidx = vidx
-                    edge_dict[edge_key] = edge_dict.get(edge_key, 0) + 1
-
-            # NGons into triangles
-            if face_invalid_blenpoly:
-                # ignore triangles with invalid indices
-                if len(face_vert_loc_indices) > 3:
-                    from bpy_extras.mesh_utils import ngon_tessellate
-                    ngon_face_indices = ngon_tessellate(verts_loc, face_vert_loc_indices, debug_print=bpy.app.debug)
-                    faces.extend([([face_vert_loc_indices[ngon[0]],
-                                    face_vert_loc_indices[ngon[1]],
-                                    face_vert_loc_indices[ngon[2]],
-                                    ],
-                                [face_vert_nor_indices[ngon[0]],
-                                    face_vert_nor_indices[ngon[1]],
-                                    face_vert_nor_indices[ngon[2]],
-                                    ] if face_vert_nor_indices else [],
-                                [face_vert_tex_indices[ngon[0]],
-                                    face_vert_tex_indices[ngon[1]],
-                                    face_vert_tex_indices[ngon[2]],
-                                    ] if face_vert_tex_indices else [],
-                                context_material,
-                                context_smooth_group,
-                                context_object_key,
-                                [],
-                                )
-                                for ngon in ngon_face_indices]
-                                )
-                    tot_loops += 3 * len(ngon_face_indices)
-
-                    # edges to make ngons
-                    if len(ngon_face_indices) > 1:
-                        edge_users = set()
-                        for ngon in ngon_face_indices:
-                            prev_vidx = face_vert_loc_indices[ngon[-1]]
-                            for ngidx in ngon:
-                                vidx = face_vert_loc_indices[ngidx]
-                                if vidx == prev_vidx:
-                                    continue  # broken OBJ... Just skip.
-                                edge_key = (prev_vidx, vidx) if (prev_vidx < vidx) else (vidx, prev_vidx)
-                                prev_vidx = vidx
-                                if edge_key in edge_users:
-                                    fgon_edges.add(edge_key)
-                                else:
-                                    edge_users.add(edge_key)
-
-                faces.pop(f_idx)
-            else:
-                tot_loops += len_face_vert_loc_indices
-
-    # Build sharp edges
-    if unique_smooth_groups:
-        for edge_dict in smooth_group_users.values():
-            for key, users in edge_dict.items():
-                if users == 1:  # This edge is on the boundary of a group
-                    sharp_edges.add(key)
-
-    # map the material names to an index
-    material_mapping = {name: i for i, name in enumerate(unique_materials)}  # enumerate over unique_materials keys()
+                    if edge_key in edge_users:
+                        fgon_edges.add(edge_key)
+                    else:
+                        edge_users.add(edge_key)
+
+    valid_faces = np.flatnonzero(faces_is_face & ~(faces_flags & FACE_INVALID).astype(bool))
+    loops = loops[face_loop_indices(faces_loop_start[valid_faces], faces_loop_total[valid_faces])]
+    faces_loop_total = faces_loop_total[valid_faces]
+    faces_context = faces_context[valid_faces]
+    if tris_loops:
+        loops = np.concatenate([loops] + tris_loops)
+        faces_loop_total = np.concatenate((faces_loop_total, np.full(len(tris_context), 3, dtype=np.int32)))
+        faces_context = np.concatenate((faces_context, tris_context))
+    faces_loop_start = np.cumsum(faces_loop_total) - faces_loop_total
 
     materials = [None] * len(unique_materials)
 
@@ -685,55 +669,35 @@ def create_mesh(new_objects,
         me.materials.append(material)
 
     me.vertices.add(len(verts_loc))
-    me.loops.add(tot_loops)
-    me.polygons.add(len(faces))
-
-    # verts_loc is a list of (x, y, z) tuples
-    me.vertices.foreach_set("co", unpack_list(verts_loc))
-
-    loops_vert_idx = tuple(vidx for (face_vert_loc_indices, _, _, _, _, _, _) in faces for vidx in face_vert_loc_indices)
-    faces_loop_start = []
-    lidx = 0
-    for f in faces:
-        face_vert_loc_indices = f[0]
-        nbr_vidx = len(face_vert_loc_indices)
-        faces_loop_start.append(lidx)
-        lidx += nbr_vidx
-    faces_loop_total = tuple(len(face_vert_loc_indices) for (face_vert_loc_indices, _, _, _, _, _, _) in faces)
-
-    me.loops.foreach_set("vertex_index", loops_vert_idx)
-    me.polygons.foreach_set("loop_start", faces_loop_start)
+    me.loops.add(len(loops))
+    me.polygons.add(len(faces_loop_total))
+
+    # verts_loc is a (N, 3) array
+    me.vertices.foreach_set("co", verts_loc.ravel())
+
+    me.loops.foreach_set("vertex_index", np.ascontiguousarray(loops[:, LOOP_VERT]))
+    me.polygons.foreach_set("loop_start", faces_loop_start.astype(np.int32))
     me.polygons.foreach_set("loop_total", faces_loop_total)
 
-    faces_ma_index = tuple(material_mapping[context_material] for (_, _, _, context_material, _, _, _) in faces)
-    me.polygons.foreach_set("material_index", faces_ma_index)
+    me.polygons.foreach_set("material_index", contexts_material[faces_context])
 
-    faces_use_smooth = tuple(bool(context_smooth_group) for (_, _, _, _, context_smooth_group, _, _) in faces)
-    me.polygons.foreach_set("use_smooth", faces_use_smooth)
+    me.polygons.foreach_set("use_smooth", contexts_smooth_group[faces_context] != 0)
 
-    if verts_nor and me.loops:
+    if len(verts_nor) and me.loops:
         # Note: we store 'temp' normals in loops, since validate() may alter final mesh,
         #       we can only set custom lnors *after* calling it.
         me.create_normals_split()
-        loops_nor = tuple(no for (_, face_vert_nor_indices, _, _, _, _, _) in faces
-                             for face_noidx in face_vert_nor_indices
-                             for no in verts_nor[face_noidx])
-        me.loops.foreach_set("normal", loops_nor)
-
-    if verts_tex and me.polygons:
-        # Some files Do not explicitely write the 'v' value when it's 0.0, see T68249...
-        verts_tex = [uv if len(uv) == 2 else uv + [0.0] for uv in verts_tex]
+        me.loops.foreach_set("normal", verts_nor[loops[:, LOOP_NOR]].ravel())
+
+    if len(verts_tex) and me.polygons:
         me.uv_layers.new(do_init=False)
-        loops_uv = tuple(uv for (_, _, face_vert_tex_indices, _, _, _, _) in faces
-                            for face_uvidx in face_vert_tex_indices
-                            for uv in verts_tex[face_uvidx])
-        me.uv_layers[0].data.foreach_set("uv", loops_uv)
+        me.uv_layers[0].data.foreach_set("uv", verts_tex[loops[:, LOOP_TEX]].ravel())
 
-    use_edges = use_edges and bool(edges)
+    use_edges = use_edges and bool(len(edges))
     if use_edges:
         me.edges.add(len(edges))
-        # edges should be a list of (a, b) tuples
-        me.edges.foreach_set("vertices", unpack_list(edges))
+        # edges should be a (N, 2) array
+        me.edges.foreach_set("vertices", edges.ravel())
 
     me.validate(clean_customdata=False)  # *Very* important to not remove lnors here!
     me.update(calc_edges=use_edges, calc_edges_loose=use_edges)
@@ -757,12 +721,19 @@ def create_mesh(new_objects,
         bm.free()
 
     # XXX If validate changes the geometry, this is likely to be broken...
-    if unique_smooth_groups and sharp_edges:
-        for e in me.edges:
-            if e.key in sharp_edges:
-                e.use_edge_sharp = True
-
-    if verts_nor:
+    if sharp_edges is not None and len(sharp_edges):
+        me_edges = np.empty(len(me.edges) * 2, dtype=np.int32)
+        me.edges.foreach_get("vertices", me_edges)
+        me_edges = me_edges.reshape(-1, 2)
+        me_edges = np.column_stack((me_edges.min(axis=1), me_edges.max(axis=1))).astype(np.int64)
+        edge_key = np.dtype((np.void, 2 * me_edges.dtype.itemsize))
+        edges_sharp = np.isin(me_edges.view(edge_key).ravel(), np.ascontiguousarray(sharp_edges).view(edge_key).ravel())
+        if edges_sharp.any():
+            edges_use_sharp = np.empty(len(me.edges), dtype=bool)
+            me.edges.foreach_get("use_edge_sharp", edges_use_sharp)
+            me.edges.foreach_set("use_edge_sharp", edges_use_sharp | edges_sharp)
+
+    if len(verts_nor):
         clnors = array.array('f', [0.0] * (len(me.loops) * 3))
         me.loops.foreach_get("normal", clnors)
 
@@ -813,7 +784,7 @@ def create_nurbs(context_nurbs, vert_loc, new_objects):
 
     nu = cu.splines.new('NURBS')
     nu.points.add(len(curv_idx) - 1)  # a point is added to start with
-    nu.points.foreach_set("co", [co_axis for vt_idx in curv_idx for co_axis in (vert_loc[vt_idx] + (1.0,))])
+    nu.points.foreach_set("co", [co_axis for vt_idx in curv_idx for co_axis in (tuple(vert_loc[vt_idx]) + (1.0,))])
 
     nu.order_u = deg[0] + 1
 
@@ -893,6 +864,391 @@ def any_number_as_int(svalue):
     return int(float(svalue))
 
 
+# ----------------------------------------------------------------------------
+# Bulk parsing
+
+# Size of the blocks of the file read (and parsed) at once.
+PARSE_CHUNK_SIZE = 1 << 24
+
+# Kinds of lines handled by the bulk parser, anything else being parsed line by line.
+LINE_OTHER = 0
+LINE_V = 1
+LINE_VN = 2
+LINE_VT = 3
+LINE_F = 4
+LINE_TAGS = (None, b'v', b'vn', b'vt', b'f')
+
+# Columns of loops arrays (vertex, uv and normal indices).
+LOOP_VERT = 0
+LOOP_TEX = 1
+LOOP_NOR = 2
+
+# Columns of faces arrays (number of loops, context index and flags).
+FACE_LOOP_TOTAL = 0
+FACE_CONTEXT = 1
+FACE_FLAGS = 2
+
+# Faces flags.
+FACE_EDGE = 1 << 0  # A polyline, not a real face.
+FACE_INVALID = 1 << 1  # A Blender-invalid ngon (using a same edge more than once).
+
+
+class ArrayChunks:
+    """
+    Growing (N, width) array, stored as a list of numpy arrays and of pending Python items
+    (sequences of values, padded or truncated to width when converted).
+    """
+    __slots__ = ("width", "dtype", "chunks", "items", "count")
+
+    def __init__(self, width, dtype):
+        self.width = width
+        self.dtype = dtype
+        self.chunks = []
+        self.items = []
+        self.count = 0
+
+    def __len__(self):
+        return self.count + len(self.items)
+
+    def append(self, item):
+        self.items.append(item)
+
+    def extend_array(self, values):
+        self.flush()
+        if values.shape[1] != self.width:
+            values_width = values
+            values = np.zeros((len(values_width), self.width), dtype=self.dtype)
+            values[:, :values_width.shape[1]] = values_width[:, :self.width]
+        self.chunks.append(values.astype(self.dtype, copy=False))
+        self.count += len(values)
+
+    def flush(self):
+        if self.items:
+            values = np.zeros((len(self.items), self.width), dtype=self.dtype)
+            for i, item in enumerate(self.items):
+                item = item[:self.width]
+                values[i, :len(item)] = item
+            self.chunks.append(values)
+            self.count += len(values)
+            self.items.clear()
+
+    def to_array(self):
+        self.flush()
+        if len(self.chunks) != 1:
+            self.chunks[:] = [np.concatenate(self.chunks) if self.chunks else np.zeros((0, self.width), self.dtype)]
+        return self.chunks[0]
+
+
+class FaceChunks:
+    """
+    Faces (and polylines), stored as (loops, faces) arrays, see LOOP_ and FACE_ columns.
+    Faces may also be added as the Python face tuples used by the line by line parser.
+    """
+    __slots__ = ("contexts", "loops", "faces", "items")
+
+    def __init__(self):
+        self.contexts = {}  # (context_material, context_smooth_group, context_object_key): context index
+        self.loops = ArrayChunks(3, np.int32)
+        self.faces = ArrayChunks(3, np.int32)
+        self.items = []
+
+    def __len__(self):
+        return len(self.faces) + len(self.items)
+
+    def context_index(self, context_material, context_smooth_group, context_object_key):
+        return self.contexts.setdefault((context_material, context_smooth_group, context_object_key),
+                                        len(self.contexts))
+
+    def append(self, face):
+        # Face tuples are filled after being added, they are only converted once complete.
+        self.items.append(face)
+
+    def extend_array(self, loops, faces_loop_total, context_index, faces_flags):
+        self.flush()
+        self.loops.extend_array(loops)
+        self.faces.extend_array(np.column_stack((faces_loop_total, np.full(len(faces_loop_total), context_index),
+                                                 faces_flags)))
+
+    def flush(self):
+        for face in self.items:
+            (face_vert_loc_indices,
+             face_vert_nor_indices,
+             face_vert_tex_indices,
+             context_material,
+             context_smooth_group,
+             context_object_key,
+             face_invalid_blenpoly,
+             ) = face
+            context_index = self.context_index(context_material, context_smooth_group, context_object_key)
+            if len(face_vert_nor_indices) != len(face_vert_loc_indices):
+                # Polyline, or single vert face.
+                self.loops.items.extend((vidx, 0, 0) for vidx in face_vert_loc_indices)
+                self.faces.items.append((len(face_vert_loc_indices), context_index, FACE_EDGE))
+            else:
+                self.loops.items.extend(zip(face_vert_loc_indices, face_vert_tex_indices, face_vert_nor_indices))
+                self.faces.items.append((len(face_vert_loc_indices), context_index,
+                                         FACE_INVALID if face_invalid_blenpoly else 0))
+        self.items.clear()
+
+    def to_arrays(self):
+        """Return (loops, faces, contexts) arrays, contexts being the list of all face context tuples."""
+        self.flush()
+        contexts = sorted(self.contexts, key=self.contexts.get)
+        return self.loops.to_array(), self.faces.to_array(), contexts
+
+
+def iter_file_chunks(file, chunk_size=PARSE_CHUNK_SIZE, size=-1):
+    """Yield the content of given (binary) file by blocks of whole lines (reading at most size bytes if not -1)."""
+    rest = b''
+    while True:
+        data = file.read(chunk_size if size < 0 else min(chunk_size, size))
+        size -= len(data)
+        if not data:
+            if rest:
+                yield rest + b'\n'
+            return
+        data = rest + data
+        cut = data.rfind(b'\n') + 1
+        rest = data[cut:]
+        if cut:
+            yield data[:cut]
+
+
+def fromstring(data, dtype):
+    """Parse whitespace-separated numbers, return None if data is not only made of those."""
+    import warnings
+    with warnings.catch_warnings():
+        # Older numpy versions only warn and return what could be parsed.
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            return np.fromstring(data, dtype=dtype, sep=' ')
+        except (ValueError, DeprecationWarning):
+            return None
+
+
+def lines_count(lines_start, mask):
+    """Return the number of True items of given bytes mask in each line."""
+    mask_line = np.searchsorted(lines_start, np.flatnonzero(mask), side='right') - 1
+    return np.bincount(mask_line, minlength=len(lines_start))
+
+
+def lines_tokens_count(buf, lines_start):
+    """Return the number of (whitespace separated) tokens of each line in given bytes array."""
+    is_space = (buf == 32) | (buf == 9) | (buf == 13) | (buf == 10)
+    tokens_start = ~is_space
+    tokens_start[1:] &= is_space[:-1]
+    return lines_count(lines_start, tokens_start)
+
+
+def parse_vecs(block, lines_start, tag_len, use_comma_floats):
+    """
+    Parse given block of v/vn/vt lines, return a (N, K) array of their K values (or None when not possible,
+    e.g. if lines have different numbers of values).
+    """
+    buf = np.frombuffer(block, dtype=np.uint8)
+    values_count = lines_tokens_count(buf, lines_start) - 1
+    vec_len = values_count[0]
+    if vec_len < 1 or np.any(values_count != vec_len):
+        return None
+
+    buf = buf.copy()
+    buf[lines_start[:, None] + np.arange(tag_len)] = 32  # Remove line tags.
+    if use_comma_floats:
+        buf[buf == 44] = 46  # ',' -> '.'
+    values = fromstring(buf.tobytes(), np.float64)
+    if values is None or len(values) != vec_len * len(lines_start):
+        return None
+    return values.reshape(-1, vec_len)
+
+
+def parse_faces(block, lines_start):
+    """
+    Parse given block of f lines, return ((N, 3) array of raw 'v/vt/vn' indices of all N face items
+    (missing indices being 0), faces items count) (or None when not possible, e.g. if items have different formats).
+    """
+    buf = np.frombuffer(block, dtype=np.uint8)
+    faces_loop_total = lines_tokens_count(buf, lines_start) - 1
+    if np.any(faces_loop_total < 1):
+        return None
+
+    # All lines must use the same format, checked from their counts of '/' and '//'.
+    is_slash = buf == 47
+    slash_count = lines_count(lines_start, is_slash)
+    double_slash_count = lines_count(lines_start, is_slash[:-1] & is_slash[1:])
+    if not np.any(slash_count):
+        columns = [LOOP_VERT]
+    elif np.all(slash_count == faces_loop_total) and not np.any(double_slash_count):
+        columns = [LOOP_VERT, LOOP_TEX]
+    elif np.all(slash_count == 2 * faces_loop_total) and np.all(double_slash_count == faces_loop_total):
+        columns = [LOOP_VERT, LOOP_NOR]
+    elif np.all(slash_count == 2 * faces_loop_total) and not np.any(double_slash_count):
+        columns = [LOOP_VERT, LOOP_TEX, LOOP_NOR]
+    else:
+        return None
+
+    items_count = int(faces_loop_total.sum())
+
+    buf = buf.copy()
+    buf[lines_start] = 32  # Remove line tags.
+    buf[buf == 47] = 32  # '/'
+    values = fromstring(buf.tobytes(), np.int64)
+    if values is None or len(values) != items_count * len(columns):
+        return None
+    indices = np.zeros((items_count, 3), dtype=np.int64)
+    indices[:, columns] = values.reshape(-1, len(columns))
+    return indices, faces_loop_total
+
+
+def parse_chunks(file, use_comma_floats, size=-1):
+    """
+    Yield the content of given OBJ file (or its next size bytes if not -1) as (tag, data) blocks:
+    * (None, lines): lines to be parsed one by one.
+    * (b'v', values), (b'vn', values) or (b'vt', values): see parse_vecs.
+    * (b'f', (indices, faces_loop_total)): see parse_faces.
+    Consecutive v, vn, vt and f lines are parsed at once, unless they use multi-line records (or unexpected data).
+    """
+    line_continues = False  # Last line of previous chunk ends with a '\'.
+
+    for chunk in iter_file_chunks(file, size=size):
+        buf = np.frombuffer(chunk, dtype=np.uint8)
+        lines_end = np.flatnonzero(buf == 10) + 1
+        lines_start = np.empty_like(lines_end)
+        lines_start[0] = 0
+        lines_start[1:] = lines_end[:-1]
+
+        # Kind of each line, from its first characters.
+        c0 = buf[lines_start]
+        c1 = buf[np.minimum(lines_start + 1, len(buf) - 1)]
+        c2 = buf[np.minimum(lines_start + 2, len(buf) - 1)]
+        c1_is_space = (c1 == 32) | (c1 == 9)
+        c2_is_space = (c2 == 32) | (c2 == 9)
+        lines_kind = np.zeros(len(lines_start), dtype=np.uint8)
+        lines_kind[(c0 == 118) & c1_is_space] = LINE_V  # 'v '
+        lines_kind[(c0 == 118) & (c1 == 110) & c2_is_space] = LINE_VN  # 'vn '
+        lines_kind[(c0 == 118) & (c1 == 116) & c2_is_space] = LINE_VT  # 'vt '
+        lines_kind[(c0 == 102) & c1_is_space] = LINE_F  # 'f '
+
+        # Multi-line records ('\' at end of line) are left to the line by line parser.
+        backslash_lines = np.searchsorted(lines_end, np.flatnonzero(buf == 92), side='right')
+        lines_kind[backslash_lines] = LINE_OTHER
+        lines_kind[np.minimum(backslash_lines + 1, len(lines_kind) - 1)] = LINE_OTHER
+        if line_continues:
+            lines_kind[0] = LINE_OTHER
+        line_continues = bool(len(backslash_lines)) and backslash_lines[-1] == len(lines_kind) - 1
+
+        runs_start = np.flatnonzero(lines_kind[1:] != lines_kind[:-1]) + 1
+        runs_end = np.append(runs_start, len(lines_kind)).tolist()
+        runs_start = np.insert(runs_start, 0, 0).tolist()
+        for run_start, run_end in zip(runs_start, runs_end):
+            kind = lines_kind[run_start]
+            block = chunk[lines_start[run_start]:lines_end[run_end - 1]]
+            block_lines_start = lines_start[run_start:run_end] - lines_start[run_start]
+            data = None
+            if kind == LINE_F:
+                data = parse_faces(block, block_lines_start)
+            elif kind != LINE_OTHER:
+                data = parse_vecs(block, block_lines_start, 1 if kind == LINE_V else 2, use_comma_floats)
+            if data is None:
+                yield None, block.split(b'\n')[:-1]
+            else:
+                yield LINE_TAGS[kind], data
+
+
+# Objects and groups smaller than that are parsed together by a same worker.
+PARSE_RANGE_SIZE = 1 << 22
+
+
+def scan_ranges(file, range_size=PARSE_RANGE_SIZE):
+    """
+    Return a list of (start, end) byte ranges covering given OBJ file, each one starting with an o or g line
+    (or the start of the file), and (unless it is a single object or group) of about range_size bytes.
+    """
+    ranges = []
+    start = offset = 0
+    for chunk in iter_file_chunks(file):
+        buf = np.frombuffer(chunk, dtype=np.uint8)
+        lines_start = np.insert(np.flatnonzero(buf[:-1] == 10) + 1, 0, 0)
+        c0 = buf[lines_start]
+        c1 = buf[np.minimum(lines_start + 1, len(buf) - 1)]
+        is_group = ((c0 == 111) | (c0 == 103)) & ((c1 == 32) | (c1 == 9))  # 'o ' or 'g '
+        for group_start in (lines_start[is_group] + offset).tolist():
+            if group_start - start >= range_size:
+                ranges.append((start, group_start))
+                start = group_start
+        offset += len(chunk)
+    ranges.append((start, offset))
+    return ranges
+
+
+def parse_range(filepath, start, end, use_comma_floats):
+    """Return the list of (tag, data) blocks of given byte range of an OBJ file, see parse_chunks."""
+    with open(filepath, 'rb') as f:
+        f.seek(start)
+        return list(parse_chunks(f, use_comma_floats, end - start))
+
+
+def parse_chunks_parallel(filepath, use_comma_floats, num_workers=0):
+    """
+    Same as parse_chunks, but parse the byte ranges of the file (see scan_ranges) concurrently,
+    using num_workers (all CPU cores if 0) worker processes, blocks being still yielded in file order.
+
+    Worker processes are forked (they only run NumPy parsing code, and cannot import bpy), which is only safe
+    on Linux (forking the multi-threaded Blender process is not on macOS), elsewhere this falls back to (serial)
+    parse_chunks. Only a few ranges per worker are parsed ahead, to bound the memory used by pending blocks.
+    """
+    import multiprocessing
+    import sys
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    with open(filepath, 'rb') as f:
+        ranges = scan_ranges(f)
+        num_workers = min(num_workers or os.cpu_count() or 1, len(ranges))
+        if num_workers < 2 or not sys.platform.startswith("linux"):
+            f.seek(0)
+            yield from parse_chunks(f, use_comma_floats)
+            return
+
+    print("\tparsing %d ranges with %d processes" % (len(ranges), num_workers))
+    pending = deque()
+    with ProcessPoolExecutor(num_workers, mp_context=multiprocessing.get_context("fork")) as executor:
+        for start, end in ranges:
+            pending.append(executor.submit(parse_range, filepath, start, end, use_comma_floats))
+            if len(pending) >= 2 * num_workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def faces_invalid_blenpoly(loops_vert, faces_loop_total):
+    """
+    Return the indices of Blender-invalid faces (ngons using a same edge more than once).
+    """
+    faces_loop_start = np.cumsum(faces_loop_total) - faces_loop_total
+    # Faces using a same vertex more than once are suspected, and then checked one by one.
+    suspects = []
+    for loop_total in np.unique(faces_loop_total).tolist():
+        faces = np.flatnonzero(faces_loop_total == loop_total)
+        faces_vert = loops_vert[faces_loop_start[faces][:, None] + np.arange(loop_total)]
+        faces_vert.sort(axis=1)
+        suspects.append(faces[np.any(faces_vert[:, 1:] == faces_vert[:, :-1], axis=1)])
+
+    invalid = []
+    for f_idx in np.sort(np.concatenate(suspects)).tolist() if suspects else ():
+        face_vert_loc_indices = loops_vert[faces_loop_start[f_idx]:faces_loop_start[f_idx] + faces_loop_total[f_idx]]
+        face_vert_loc_indices = face_vert_loc_indices.tolist()
+        face_items_usage = set()
+        prev_vidx = face_vert_loc_indices[-1]
+        for vidx in face_vert_loc_indices:
+            edge_key = (prev_vidx, vidx) if (prev_vidx < vidx) else (vidx, prev_vidx)
+            if edge_key in face_items_usage:
+                invalid.append(f_idx)
+                break
+            face_items_usage.add(edge_key)
+            prev_vidx = vidx
+    return invalid
+
+
 def load(context,
          filepath,
          *,
@@ -903,6 +1259,7 @@ def load(context,
          use_split_groups=False,
          use_image_search=True,
          use_groups_as_vgroups=False,
+         use_parallel=False,
          relpath=None,
          global_matrix=None
          ):
@@ -958,10 +1315,10 @@ def load(context,
 
         time_main = time.time()
 
-        verts_loc = []
-        verts_nor = []
-        verts_tex = []
-        faces = []  # tuples of the faces
+        verts_loc = ArrayChunks(3, np.float32)
+        verts_nor = ArrayChunks(3, np.float32)
+        verts_tex = ArrayChunks(2, np.float32)
+        faces = FaceChunks()  # loops and faces arrays (and tuples of the faces parsed line by line)
         material_libs = set()  # filenames to material libs this OBJ uses
         vertex_groups = {}  # when use_groups_as_vgroups is true
 
@@ -1008,9 +1365,48 @@ def load(context,
         quick_vert_failures = 0
         skip_quick_vert = False
 
+        def iter_lines(blocks):
+            """
+            Yield the lines of the OBJ file (from its parsed blocks) that need to be parsed one by one,
+            directly adding data of blocks of v, vn, vt and f lines.
+            """
+            for block_tag, block in blocks:
+                if block_tag is None:
+                    yield from block
+                elif block_tag == b'v':
+                    verts_loc.extend_array(block)
+                elif block_tag == b'vn':
+                    verts_nor.extend_array(block)
+                elif block_tag == b'vt':
+                    verts_tex.extend_array(block)
+                elif block_tag == b'f':
+                    indices, faces_loop_total = block
+                    # Note that we assume here we cannot get OBJ invalid 0 index for vertices...
+                    loops = np.empty((len(indices), 3), dtype=np.int64)
+                    idx = indices[:, LOOP_VERT]
+                    loops[:, LOOP_VERT] = np.where(idx < 1, idx + len(verts_loc), idx - 1)
+                    idx = indices[:, LOOP_TEX]
+                    loops[:, LOOP_TEX] = np.where(idx == 0, 0, np.where(idx < 0, idx + len(verts_tex), idx - 1))
+                    idx = indices[:, LOOP_NOR]
+                    loops[:, LOOP_NOR] = np.where(idx == 0, 0, np.where(idx < 0, idx + len(verts_nor), idx - 1))
+
+                    # Add the vertices to the current group
+                    # *warning*, this wont work for files that have groups defined around verts
+                    if use_groups_as_vgroups and context_vgroup:
+                        vertex_groups[context_vgroup].extend(loops[:, LOOP_VERT].tolist())
+
+                    faces_flags = np.zeros(len(faces_loop_total), dtype=np.int32)
+                    faces_flags[faces_invalid_blenpoly(loops[:, LOOP_VERT], faces_loop_total)] = FACE_INVALID
+                    context_index = faces.context_index(context_material, context_smooth_group, context_object_key)
+                    faces.extend_array(loops, faces_loop_total, context_index, faces_flags)
+
         progress.enter_substeps(3, "Parsing OBJ file...")
         with open(filepath, 'rb') as f:
-            for line in f:
+            if use_parallel:
+                blocks = parse_chunks_parallel(filepath, float_func is not float)
+            else:
+                blocks = parse_chunks(f, float_func is not float)
+            for line in iter_lines(blocks):
                 line_split = line.split()
 
                 if not line_split:
@@ -1233,6 +1629,14 @@ def load(context,
 
         progress.step("Done, loading materials and images...")
 
+        verts_loc = verts_loc.to_array()
+        verts_nor = verts_nor.to_array()
+        verts_tex = verts_tex.to_array()
+        loops, faces, contexts = faces.to_arrays()
+
+        if any(context_material is None for context_material, _, _ in contexts):
+            use_default_material = True
+
         if use_default_material:
             unique_materials[None] = None
         create_materials(filepath, relpath, material_libs, unique_materials,
@@ -1251,16 +1655,17 @@ def load(context,
         # Split the mesh by objects/materials, may
         SPLIT_OB_OR_GROUP = bool(use_split_objects or use_split_groups)
 
-        for data in split_mesh(verts_loc, faces, unique_materials, filepath, SPLIT_OB_OR_GROUP):
+        for data in split_mesh(verts_loc, (loops, faces), contexts, unique_materials, filepath, SPLIT_OB_OR_GROUP):
             verts_loc_split, faces_split, unique_materials_split, dataname, use_vnor, use_vtex = data
             # Create meshes from the data, warning 'vertex_groups' wont support splitting
             #~ print(dataname, use_vnor, use_vtex)
             create_mesh(new_objects,
                         use_edges,
                         verts_loc_split,
-                        verts_nor if use_vnor else [],
-                        verts_tex if use_vtex else [],
+                        verts_nor if use_vnor else verts_nor[:0],
+                        verts_tex if use_vtex else verts_tex[:0],
                         faces_split,
+                        contexts,
                         unique_materials_split,
                         unique_smooth_groups,
                         vertex_groups,
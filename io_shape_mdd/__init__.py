@@ -24,7 +24,7 @@ bl_info = {
     "version": (1, 0, 1),
     "blender": (2, 80, 0),
     "location": "File > Import-Export",
-    "description": "Import-Export MDD as mesh shape keys",
+    "description": "Import-Export MDD as mesh shape keys, import PC2",
     "warning": "",
     "wiki_url": "http://wiki.blender.org/index.php/Extensions:2.6/Py/"
                 "Scripts/Import-Export/NewTek_OBJ",
@@ -49,18 +49,8 @@ from bpy.props import (
 from bpy_extras.io_utils import ExportHelper, ImportHelper
 
 
-class ImportMDD(bpy.types.Operator, ImportHelper):
-    """Import MDD vertex keyframe file to shape keys"""
-    bl_idname = "import_shape.mdd"
-    bl_label = "Import MDD"
-    bl_options = {'UNDO'}
-
-    filename_ext = ".mdd"
-
-    filter_glob: StringProperty(
-            default="*.mdd",
-            options={'HIDDEN'},
-            )
+class ImportPointCacheBase(ImportHelper):
+    """Properties and methods shared by the MDD and PC2 import operators"""
     frame_start: IntProperty(
             name="Start Frame",
             description="Start frame for inserting animation",
@@ -72,6 +62,12 @@ class ImportMDD(bpy.types.Operator, ImportHelper):
             min=1, max=1000,
             default=1,
             )
+    use_streaming: BoolProperty(
+            name="Stream Frames",
+            description="Read frames from the (memory-mapped) file on frame change, into a single shape key, "
+                        "instead of creating one shape key per frame",
+            default=False,
+            )
 
     @classmethod
     def poll(cls, context):
@@ -91,6 +87,34 @@ class ImportMDD(bpy.types.Operator, ImportHelper):
         return import_mdd.load(context, **keywords)
 
 
+class ImportMDD(bpy.types.Operator, ImportPointCacheBase):
+    """Import MDD vertex keyframe file to shape keys"""
+    bl_idname = "import_shape.mdd"
+    bl_label = "Import MDD"
+    bl_options = {'UNDO'}
+
+    filename_ext = ".mdd"
+
+    filter_glob: StringProperty(
+            default="*.mdd",
+            options={'HIDDEN'},
+            )
+
+
+class ImportPC2(bpy.types.Operator, ImportPointCacheBase):
+    """Import PC2 vertex keyframe file to shape keys"""
+    bl_idname = "import_shape.pc2"
+    bl_label = "Import PC2"
+    bl_options = {'UNDO'}
+
+    filename_ext = ".pc2"
+
+    filter_glob: StringProperty(
+            default="*.pc2",
+            options={'HIDDEN'},
+            )
+
+
 class ExportMDD(bpy.types.Operator, ExportHelper):
     """Animated mesh to MDD vertex keyframe file"""
     bl_idname = "export_shape.mdd"
@@ -131,6 +155,12 @@ class ExportMDD(bpy.types.Operator, ExportHelper):
             description="Write the rest state at the first frame",
             default=False,
             )
+    use_mmap: BoolProperty(
+            name="Memory-Mapped Output",
+            description="Write frames into the memory-mapped output file "
+                        "(the whole file being allocated upfront)",
+            default=False,
+            )
 
     @classmethod
     def poll(cls, context):
@@ -158,6 +188,12 @@ def menu_func_import(self, context):
                          )
 
 
+def menu_func_import_pc2(self, context):
+    self.layout.operator(ImportPC2.bl_idname,
+                         text="Pointcache (.pc2)",
+                         )
+
+
 def menu_func_export(self, context):
     self.layout.operator(ExportMDD.bl_idname,
                          text="Lightwave Point Cache (.mdd)",
@@ -166,22 +202,36 @@ def menu_func_export(self, context):
 
 classes = (
     ImportMDD,
+    ImportPC2,
     ExportMDD
 )
 
 def register():
+    from . import import_mdd
+
     for cls in classes:
         bpy.utils.register_class(cls)
 
     bpy.types.TOPBAR_MT_file_import.append(menu_func_import)
+    bpy.types.TOPBAR_MT_file_import.append(menu_func_import_pc2)
     bpy.types.TOPBAR_MT_file_export.append(menu_func_export)
 
+    # Streamed caches (see import_mdd.load).
+    bpy.app.handlers.frame_change_pre.append(import_mdd.frame_change_handler)
+
 
 def unregister():
+    from . import import_mdd
+
+    if import_mdd.frame_change_handler in bpy.app.handlers.frame_change_pre:
+        bpy.app.handlers.frame_change_pre.remove(import_mdd.frame_change_handler)
+    import_mdd.caches_clear()
+
     for cls in classes:
         bpy.utils.unregister_class(cls)
 
     bpy.types.TOPBAR_MT_file_import.remove(menu_func_import)
+    bpy.types.TOPBAR_MT_file_import.remove(menu_func_import_pc2)
     bpy.types.TOPBAR_MT_file_export.remove(menu_func_export)
 
 if __name__ == "__main__":
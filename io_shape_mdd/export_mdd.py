@@ -31,6 +31,7 @@ Be sure not to use modifiers that change the number or order of verts in the mes
 
 import bpy
 import mathutils
+import numpy as np
 from struct import pack
 
 
@@ -51,7 +52,15 @@ def check_vertcount(mesh, vertcount):
         raise Exception('Error, number of verts has changed during animation, cannot export')
 
 
-def save(context, filepath="", frame_start=1, frame_end=300, fps=25.0, use_rest_frame=False):
+def transform_coords(coords, matrix):
+    """
+    Apply given 4x4 matrix to given (N, 3) array of coordinates, in place.
+    """
+    matrix = np.array(matrix, dtype=np.float64)
+    coords[:] = coords @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def save(context, filepath="", frame_start=1, frame_end=300, fps=25.0, use_rest_frame=False, use_mmap=False):
     """
     Blender.Window.WaitCursor(1)
 
@@ -87,7 +96,8 @@ def save(context, filepath="", frame_start=1, frame_end=300, fps=25.0, use_rest_
     if use_rest_frame:
         numframes += 1
 
-    f = open(filepath, 'wb')  # no Errors yet:Safe to create file
+    # no Errors yet:Safe to create file (read access is needed to map it)
+    f = open(filepath, 'w+b' if use_mmap else 'wb')
 
     # Write the header
     f.write(pack(">2i", numframes, numverts))
@@ -95,26 +105,45 @@ def save(context, filepath="", frame_start=1, frame_end=300, fps=25.0, use_rest_
     # Write the frame times (should we use the time IPO??)
     f.write(pack(">%df" % (numframes), *[frame / fps for frame in range(numframes)]))  # seconds
 
-    if use_rest_frame:
+    # Vertex data of a frame, fetched and written at once.
+    coords = np.empty((numverts, 3), dtype=np.float32)
+    if use_mmap:
+        # Frames are written into the (pre-sized) mapped file.
+        offset = f.tell()
+        f.truncate(offset + numframes * numverts * 3 * 4)
+        f.flush()
+        frames = np.memmap(f, dtype='>f4', mode='r+', offset=offset, shape=(numframes, numverts, 3))
+    else:
+        frames = None
+
+    def write_frame(me, frame_index):
         check_vertcount(me, numverts)
-        me.transform(mat_flip @ obj.matrix_world)
-        f.write(pack(">%df" % (numverts * 3), *[axis for v in me.vertices for axis in v.co]))
+        me.vertices.foreach_get("co", coords.reshape(-1))
+        transform_coords(coords, mat_flip @ obj.matrix_world)
+        if frames is None:
+            coords.astype('>f4').tofile(f)
+        else:
+            frames[frame_index] = coords
+
+    if use_rest_frame:
+        write_frame(me, 0)
 
     obj_eval.to_mesh_clear()
 
-    for frame in range(frame_start, frame_end + 1):  # in order to start at desired frame
+    for frame_index, frame in enumerate(range(frame_start, frame_end + 1), int(use_rest_frame)):
         scene.frame_set(frame)
         depsgraph = context.evaluated_depsgraph_get()
         obj_eval = obj.evaluated_get(depsgraph)
         me = obj_eval.to_mesh()
-        check_vertcount(me, numverts)
-        me.transform(mat_flip @ obj.matrix_world)
 
         # Write the vertex data
-        f.write(pack(">%df" % (numverts * 3), *[axis for v in me.vertices for axis in v.co]))
+        write_frame(me, frame_index)
 
         obj_eval.to_mesh_clear()
 
+    if frames is not None:
+        frames.flush()
+        del frames
     f.close()
 
     print('MDD Exported: %r frames:%d\n' % (filepath, numframes - 1))
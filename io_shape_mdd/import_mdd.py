@@ -31,9 +31,133 @@
 # Please send any fixes,updates,bugs to Slow67_at_Gmail.com
 # Bill Niewuendorp
 
+import os
 import bpy
+import numpy as np
+from bpy.app.handlers import persistent
+from collections import OrderedDict
 from struct import unpack
 
+# Number of decoded frames kept in memory for each streamed cache file.
+CACHE_DECODED_FRAMES_MAX = 8
+
+# Name of the shape key frames are streamed into, and of the object property storing stream settings.
+STREAM_SHAPE_KEY_NAME = "MDD Stream"
+STREAM_PROP_NAME = "mdd_stream"
+
+
+class PointCache:
+    """
+    A memory-mapped vertex cache file (MDD, or PC2), frames being decoded on demand.
+    """
+    __slots__ = (
+        "filepath",
+        "mtime",
+        "frames",
+        "num_frames",
+        "num_points",
+        "decoded",
+    )
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+        self.mtime = os.path.getmtime(filepath)
+
+        with open(filepath, 'rb') as file:
+            header = file.read(32)
+        if header[:12] == b'POINTCACHE2\0':
+            # Little-endian, start frame and sample rate are not used (frame_start and frame_step are).
+            version, num_points, start, sampling, num_frames = unpack('<iiffi', header[12:32])
+            dtype, offset = '<f4', 32
+        else:
+            # Big-endian, frame times are not used either.
+            num_frames, num_points = unpack('>2i', header[:8])
+            dtype, offset = '>f4', 8 + num_frames * 4
+
+        self.num_frames = num_frames
+        self.num_points = num_points
+        if num_frames and num_points:
+            self.frames = np.memmap(filepath, dtype=dtype, mode='r', offset=offset,
+                                    shape=(num_frames, num_points, 3))
+        else:
+            self.frames = np.zeros((num_frames, num_points, 3), dtype=dtype)
+        self.decoded = OrderedDict()
+
+    def frame(self, index):
+        """
+        Return the (num_points, 3) coordinates of given frame, as native floats,
+        keeping the last CACHE_DECODED_FRAMES_MAX used frames decoded.
+        """
+        decoded = self.decoded
+        coords = decoded.get(index)
+        if coords is None:
+            coords = decoded[index] = self.frames[index].astype(np.float32)
+            if len(decoded) > CACHE_DECODED_FRAMES_MAX:
+                decoded.popitem(last=False)
+        else:
+            decoded.move_to_end(index)
+        return coords
+
+
+# Streamed cache files, by (absolute) path.
+_caches = {}
+
+
+def cache_get(filepath):
+    """
+    Return the (shared) PointCache of given file, re-opening it if it was modified.
+    """
+    cache = _caches.get(filepath)
+    if cache is None or cache.mtime != os.path.getmtime(filepath):
+        cache = _caches[filepath] = PointCache(filepath)
+    return cache
+
+
+def caches_clear():
+    """
+    Close all streamed cache files (they are re-opened when needed).
+    """
+    _caches.clear()
+
+
+def obj_stream_frame(obj, frame):
+    """
+    Set the stream shape key of given object to given (scene, possibly sub-) frame of its cache file,
+    linearly interpolated between cache frames.
+    """
+    settings = obj[STREAM_PROP_NAME]
+    shape_keys = obj.data.shape_keys
+    shapekey = shape_keys.key_blocks.get(STREAM_SHAPE_KEY_NAME) if shape_keys else None
+    filepath = bpy.path.abspath(settings["filepath"])
+    if shapekey is None or not os.path.exists(filepath):
+        return
+
+    cache = cache_get(filepath)
+    if not cache.num_frames or len(shapekey.data) != cache.num_points:
+        return
+
+    # Position in the cache, clamped to its first and last frames.
+    position = (frame - settings["frame_start"]) / settings["frame_step"]
+    position = min(max(position, 0.0), cache.num_frames - 1)
+    index = int(position)
+    factor = position - index
+
+    coords = cache.frame(index)
+    if factor > 0.0:
+        coords = coords + (cache.frame(index + 1) - coords) * factor
+
+    shapekey.data.foreach_set("co", coords.ravel())
+    obj.data.update()
+
+
+@persistent
+def frame_change_handler(scene, *args):
+    frame = scene.frame_current + scene.frame_subframe
+    for obj in scene.objects:
+        if obj.type == 'MESH' and STREAM_PROP_NAME in obj:
+            obj_stream_frame(obj, frame)
+
+
 def set_linear_interpolation(obj, shapekey):
     anim_data = obj.data.shape_keys.animation_data
     data_path = "key_blocks[\"" + shapekey.name + "\"].value"
@@ -44,7 +168,7 @@ def set_linear_interpolation(obj, shapekey):
                 keyframe.interpolation = 'LINEAR'
 
 
-def obj_update_frame(file, scene, obj, start, fr, step):
+def obj_update_frame(cache, scene, obj, start, fr, step):
 
     # Insert new shape key
     new_shapekey = obj.shape_key_add()
@@ -55,9 +179,7 @@ def obj_update_frame(file, scene, obj, start, fr, step):
     obj.show_only_shape_key = True
 
     verts = new_shapekey.data
-
-    for v in verts:  # 12 is the size of 3 floats
-        v.co[:] = unpack('>3f', file.read(12))
+    verts.foreach_set("co", cache.frames[fr].astype(np.float32).ravel())
 
     # me.update()
     obj.show_only_shape_key = False
@@ -80,7 +202,7 @@ def obj_update_frame(file, scene, obj, start, fr, step):
     obj.data.update()
 
 
-def load(context, filepath, frame_start=0, frame_step=1):
+def load(context, filepath, frame_start=0, frame_step=1, use_streaming=False):
 
     scene = context.scene
     obj = context.object
@@ -90,9 +212,11 @@ def load(context, filepath, frame_start=0, frame_step=1):
     if bpy.ops.object.mode_set.poll():
         bpy.ops.object.mode_set(mode='OBJECT')
 
-    file = open(filepath, 'rb')
-    frames, points = unpack(">2i", file.read(8))
-    time = unpack((">%df" % frames), file.read(frames * 4))
+    if use_streaming:
+        cache = cache_get(bpy.path.abspath(filepath))
+    else:
+        cache = PointCache(filepath)
+    frames, points = cache.num_frames, cache.num_points
 
     print('\tpoints:%d frames:%d' % (points, frames))
     print('\tstart frame:%d step:%d' % (frame_start, frame_step))
@@ -103,7 +227,21 @@ def load(context, filepath, frame_start=0, frame_step=1):
         basis.name = "Basis"
         obj.data.update()
 
+    if use_streaming:
+        # A single shape key, updated from the (memory-mapped) file on frame change, see frame_change_handler.
+        shapekey = obj.data.shape_keys.key_blocks.get(STREAM_SHAPE_KEY_NAME)
+        if shapekey is None:
+            shapekey = obj.shape_key_add(name=STREAM_SHAPE_KEY_NAME, from_mix=False)
+        shapekey.value = 1.0
+        obj[STREAM_PROP_NAME] = {
+            "filepath": filepath,
+            "frame_start": frame_start,
+            "frame_step": frame_step,
+        }
+        obj_stream_frame(obj, scene.frame_current + scene.frame_subframe)
+        return {'FINISHED'}
+
     for i in range(frames):
-        obj_update_frame(file, scene, obj, frame_start, i, frame_step)
+        obj_update_frame(cache, scene, obj, frame_start, i, frame_step)
 
     return {'FINISHED'}